@@ -0,0 +1,58 @@
+"""unique (course_id, article_id) on contents
+
+Revision ID: a1f3c9d2e847
+Revises: c3d7a9e5f1b2
+Create Date: 2026-10-19 10:12:31.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f3c9d2e847'
+down_revision: Union[str, None] = 'c3d7a9e5f1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (콘텐츠 테이블, attachments의 외래 키 컬럼, attachments.source_type 값)
+CONTENT_TABLES = (
+    ('notices', 'notice_id', 'notices'),
+    ('materials', 'material_id', 'materials'),
+    ('assignments', 'assignment_id', 'assignments'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, fk_column, source_type in CONTENT_TABLES:
+        # 동시 동기화로 이미 생긴 중복 행 정리 (가장 먼저 저장된 행만 유지)
+        # 삭제할 행을 가리키는 첨부파일은 먼저 남길 행으로 옮김 (고아 행/외래 키 위반 방지)
+        survivors = (
+            f"(SELECT id, min(id) OVER (PARTITION BY course_id, article_id) AS keep_id "
+            f"FROM {table}) k"
+        )
+        op.execute(
+            f"UPDATE attachments a SET {fk_column} = k.keep_id FROM {survivors} "
+            f"WHERE a.{fk_column} = k.id AND k.id <> k.keep_id"
+        )
+        op.execute(
+            f"UPDATE attachments a SET source_id = k.keep_id::text FROM {survivors} "
+            f"WHERE a.source_type = '{source_type}' AND a.source_id = k.id::text AND k.id <> k.keep_id"
+        )
+        op.execute(
+            f"DELETE FROM {table} a USING {table} b "
+            f"WHERE a.course_id = b.course_id AND a.article_id = b.article_id AND a.id > b.id"
+        )
+        op.create_unique_constraint(
+            f'uq_{table}_course_id_article_id', table, ['course_id', 'article_id']
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _, _ in CONTENT_TABLES:
+        op.drop_constraint(f'uq_{table}_course_id_article_id', table, type_='unique')
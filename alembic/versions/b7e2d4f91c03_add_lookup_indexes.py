@@ -0,0 +1,59 @@
+"""add lookup indexes
+
+Revision ID: b7e2d4f91c03
+Revises: a1f3c9d2e847
+Create Date: 2026-10-19 11:03:47.215604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4f91c03'
+down_revision: Union[str, None] = 'a1f3c9d2e847'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스 이름, 테이블, 컬럼/식)
+# (course_id, article_id)는 uq_*_course_id_article_id 제약조건이,
+# user_courses(user_id)는 기본키 (user_id, course_id)가 이미 인덱스로 처리합니다.
+INDEXES = [
+    ('ix_notices_course_id_date_id', 'notices',
+     ['course_id', sa.text("coalesce(date, '')"), 'id']),
+    ('ix_materials_course_id_date_id', 'materials',
+     ['course_id', sa.text("coalesce(date, '')"), 'id']),
+    ('ix_assignments_course_id_due_date_id', 'assignments',
+     ['course_id', sa.text("coalesce(due_date, '')"), 'id']),
+    ('ix_attachments_source_type_source_id', 'attachments', ['source_type', 'source_id']),
+    ('ix_attachments_course_id_created_at', 'attachments', ['course_id', 'created_at']),
+    ('ix_attachments_notice_id', 'attachments', ['notice_id']),
+    ('ix_attachments_material_id', 'attachments', ['material_id']),
+    ('ix_attachments_assignment_id', 'attachments', ['assignment_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행해야 함)
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
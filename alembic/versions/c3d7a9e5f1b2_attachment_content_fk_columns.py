@@ -0,0 +1,53 @@
+"""attachment content fk columns
+
+Revision ID: c3d7a9e5f1b2
+Revises: 7c567d9373f8
+Create Date: 2026-10-19 09:58:06.731245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d7a9e5f1b2'
+down_revision: Union[str, None] = '7c567d9373f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (컬럼, 참조 테이블, source_type 값)
+# 모델(Attachment.notice_id 등)과 관계(Notice.attachments 등)는 이 컬럼을 쓰지만
+# 이전 마이그레이션에서는 만들지 않았습니다.
+FK_COLUMNS = [
+    ('notice_id', 'notices', 'notices'),
+    ('material_id', 'materials', 'materials'),
+    ('assignment_id', 'assignments', 'assignments'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Supabase 대시보드 등에서 이미 컬럼을 추가한 DB도 있으므로 없는 컬럼만 추가
+    existing = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('attachments')}
+    for column, table, source_type in FK_COLUMNS:
+        if column in existing:
+            continue
+        op.add_column('attachments', sa.Column(column, sa.Integer(), nullable=True))
+        op.create_foreign_key(
+            f'attachments_{column}_fkey', 'attachments', table, [column], ['id']
+        )
+        # 기존 행은 source_type/source_id가 가리키는 행이 있을 때만 채움
+        op.execute(
+            f"UPDATE attachments a SET {column} = t.id FROM {table} t "
+            f"WHERE a.source_type = '{source_type}' AND a.source_id = t.id::text"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 컬럼을 지우면 외래 키 제약조건도 함께 삭제됨
+    for column, _, _ in reversed(FK_COLUMNS):
+        op.drop_column('attachments', column)
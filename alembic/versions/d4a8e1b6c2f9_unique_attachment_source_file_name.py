@@ -0,0 +1,36 @@
+"""unique (source_type, source_id, file_name) on attachments
+
+Revision ID: d4a8e1b6c2f9
+Revises: b7e2d4f91c03
+Create Date: 2026-10-19 14:05:12.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8e1b6c2f9'
+down_revision: Union[str, None] = 'b7e2d4f91c03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 동시 동기화로 이미 생긴 중복 첨부파일 행 정리 (가장 먼저 저장된 행만 유지)
+    op.execute(
+        "DELETE FROM attachments a USING attachments b "
+        "WHERE a.source_type = b.source_type AND a.source_id = b.source_id "
+        "AND a.file_name = b.file_name AND a.id > b.id"
+    )
+    op.create_unique_constraint(
+        'uq_attachments_source_file_name', 'attachments', ['source_type', 'source_id', 'file_name']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_attachments_source_file_name', 'attachments', type_='unique')
@@ -0,0 +1,31 @@
+"""content hash columns on syllabus and user_courses
+
+Revision ID: e5b9f2c7a3d1
+Revises: d4a8e1b6c2f9
+Create Date: 2026-10-19 15:21:47.902316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9f2c7a3d1'
+down_revision: Union[str, None] = 'd4a8e1b6c2f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 해시가 없으므로 다음 동기화에서 한 번 다시 저장됨
+    op.add_column('syllabus', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('user_courses', sa.Column('list_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_courses', 'list_hash')
+    op.drop_column('syllabus', 'content_hash')
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
-from app.api.endpoints import auth, courses, notices, materials, assignments, attachments, crawl, syllabus
+from app.api.endpoints import auth, courses, notices, materials, assignments, attachments, crawl, syllabus, debug
+from app.core.config import settings
 from datetime import datetime
 
 api_router = APIRouter()
@@ -31,4 +32,8 @@ api_router.include_router(crawl.router, prefix="/crawl", tags=["크롤링"])
 api_router.include_router(attachments.router, prefix="/attachments", tags=["첨부파일"])
 
 # 강의계획서 관련 엔드포인트
-api_router.include_router(syllabus.router, prefix="/courses/{course_id}/syllabus", tags=["강의계획서"])
\ No newline at end of file
+api_router.include_router(syllabus.router, prefix="/courses/{course_id}/syllabus", tags=["강의계획서"])
+
+# 진단 엔드포인트 (관리자 전용, PROFILING_ENABLED일 때만 등록)
+if settings.PROFILING_ENABLED:
+    api_router.include_router(debug.router, prefix="/debug", tags=["진단"])
@@ -0,0 +1,75 @@
+"""
+조건부 GET (ETag / If-None-Match)
+
+목록 엔드포인트는 행을 읽기 전에 집계 쿼리 한 번으로 목록 버전(항목 수, 최종 수정 시각 등)을 구하고,
+사용자/강의/콘텐츠 종류/쿼리 파라미터와 함께 해시해 약한 ETag를 만듭니다.
+클라이언트가 보낸 If-None-Match와 같으면 목록 조회와 직렬화 없이 304를 돌려주므로
+크롤링 사이의 폴링 비용이 집계 쿼리 하나로 줄어듭니다.
+"""
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+
+# 응답 형식이 바뀌면 올려서 이전 ETag를 모두 무효화
+ETAG_FORMAT_VERSION = 1
+
+# 인증된 사용자별 응답이므로 공유 캐시에는 저장하지 않고, 매번 재검증(If-None-Match)하게 함
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """parts를 해시한 약한 ETag (W/"...")"""
+    raw = json.dumps([ETAG_FORMAT_VERSION, *parts], default=str, ensure_ascii=False, separators=(",", ":"))
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 값이 etag와 일치하는지 여부 (약한 비교, '*'는 항상 일치)"""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
+
+
+async def check_not_modified(
+        request: Request,
+        response: Response,
+        key: Sequence[Any],
+        get_version: Callable[[], Awaitable[Any]]
+) -> Optional[Response]:
+    """
+    목록 버전으로 ETag를 계산해 If-None-Match와 비교
+
+    Args:
+        request: 요청 (If-None-Match 헤더)
+        response: 엔드포인트에 주입된 Response (일치하지 않으면 ETag/Cache-Control 헤더를 설정)
+        key: 응답을 구분하는 값 (콘텐츠 종류, 사용자 ID, 강의 ID, 쿼리 파라미터 등)
+        get_version: 목록 버전을 돌려주는 코루틴 함수 (None이면 ETag를 쓰지 않음)
+
+    Returns:
+        Optional[Response]: 일치하면 304 응답, 아니면 None (엔드포인트가 평소대로 응답)
+    """
+    if not settings.ETAG_ENABLED:
+        return None
+
+    version = await get_version()
+    if version is None:
+        return None
+
+    etag = make_etag(*key, version)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
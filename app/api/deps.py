@@ -21,8 +21,11 @@ from app.services.parsers import (
     NoticeParser,
     MaterialParser,
     AssignmentParser,
-    SyllabusParser
+    SyllabusParser,
+    ParserExecutor,
+    ParseCache
 )
+from app.core.config import settings
 from app.core.supabase_client import get_supabase_client
 from app.db.repositories.course_repository import CourseRepository
 from app.db.repositories.notice_repository import NoticeRepository
@@ -44,6 +47,8 @@ _material_service = None
 _assignment_service = None
 _syllabus_service = None
 _crawl_service = None
+_parser_executor = None
+_parse_cache = None
 
 # 세션 서비스 의존성
 def get_auth_session_service() -> AuthSessionService:
@@ -65,25 +70,45 @@ def get_auth_service() -> AuthService:
     return AuthService(get_supabase_client())
 
 # 파서 의존성
+def get_parser_executor() -> ParserExecutor:
+    """ParserExecutor 제공 (싱글톤)"""
+    global _parser_executor
+    if not _parser_executor:
+        _parser_executor = ParserExecutor(
+            mode=settings.PARSER_EXECUTOR,
+            max_workers=settings.PARSER_MAX_WORKERS
+        )
+    return _parser_executor
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """ParseCache 제공 (싱글톤, PARSE_CACHE_SIZE가 0이고 PARSE_CACHE_DIR이 없으면 None)"""
+    global _parse_cache
+    if not _parse_cache and (settings.PARSE_CACHE_SIZE > 0 or settings.PARSE_CACHE_DIR):
+        _parse_cache = ParseCache(
+            max_entries=settings.PARSE_CACHE_SIZE,
+            disk_dir=settings.PARSE_CACHE_DIR
+        )
+    return _parse_cache
+
 def get_course_parser() -> CourseParser:
     """CourseParser 제공"""
-    return CourseParser()
+    return CourseParser(backend=settings.HTML_PARSER_BACKEND, base_url=settings.ECLASS_BASE_URL)
 
 def get_notice_parser() -> NoticeParser:
     """NoticeParser 제공"""
-    return NoticeParser()
+    return NoticeParser(backend=settings.HTML_PARSER_BACKEND, base_url=settings.ECLASS_BASE_URL)
 
 def get_material_parser() -> MaterialParser:
     """MaterialParser 제공"""
-    return MaterialParser()
+    return MaterialParser(backend=settings.HTML_PARSER_BACKEND, base_url=settings.ECLASS_BASE_URL)
 
 def get_assignment_parser() -> AssignmentParser:
     """AssignmentParser 제공"""
-    return AssignmentParser()
+    return AssignmentParser(backend=settings.HTML_PARSER_BACKEND, base_url=settings.ECLASS_BASE_URL)
 
 def get_syllabus_parser() -> SyllabusParser:
     """SyllabusParser 제공"""
-    return SyllabusParser()
+    return SyllabusParser(backend=settings.HTML_PARSER_BACKEND)
 
 # 리포지토리 의존성
 def get_course_repository() -> CourseRepository:
@@ -122,7 +147,9 @@ def get_storage_service() -> StorageService:
 def get_course_service(
     eclass_session_manager: EclassSessionManager = Depends(get_eclass_session_manager),
     course_parser: CourseParser = Depends(get_course_parser),
-    course_repository: CourseRepository = Depends(get_course_repository)
+    course_repository: CourseRepository = Depends(get_course_repository),
+    parser_executor: ParserExecutor = Depends(get_parser_executor),
+    parse_cache: Optional[ParseCache] = Depends(get_parse_cache)
 ) -> CourseService:
     """CourseService 제공 (싱글톤)"""
     global _course_service
@@ -130,7 +157,9 @@ def get_course_service(
         _course_service = CourseService(
             session_service=eclass_session_manager,
             course_parser=course_parser,
-            course_repository=course_repository
+            course_repository=course_repository,
+            parser_executor=parser_executor,
+            parse_cache=parse_cache
         )
     return _course_service
 
@@ -139,7 +168,9 @@ def get_notice_service(
     notice_parser: NoticeParser = Depends(get_notice_parser),
     notice_repository: NoticeRepository = Depends(get_notice_repository),
     attachment_repository: AttachmentRepository = Depends(get_attachment_repository),
-    storage_service: StorageService = Depends(get_storage_service)
+    storage_service: StorageService = Depends(get_storage_service),
+    parser_executor: ParserExecutor = Depends(get_parser_executor),
+    parse_cache: Optional[ParseCache] = Depends(get_parse_cache)
 ) -> NoticeService:
     """NoticeService 제공 (싱글톤)"""
     global _notice_service
@@ -149,7 +180,9 @@ def get_notice_service(
             notice_parser=notice_parser,
             notice_repository=notice_repository,
             attachment_repository=attachment_repository,
-            storage_service=storage_service
+            storage_service=storage_service,
+            parser_executor=parser_executor,
+            parse_cache=parse_cache
         )
     return _notice_service
 
@@ -159,7 +192,9 @@ def get_material_service(
     material_repository: MaterialRepository = Depends(get_material_repository),
     attachment_repository: AttachmentRepository = Depends(get_attachment_repository),
     storage_service: StorageService = Depends(get_storage_service),
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: AuthService = Depends(get_auth_service),
+    parser_executor: ParserExecutor = Depends(get_parser_executor),
+    parse_cache: Optional[ParseCache] = Depends(get_parse_cache)
 ) -> MaterialService:
     """MaterialService 제공 (싱글톤)"""
     global _material_service
@@ -170,7 +205,9 @@ def get_material_service(
             material_repository=material_repository,
             attachment_repository=attachment_repository,
             storage_service=storage_service,
-            auth_service=auth_service
+            auth_service=auth_service,
+            parser_executor=parser_executor,
+            parse_cache=parse_cache
         )
     return _material_service
 
@@ -179,7 +216,9 @@ def get_assignment_service(
     assignment_parser: AssignmentParser = Depends(get_assignment_parser),
     assignment_repository: AssignmentRepository = Depends(get_assignment_repository),
     attachment_repository: AttachmentRepository = Depends(get_attachment_repository),
-    storage_service: StorageService = Depends(get_storage_service)
+    storage_service: StorageService = Depends(get_storage_service),
+    parser_executor: ParserExecutor = Depends(get_parser_executor),
+    parse_cache: Optional[ParseCache] = Depends(get_parse_cache)
 ) -> AssignmentService:
     """AssignmentService 제공 (싱글톤)"""
     global _assignment_service
@@ -189,6 +228,8 @@ def get_assignment_service(
             assignment_parser=assignment_parser,
             assignment_repository=assignment_repository,
             attachment_repository=attachment_repository,
+            parser_executor=parser_executor,
+            parse_cache=parse_cache
         )
     return _assignment_service
 
@@ -196,7 +237,9 @@ def get_syllabus_service(
     eclass_session_manager: EclassSessionManager = Depends(get_eclass_session_manager),
     syllabus_parser: SyllabusParser = Depends(get_syllabus_parser),
     syllabus_repository: SyllabusRepository = Depends(get_syllabus_repository),
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: AuthService = Depends(get_auth_service),
+    parser_executor: ParserExecutor = Depends(get_parser_executor),
+    parse_cache: Optional[ParseCache] = Depends(get_parse_cache)
 ) -> SyllabusService:
     """SyllabusService 제공 (싱글톤)"""
     global _syllabus_service
@@ -205,7 +248,9 @@ def get_syllabus_service(
             eclass_session=eclass_session_manager,
             syllabus_parser=syllabus_parser,
             syllabus_repository=syllabus_repository,
-            auth_service=auth_service
+            auth_service=auth_service,
+            parser_executor=parser_executor,
+            parse_cache=parse_cache
         )
     return _syllabus_service
 
@@ -249,6 +294,16 @@ async def get_current_user(
         )
     return user_info
 
+# 관리자 인증 의존성
+async def get_admin_user(current_user: dict = Depends(get_current_user)):
+    """현재 사용자가 관리자(ADMIN_USER_IDS)인지 확인"""
+    if current_user["id"] not in settings.get_admin_user_ids():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 사용할 수 있습니다."
+        )
+    return current_user
+
 # 데이터베이스 세션 의존성
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """데이터베이스 세션 제공"""
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, BackgroundTasks
 from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.course import Course, CourseList
+from app.api.conditional import check_not_modified
 from app.api.deps import (
     get_current_user,
     get_db_session,
@@ -22,6 +23,8 @@ router = APIRouter()
 
 @router.get("/", response_model=CourseList)
 async def get_courses(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
     current_user: dict = Depends(get_current_user),
     skip: int = 0,
@@ -29,6 +32,15 @@ async def get_courses(
     course_service: CourseService = Depends(get_course_service)
 ) -> Any:
     """모든 강의 목록 조회"""
+    # 저장된 강의 목록이 바뀌지 않았으면 행을 읽지 않고 304 응답
+    not_modified = await check_not_modified(
+        request, response,
+        ("courses", current_user["id"]),
+        lambda: course_service.get_courses_version(current_user["id"], db)
+    )
+    if not_modified is not None:
+        return not_modified
+
     courses = await course_service.get_courses(current_user["id"], db)
     return {
         "courses": courses,
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps import get_admin_user
+from app.core.config import settings
+from app.core.profiling import (
+    ProfilerBusyError,
+    SamplingProfiler,
+    dump_asyncio_tasks,
+    dump_threads,
+)
+
+router = APIRouter()
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/profile")
+async def profile(
+        seconds: float = Query(10, gt=0, description="프로파일 수집 시간(초)"),
+        interval_ms: float = Query(5, ge=1, le=1000, description="샘플링 간격(ms)"),
+        format: str = Query("collapsed", pattern="^(collapsed|top)$", description="collapsed: folded 스택, top: 함수별 상위 목록"),
+        thread: Optional[str] = Query(None, description="top 형식에서 특정 스레드만 집계 (예: MainThread)"),
+        admin: dict = Depends(get_admin_user)
+) -> Any:
+    """
+    실행 중인 프로세스의 샘플링 프로파일 수집
+
+    collapsed 형식은 flamegraph.pl 또는 speedscope(https://www.speedscope.app)에 그대로 넣으면 플레임 그래프로 볼 수 있습니다.
+    """
+    if seconds > settings.PROFILING_MAX_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"프로파일 시간은 최대 {settings.PROFILING_MAX_SECONDS}초입니다."
+        )
+
+    logger.info(f"프로파일 시작: {seconds}초, 간격 {interval_ms}ms (요청자: {admin['id']})")
+    profiler = SamplingProfiler(interval=interval_ms / 1000)
+    try:
+        profiler.start()
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    try:
+        # 수집하는 동안에도 이벤트 루프는 다른 요청과 크롤링 작업을 계속 처리
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.stop()
+
+    if format == "top":
+        return profiler.top(thread=thread)
+    return PlainTextResponse(profiler.collapsed())
+
+
+@router.get("/tasks")
+async def tasks(
+        include_threads: bool = Query(True, description="스레드 스택 포함 여부"),
+        admin: dict = Depends(get_admin_user)
+) -> Any:
+    """asyncio 태스크별 await 체인과 스레드 스택 덤프"""
+    task_list = dump_asyncio_tasks()
+    result = {"count": len(task_list), "tasks": task_list}
+    if include_threads:
+        result["threads"] = dump_threads()
+    return result
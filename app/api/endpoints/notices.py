@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from typing import Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.schemas.notice import Notice, NoticeList
+from app.schemas.notice import Notice, NoticeList, NoticeSummary
+from app.api.conditional import check_not_modified
+from app.api.projection import projected_response, select_fields
+from app.api.responses import model_response
 from app.api.deps import (
     get_current_user,
     get_db_session,
@@ -19,8 +22,12 @@ router = APIRouter()
 @router.get("/", response_model=NoticeList)
 async def get_notices(
     course_id: str,
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=100),
+    view: str = Query("full", pattern="^(full|summary)$", description="summary: 본문과 첨부파일을 제외한 요약"),
+    fields: Optional[str] = Query(None, description="응답할 필드 (쉼표로 구분, 예: title,date,author). view보다 우선"),
     db: AsyncSession = Depends(get_db_session),
     current_user: dict = Depends(get_current_user),
     course_service: CourseService = Depends(get_course_service),
@@ -35,15 +42,41 @@ async def get_notices(
             detail="강의를 찾을 수 없습니다."
         )
 
-    notices = await notice_service.get_all(db, course_id, skip=skip, limit=limit)
-    total = len(notices)
+    # 응답할 필드 (None이면 전체, 지정하면 해당 컬럼만 조회)
+    try:
+        selected = select_fields(Notice, NoticeSummary, view, fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
-    return {
-        "notices": notices,
-        "total": total,
-        "skip": skip,
-        "limit": limit
+    # 목록이 바뀌지 않았으면 행을 읽지 않고 304 응답
+    not_modified = await check_not_modified(
+        request, response,
+        ("notices", current_user["id"], course_id, limit, cursor, sorted(selected) if selected else None),
+        lambda: notice_service.get_list_version(db, course_id)
+    )
+    if not_modified is not None:
+        return not_modified
+
+    try:
+        page = await notice_service.get_page(db, course_id, limit=limit, cursor=cursor, fields=selected)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    content = {
+        "notices": page["items"],
+        "total": page["total"],
+        "limit": limit,
+        "next_cursor": page["next_cursor"]
     }
+    if selected is not None:
+        return projected_response(NoticeList, "notices", Notice, selected, content, response=response)
+    return model_response(NoticeList, content, response=response)
 
 @router.get("/refresh", response_model=dict)
 async def refresh_notices(
@@ -0,0 +1,95 @@
+"""
+목록 응답 필드 선택 (view=summary / fields=)
+
+목록 화면은 제목/작성자/날짜 정도만 보여 주지만 기본 응답은 행마다 본문(content)과 첨부파일을 모두 담습니다.
+
+- view=summary: 스키마의 <항목>Summary 필드만 (본문과 첨부파일 제외)
+- fields=title,date,...: 지정한 필드만 (id는 항상 포함, 'attachments'를 넣으면 첨부파일 포함, view보다 우선)
+
+선택한 필드는 리포지토리까지 전달되어 해당 컬럼만 SELECT하고(load_only) 첨부파일도 필요할 때만 조회합니다.
+응답은 선택한 필드만 가진 모델로 검증/직렬화하므로 읽지 않은 컬럼에 접근하지 않습니다.
+"""
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+from app.api.responses import json_response
+
+
+def select_fields(
+        item_model: Type[BaseModel],
+        summary_model: Type[BaseModel],
+        view: str,
+        fields: Optional[str]
+) -> Optional[FrozenSet[str]]:
+    """
+    view/fields 쿼리 파라미터를 응답할 필드 집합으로 변환
+
+    Returns:
+        Optional[FrozenSet[str]]: 응답할 필드 이름 (None이면 전체 필드)
+
+    Raises:
+        ValueError: item_model에 없는 필드를 요청한 경우
+    """
+    if fields:
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - set(item_model.model_fields)
+        if unknown:
+            raise ValueError(
+                f"알 수 없는 필드입니다: {', '.join(sorted(unknown))} "
+                f"(사용 가능: {', '.join(item_model.model_fields)})"
+            )
+        return frozenset(requested | {"id"})
+    if view == "summary":
+        return frozenset(summary_model.model_fields)
+    return None
+
+
+@lru_cache(maxsize=256)
+def projected_list_adapter(
+        list_model: Type[BaseModel],
+        items_key: str,
+        item_model: Type[BaseModel],
+        fields: FrozenSet[str]
+) -> TypeAdapter:
+    """
+    목록 모델의 항목 필드를 fields만 가진 모델로 바꾼 TypeAdapter
+    (필드 조합별로 모델 생성 비용이 크므로 캐시, 조합 수가 많아도 maxsize까지만 보관)
+    """
+    item_fields = {
+        name: (info.annotation, info)
+        for name, info in item_model.model_fields.items()
+        if name in fields
+    }
+    projected_item = create_model(
+        f"{item_model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **item_fields
+    )
+
+    list_fields = {
+        name: (List[projected_item], ...) if name == items_key else (info.annotation, info)
+        for name, info in list_model.model_fields.items()
+    }
+    return TypeAdapter(create_model(f"{list_model.__name__}Fields", **list_fields))
+
+
+def projected_response(
+        list_model: Type[BaseModel],
+        items_key: str,
+        item_model: Type[BaseModel],
+        fields: FrozenSet[str],
+        content: Any,
+        response: Optional[Response] = None
+) -> Response:
+    """
+    선택한 필드만 담은 목록 응답
+
+    FAST_JSON_RESPONSES 설정과 관계없이 바로 직렬화합니다 (response_model로 검증하면
+    SELECT하지 않은 컬럼에 접근하게 되므로).
+    """
+    adapter = projected_list_adapter(list_model, items_key, item_model, fields)
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    return json_response(body, response=response)
@@ -0,0 +1,50 @@
+"""
+빠른 JSON 응답 직렬화
+
+FastAPI 기본 경로는 response_model 검증 → 파이썬 dict 변환(jsonable_encoder) → json.dumps 순서로
+응답 하나를 세 번 훑습니다. FAST_JSON_RESPONSES를 켜면 모델별로 캐시한 TypeAdapter로
+ORM 객체를 한 번 검증한 뒤 pydantic-core가 바로 JSON 바이트로 직렬화합니다.
+응답 본문은 기본 경로와 같습니다 (scripts/benchmarks/serialization_bench.py에서 비교).
+"""
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model: Any) -> TypeAdapter:
+    """모델(타입)별 TypeAdapter (스키마 생성 비용이 커서 한 번만 만듦)"""
+    return TypeAdapter(model)
+
+
+def render_json(model: Any, content: Any) -> bytes:
+    """content를 model로 검증(ORM 객체는 속성으로 읽음)한 뒤 JSON 바이트로 직렬화"""
+    adapter = get_type_adapter(model)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def model_response(model: Any, content: Any, status_code: int = 200, response: Optional[Response] = None) -> Any:
+    """
+    response_model이 지정된 엔드포인트의 반환값
+
+    FAST_JSON_RESPONSES가 꺼져 있으면 content를 그대로 돌려줘 FastAPI 기본 직렬화를 쓰고,
+    켜져 있으면 미리 직렬화한 Response를 돌려줍니다 (FastAPI는 Response를 다시 검증하지 않음).
+    response에 엔드포인트에 주입된 Response를 주면 거기에 설정한 헤더(ETag 등)를 빠른 경로 응답에도 복사합니다.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return content
+    return json_response(render_json(model, content), status_code=status_code, response=response)
+
+
+def json_response(body: bytes, status_code: int = 200, response: Optional[Response] = None) -> Response:
+    """직렬화된 JSON 바이트로 Response 생성 (response에 설정한 헤더도 복사)"""
+    json_body = Response(body, status_code=status_code, media_type="application/json")
+    if response is not None:
+        json_body.raw_headers.extend(
+            (name, value) for name, value in response.raw_headers if name != b"content-length"
+        )
+    return json_body
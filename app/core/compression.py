@@ -0,0 +1,240 @@
+"""
+HTTP 응답 압축
+
+공지사항/강의자료/과제 목록은 본문(content)을 그대로 담고 있어 응답이 크지만 텍스트라 잘 줄어듭니다.
+CompressionMiddleware는 Accept-Encoding(q 값 포함)을 보고 brotli 또는 gzip으로 응답을 압축합니다.
+
+- COMPRESSION_MIN_SIZE보다 작은 응답은 압축하지 않음 (헤더/CPU 비용이 절약보다 큼)
+- 이미 Content-Encoding이 있는 응답, 이미 압축된 형식(이미지, PDF, ZIP 등),
+  첨부파일 다운로드(Content-Disposition: attachment), Cache-Control: no-transform 응답은 그대로 전달
+- 한 번에 오는 응답은 통째로 압축해 Content-Length를 다시 계산하고,
+  스트리밍 응답은 청크마다 압축해 내보냄 (Content-Length 제거)
+- offload_size 이상인 본문은 스레드 풀에서 압축 (수백 KB 압축은 수 ms가 걸려 이벤트 루프를 막음)
+- brotli 패키지가 없으면 gzip만 사용
+"""
+import gzip
+import zlib
+from typing import Dict, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# 다시 압축해도 거의 줄지 않는 Content-Type (접두사 비교)
+INCOMPRESSIBLE_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/vnd.rar",
+    "application/octet-stream",
+    "application/vnd.openxmlformats-officedocument",  # docx, pptx, xlsx (ZIP 컨테이너)
+    "text/event-stream",  # 이벤트를 버퍼링 없이 바로 보내야 함
+)
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q 값} dict로 변환 (q 값이 잘못되면 0으로 취급)"""
+    result = {}
+    for item in value.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, param_value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+        result[coding] = quality
+    return result
+
+
+def select_encoding(accept_encoding: str, brotli_enabled: bool = True) -> Optional[str]:
+    """클라이언트가 받을 수 있는 인코딩 중 'br' 또는 'gzip'을 선택 (q 값이 같으면 br 우선)"""
+    accepted = parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli_enabled and BROTLI_AVAILABLE else ["gzip"]
+
+    best, best_quality = None, 0.0
+    for coding in candidates:
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(headers: Headers) -> bool:
+    """응답 헤더로 보아 압축 대상인지 여부"""
+    if "content-encoding" in headers:
+        return False
+    if "no-transform" in headers.get("cache-control", "").lower():
+        return False
+    if headers.get("content-disposition", "").lower().startswith("attachment"):
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return not content_type.startswith(INCOMPRESSIBLE_TYPES)
+
+
+class _Compressor:
+    """gzip/brotli 스트리밍 압축기 공통 인터페이스"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=brotli_quality)
+        else:
+            # wbits=31: gzip 헤더/트레일러 포함
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.flush()
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish() if self.encoding == "br" else self._compressor.flush()
+
+
+def compress_body(body: bytes, encoding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    """본문 전체를 한 번에 압축"""
+    if encoding == "br":
+        return brotli.compress(body, mode=brotli.MODE_TEXT, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding에 따라 응답을 brotli/gzip으로 압축하는 ASGI 미들웨어
+
+    Args:
+        app: ASGI 애플리케이션
+        minimum_size: 이보다 작은 응답은 압축하지 않음 (바이트)
+        gzip_level: gzip 압축 레벨 (1~9)
+        brotli_quality: brotli 압축 품질 (0~11, 동적 응답에는 4~5가 속도 대비 효율이 좋음)
+        brotli_enabled: False면 brotli가 설치되어 있어도 gzip만 사용
+        offload_size: 이보다 큰 본문은 스레드 풀에서 압축 (바이트)
+    """
+
+    def __init__(
+            self,
+            app,
+            minimum_size: int = 1024,
+            gzip_level: int = 6,
+            brotli_quality: int = 4,
+            brotli_enabled: bool = True,
+            offload_size: int = 256 * 1024
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.brotli_enabled = brotli_enabled
+        self.offload_size = offload_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""), self.brotli_enabled)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 시작 메시지를 첫 본문 청크가 올 때까지 보류했다가 압축 여부를 결정"""
+
+    def __init__(self, middleware: CompressionMiddleware, send, encoding: str):
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.start_message = None
+        self.decided = False
+        self.compressor: Optional[_Compressor] = None
+
+    async def send(self, message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+        if self.decided:
+            await self._send_body(message)
+            return
+        if message_type != "http.response.body":
+            # 본문 없이 끝나는 확장 메시지(http.response.pathsend 등)는 압축하지 않고 그대로 전달
+            self.decided = True
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        self.decided = True
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+
+        if not is_compressible(headers) or (not more_body and len(body) < self.middleware.minimum_size):
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        self._set_encoding_headers(headers)
+        if not more_body:
+            compressed = await self._compress(body)
+            headers["Content-Length"] = str(len(compressed))
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # 스트리밍 응답: 전체 길이를 알 수 없으므로 Content-Length를 빼고 청크마다 압축
+        del headers["Content-Length"]
+        self.compressor = _Compressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        await self._send(self.start_message)
+        await self._send_body(message)
+
+    async def _compress(self, body: bytes) -> bytes:
+        args = (body, self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        if len(body) >= self.middleware.offload_size:
+            return await anyio.to_thread.run_sync(compress_body, *args)
+        return compress_body(*args)
+
+    async def _send_body(self, message) -> None:
+        if self.compressor is None or message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        more_body = message.get("more_body", False)
+        chunk = self.compressor.compress(message.get("body", b""))
+        chunk += self.compressor.flush() if more_body else self.compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _set_encoding_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # 압축하면 바이트가 달라지므로 강한 ETag는 약한 ETag로 바꿈
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
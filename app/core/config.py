@@ -20,6 +20,9 @@ class Settings(BaseSettings):
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    DB_QUERY_STATS_ENABLED: bool = True  # 요청/크롤링 작업별 쿼리 통계, 느린 쿼리 로그, N+1 감지
+    DB_SLOW_QUERY_MS: int = 200  # 이 시간 이상 걸린 쿼리는 경고 로그 (파라미터 값은 가림)
+    DB_N_PLUS_ONE_THRESHOLD: int = 20  # 한 요청/작업에서 같은 형태의 쿼리가 이 횟수를 넘으면 N+1 경고
 
     # Supabase 설정
     SUPABASE_URL: str
@@ -39,9 +42,46 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE: int = 104857600  # 100MB
     ALLOWED_FILE_TYPES: str = ".pdf,.doc,.docx,.ppt,.pptx,.xls,.xlsx,.zip,.rar,.7z,.txt,.jpg,.jpeg,.png,.gif"
 
+    # 파서 설정
+    HTML_PARSER_BACKEND: str = "html.parser"  # 'html.parser' 또는 'lxml'
+    PARSER_EXECUTOR: str = "none"  # 'none', 'thread', 'process'
+    PARSER_MAX_WORKERS: Optional[int] = None  # None이면 CPU 수에 맞춤
+    PARSE_CACHE_SIZE: int = 512  # 메모리에 보관할 파싱 결과 수 (0이면 캐시 사용 안 함)
+    PARSE_CACHE_DIR: Optional[str] = None  # 지정하면 파싱 결과를 디스크에도 보관
+
+    # 응답 설정
+    FAST_JSON_RESPONSES: bool = False  # 목록 응답을 캐시한 TypeAdapter로 바로 JSON 직렬화
+    ETAG_ENABLED: bool = True  # 목록 응답에 약한 ETag를 붙이고 If-None-Match가 일치하면 304로 응답
+    COMPRESSION_ENABLED: bool = True  # Accept-Encoding에 따라 응답을 brotli/gzip으로 압축
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 응답은 압축하지 않음 (바이트)
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1(빠름) ~ 9(작음)
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0(빠름) ~ 11(작음), 동적 응답에는 4~5 권장
+    COMPRESSION_BROTLI_ENABLED: bool = True  # False면 brotli가 설치되어 있어도 gzip만 사용
+
+    # 메트릭 설정
+    METRICS_ENABLED: bool = True  # /metrics 엔드포인트와 HTTP 요청 메트릭 미들웨어 사용 여부
+
+    # 트레이싱 설정 (OpenTelemetry)
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: str = "otlp"  # 'otlp' 또는 'console'
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"  # OTLP/HTTP 수집기 주소
+    TRACING_SERVICE_NAME: str = "autolms"
+    TRACING_SAMPLE_RATIO: float = 1.0  # 0.0 ~ 1.0, 상위 스팬이 있으면 상위 샘플링 결정을 따름
+
+    # 진단 설정 (관리자 전용 /debug 엔드포인트)
+    PROFILING_ENABLED: bool = False  # 켜면 /debug/profile, /debug/tasks 엔드포인트 등록
+    PROFILING_MAX_SECONDS: int = 60  # 한 번에 수집할 수 있는 최대 프로파일 시간
+    ADMIN_USER_IDS: Union[str, List[str]] = []  # 관리자 Supabase 사용자 ID (쉼표로 구분)
+
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_JSON: bool = False  # True면 한 줄에 JSON 객체 하나씩 출력
+    LOG_FILE: Optional[str] = "app.log"  # 비우면 파일에 쓰지 않음
+    LOG_MODULE_LEVELS: str = "app.services=DEBUG"  # 모듈별 로그 레벨 ('모듈=레벨'을 쉼표로 구분)
+    LOG_DEBUG_SAMPLE_RATES: str = ""  # 모듈별 DEBUG 로그 샘플링 비율 (예: 'app.services=0.1,app.services.parsers=0.01')
+    LOG_MAX_MESSAGE_LENGTH: int = 2000  # 이보다 긴 메시지는 잘라서 기록 (0이면 제한 없음)
+    LOG_QUEUE_SIZE: int = 10000  # 로그 큐 크기 (가득 차면 요청을 막지 않고 레코드를 버림)
 
     # 자동화 설정
     MAX_CONCURRENT_TASKS: int = 5
@@ -61,6 +101,14 @@ class Settings(BaseSettings):
             return self.BACKEND_CORS_ORIGINS
         return []
 
+    def get_admin_user_ids(self) -> List[str]:
+        """관리자 사용자 ID를 리스트로 반환"""
+        if isinstance(self.ADMIN_USER_IDS, str) and self.ADMIN_USER_IDS:
+            return [user_id.strip() for user_id in self.ADMIN_USER_IDS.split(",") if user_id.strip()]
+        if isinstance(self.ADMIN_USER_IDS, list):
+            return self.ADMIN_USER_IDS
+        return []
+
 settings = Settings()
 
 # DATABASE_URL에서 SQLALCHEMY_DATABASE_URI를 자동으로 설정
@@ -0,0 +1,189 @@
+"""
+비동기 로깅 설정
+
+요청 처리 코드(이벤트 루프)에서는 QueueHandler가 레코드를 큐에 넣기만 하고,
+파일/콘솔 쓰기는 QueueListener의 백그라운드 스레드가 맡아 디스크 I/O가 요청 지연 시간에 더해지지 않게 합니다.
+
+- LOG_JSON: 한 줄에 JSON 객체 하나씩 출력 (로그 수집기용)
+- LOG_MODULE_LEVELS: 모듈별 로그 레벨 (예: "app.services=DEBUG,httpx=WARNING")
+- LOG_DEBUG_SAMPLE_RATES: 모듈별 DEBUG 로그 샘플링 비율 (예: "app.services=0.1,app.services.parsers=0.01")
+  가장 길게 일치하는 접두사의 비율을 쓰고, INFO 이상은 샘플링하지 않습니다.
+- LOG_MAX_MESSAGE_LENGTH: 큐에 넣기 전에 메시지를 이 길이로 자름 (HTML, 큰 dict 로그 대비)
+- LOG_QUEUE_SIZE: 큐가 가득 차면 요청 처리를 막지 않고 레코드를 버리고 개수만 셉니다.
+"""
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+# LogRecord 기본 속성 (이 밖의 속성은 extra로 넘긴 값이므로 JSON에 포함)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["NonBlockingQueueHandler"] = None
+
+
+def parse_module_settings(value: str) -> Dict[str, str]:
+    """'모듈=값,모듈=값' 형식의 설정을 dict로 변환"""
+    result = {}
+    for item in (value or "").split(","):
+        if "=" in item:
+            name, setting = item.split("=", 1)
+            result[name.strip()] = setting.strip()
+    return result
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드를 한 줄 JSON으로 출력"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """모듈별 비율로 DEBUG 이하 레코드를 샘플링"""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        # 긴 접두사부터 비교해 가장 구체적인 설정을 적용
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self._cache: Dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._cache.get(name)
+        if rate is None:
+            rate = 1.0
+            for prefix, value in self.rates:
+                if name == prefix or name.startswith(prefix + "."):
+                    rate = value
+                    break
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or not self.rates:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버리는 QueueHandler (메시지 길이 제한 포함)"""
+
+    def __init__(self, log_queue: queue.Queue, max_message_length: int = 0):
+        super().__init__(log_queue)
+        self.max_message_length = max_message_length
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지 인자는 지금 합치고(나중에 값이 바뀔 수 있으므로), 예외는 메시지와 따로 텍스트로 보관
+        message = record.getMessage()
+        if self.max_message_length and len(message) > self.max_message_length:
+            message = f"{message[:self.max_message_length]}... ({len(message)}자 중 일부)"
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+
+        record = copy.copy(record)
+        record.msg = message
+        record.message = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _build_handlers() -> List[logging.Handler]:
+    formatter = JsonFormatter() if settings.LOG_JSON else logging.Formatter(settings.LOG_FORMAT)
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    if settings.LOG_FILE:
+        handlers.append(logging.FileHandler(settings.LOG_FILE, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def setup_logging() -> None:
+    """루트 로거를 큐 기반 비동기 로깅으로 설정 (여러 번 호출해도 한 번만 적용)"""
+    global _listener, _queue_handler
+
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    _queue_handler = NonBlockingQueueHandler(log_queue, settings.LOG_MAX_MESSAGE_LENGTH)
+
+    rates = {
+        name: float(rate)
+        for name, rate in parse_module_settings(settings.LOG_DEBUG_SAMPLE_RATES).items()
+    }
+    if rates:
+        _queue_handler.addFilter(DebugSamplingFilter(rates))
+
+    _listener = QueueListener(log_queue, *_build_handlers(), respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    for name, level in parse_module_settings(settings.LOG_MODULE_LEVELS).items():
+        logging.getLogger(name).setLevel(level.upper())
+
+
+def dropped_log_records() -> int:
+    """큐가 가득 차서 버린 로그 레코드 수"""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 쓰고 리스너 종료 (애플리케이션 종료 시 호출)"""
+    global _listener
+
+    if _listener is None:
+        return
+    if _queue_handler is not None and _queue_handler.dropped:
+        logging.getLogger(__name__).warning(f"로그 큐가 가득 차서 버린 레코드: {_queue_handler.dropped}개")
+    _listener.stop()
+
+    # 종료 이후의 로그는 큐를 거치지 않고 바로 기록
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
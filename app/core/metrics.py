@@ -0,0 +1,174 @@
+"""
+Prometheus 메트릭 정의
+
+HTTP 요청, e-Class 요청/로그인/세션, 크롤링 작업, DB 커넥션 풀, 스토리지 업로드 지표를 한곳에 모아 둡니다.
+prometheus_client가 설치되지 않은 환경에서는 같은 인터페이스의 빈 메트릭을 사용하므로
+계측 코드는 그대로 두고 /metrics 엔드포인트만 503을 반환합니다.
+"""
+import logging
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # pragma: no cover - 선택 의존성
+    PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+    class _NoopMetric:
+        """prometheus_client가 없을 때 쓰는 빈 메트릭"""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, *args, **kwargs) -> "_NoopMetric":
+            return self
+
+        def inc(self, amount: float = 1) -> None:
+            pass
+
+        def dec(self, amount: float = 1) -> None:
+            pass
+
+        def set(self, value: float) -> None:
+            pass
+
+        def observe(self, amount: float) -> None:
+            pass
+
+        def set_function(self, f: Callable[[], float]) -> None:
+            pass
+
+    Counter = Gauge = Histogram = _NoopMetric
+
+    def generate_latest(*args, **kwargs) -> bytes:
+        return b""
+
+
+# 버킷 (초)
+_HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_ECLASS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_CRAWL_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+_STORAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# HTTP (route는 경로 템플릿이므로 경로 파라미터 값이 라벨로 늘어나지 않음)
+HTTP_REQUEST_DURATION = Histogram(
+    "autolms_http_request_duration_seconds",
+    "API 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=_HTTP_BUCKETS,
+)
+
+# e-Class
+ECLASS_REQUESTS = Counter(
+    "autolms_eclass_requests_total",
+    "e-Class 요청 수 (status는 HTTP 상태 코드, 연결 오류는 'error')",
+    ["kind", "method", "status"],
+)
+ECLASS_REQUEST_DURATION = Histogram(
+    "autolms_eclass_request_duration_seconds",
+    "e-Class 요청 소요 시간 (응답 본문 수신까지)",
+    ["kind", "method"],
+    buckets=_ECLASS_BUCKETS,
+)
+ECLASS_LOGINS = Counter(
+    "autolms_eclass_logins_total",
+    "e-Class 로그인 시도 수 (result: success, failure, error)",
+    ["result"],
+)
+ECLASS_ACTIVE_SESSIONS = Gauge(
+    "autolms_eclass_active_sessions",
+    "EclassSessionManager가 보관 중인 로그인 세션 수",
+)
+
+# 크롤링
+CRAWL_QUEUE_DEPTH = Gauge(
+    "autolms_crawl_queue_depth",
+    "실행 대기 또는 실행 중인 크롤링 작업 수",
+)
+CRAWL_TASK_DURATION = Histogram(
+    "autolms_crawl_task_duration_seconds",
+    "크롤링 작업 소요 시간 (kind: course, all_courses, crawl_all)",
+    ["kind", "status"],
+    buckets=_CRAWL_BUCKETS,
+)
+
+# DB
+DB_POOL_CHECKED_OUT = Gauge(
+    "autolms_db_pool_checked_out_connections",
+    "DB 커넥션 풀에서 사용 중인 커넥션 수",
+)
+DB_QUERIES_PER_UNIT = Histogram(
+    "autolms_db_queries_per_unit",
+    "API 요청/크롤링 작업 하나가 실행한 쿼리 수 (unit: 'METHOD 라우트' 또는 작업 종류)",
+    ["unit"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000),
+)
+DB_SLOW_QUERIES = Counter(
+    "autolms_db_slow_queries_total",
+    "DB_SLOW_QUERY_MS 이상 걸린 쿼리 수",
+)
+
+# 스토리지
+STORAGE_UPLOAD_BYTES = Counter(
+    "autolms_storage_upload_bytes_total",
+    "스토리지에 업로드한 바이트 수",
+    ["backend"],
+)
+STORAGE_UPLOAD_DURATION = Histogram(
+    "autolms_storage_upload_duration_seconds",
+    "스토리지 업로드 소요 시간 (backend: supabase, local)",
+    ["backend", "outcome"],
+    buckets=_STORAGE_BUCKETS,
+)
+
+
+def render_metrics() -> bytes:
+    """기본 레지스트리의 메트릭을 Prometheus 텍스트 형식으로 반환"""
+    return generate_latest()
+
+
+class PrometheusMiddleware:
+    """
+    HTTP 요청 처리 시간을 라우트 템플릿별로 기록하는 ASGI 미들웨어
+
+    라우팅이 끝난 뒤 scope["route"]에 남는 경로 템플릿(예: /api/v1/notices/{course_id})을 라벨로 쓰고,
+    일치하는 라우트가 없는 요청은 'unmatched'로 묶습니다.
+    """
+
+    def __init__(self, app, exclude_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=scope.get("method", ""),
+                route=getattr(route, "path", "unmatched"),
+                status=str(status_code),
+            ).observe(time.perf_counter() - started)
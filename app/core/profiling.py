@@ -0,0 +1,194 @@
+"""
+실행 중인 프로세스 진단 도구 (관리자용 /debug 엔드포인트에서 사용)
+
+- SamplingProfiler: 일정 간격으로 모든 스레드의 스택을 수집하는 샘플링 프로파일러.
+  결과는 flamegraph.pl / speedscope에서 바로 열 수 있는 collapsed(folded) 스택 형식이나
+  함수별 상위 목록으로 돌려줍니다. 외부 패키지가 필요 없고, 프로파일 중에도 이벤트 루프를 멈추지 않습니다.
+- dump_asyncio_tasks: 모든 asyncio 태스크의 await 체인(코루틴 → 코루틴 → 대기 중인 Future)을 덤프.
+  멈춘 EclassSession 요청이나 끝나지 않는 크롤링 작업이 어디서 대기 중인지 확인할 때 씁니다.
+- dump_threads: 파서 스레드 풀 등 모든 스레드의 현재 스택.
+
+PARSER_EXECUTOR=process일 때 파서 워커 프로세스는 이 프로세스 밖에서 실행되므로 프로파일에 나타나지 않습니다.
+"""
+import asyncio
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# 동시에 하나의 프로파일만 실행
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """이미 다른 프로파일이 실행 중"""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _frame_stack(frame, limit: int) -> List[str]:
+    """바깥쪽 호출부터 안쪽 호출 순서의 프레임 라벨 목록"""
+    stack = []
+    while frame is not None and len(stack) < limit:
+        stack.append(_frame_label(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+class SamplingProfiler:
+    """
+    샘플링 프로파일러
+
+    - 메인 스레드(uvicorn 이벤트 루프): start()를 메인 스레드에서 호출하면 SIGPROF 타이머(프로세스 CPU 시간 기준)로
+      신호 처리기 안에서 실행 중이던 프레임을 기록합니다. 다른 스레드에서 sys._current_frames()로 읽으면
+      루프가 GIL을 내려놓는 epoll 대기 시점에만 샘플이 잡혀 CPU를 쓰는 코루틴이 보이지 않기 때문입니다.
+    - 그 밖의 스레드(파서 스레드 풀 등): 샘플링 스레드가 sys._current_frames()로 주기적으로 수집합니다.
+
+    사용법: start() → await asyncio.sleep(seconds) → stop()
+
+    Args:
+        interval: 샘플링 간격 (초)
+        max_depth: 스택당 최대 프레임 수
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples: Counter = Counter()  # (스레드 이름, 프레임...) -> 샘플 수
+        self.duration = 0.0
+        self.signal_mode = False
+        self._started = 0.0
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._previous_handler = None
+
+    def start(self) -> None:
+        if not _profile_lock.acquire(blocking=False):
+            raise ProfilerBusyError("이미 프로파일이 실행 중입니다.")
+        self._started = time.perf_counter()
+        self.signal_mode = threading.current_thread() is threading.main_thread() and hasattr(signal, "setitimer")
+        if self.signal_mode:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self._sampler = threading.Thread(target=self._sample_threads, name="profiler-sampler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> "SamplingProfiler":
+        try:
+            if self.signal_mode:
+                signal.setitimer(signal.ITIMER_PROF, 0, 0)
+                signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+            self._stop.set()
+            if self._sampler is not None:
+                self._sampler.join()
+            self.duration = time.perf_counter() - self._started
+        finally:
+            _profile_lock.release()
+        return self
+
+    def _on_signal(self, signum, frame) -> None:
+        self.samples[("MainThread", *_frame_stack(frame, self.max_depth))] += 1
+
+    def _sample_threads(self) -> None:
+        skip = {threading.get_ident()}
+        if self.signal_mode:
+            skip.add(threading.main_thread().ident)
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in skip:
+                    continue
+                stack = _frame_stack(frame, self.max_depth)
+                self.samples[(names.get(thread_id, str(thread_id)), *stack)] += 1
+
+    def collapsed(self) -> str:
+        """folded 스택 형식 ('스레드;바깥 함수;...;안쪽 함수 샘플수' 한 줄씩)"""
+        return "\n".join(
+            f"{';'.join(stack)} {count}" for stack, count in self.samples.most_common()
+        ) + "\n"
+
+    def top(self, limit: int = 30, thread: Optional[str] = None) -> Dict[str, Any]:
+        """함수별 self(가장 안쪽 프레임) / total(스택에 포함) 샘플 수 상위 목록 (ratio는 집계 대상 샘플 대비)"""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        sample_count = 0
+        for (thread_name, *stack), count in self.samples.items():
+            if thread is not None and thread_name != thread or not stack:
+                continue
+            sample_count += count
+            self_counts[stack[-1]] += count
+            for label in set(stack):
+                total_counts[label] += count
+
+        def rows(counter: Counter) -> List[Dict[str, Any]]:
+            return [
+                {"function": label, "samples": count, "ratio": round(count / max(sample_count, 1), 3)}
+                for label, count in counter.most_common(limit)
+            ]
+
+        return {
+            "duration_seconds": round(self.duration, 3),
+            "interval_ms": self.interval * 1000,
+            "main_thread_mode": "signal" if self.signal_mode else "sampling",
+            "samples": sample_count,
+            "threads": sorted({stack[0] for stack in self.samples}),
+            "self": rows(self_counts),
+            "total": rows(total_counts),
+        }
+
+
+def _await_chain(coro, limit: int) -> List[str]:
+    """코루틴이 대기 중인 지점을 바깥쪽부터 따라간 목록 (마지막은 대기 중인 Future 등)"""
+    chain = []
+    current = coro
+    while current is not None and len(chain) < limit:
+        frame = getattr(current, "cr_frame", None) or getattr(current, "gi_frame", None) or getattr(current, "ag_frame", None)
+        if frame is None:
+            if hasattr(current, "cr_frame") or hasattr(current, "gi_frame"):
+                break  # 이미 끝난 코루틴
+            chain.append(f"<awaiting {type(current).__name__}>")
+            break
+        chain.append(f"{_frame_label(frame)} line {frame.f_lineno}")
+        current = getattr(current, "cr_await", None) or getattr(current, "gi_yieldfrom", None) or getattr(current, "ag_await", None)
+    return chain
+
+
+def dump_asyncio_tasks(limit: int = 40) -> List[Dict[str, Any]]:
+    """현재 이벤트 루프의 모든 태스크와 각 태스크의 await 체인"""
+    tasks = []
+    current = asyncio.current_task()
+    for task in asyncio.all_tasks():
+        if task is current:
+            continue
+        coro = task.get_coro()
+        tasks.append({
+            "name": task.get_name(),
+            "coro": getattr(coro, "__qualname__", repr(coro)),
+            "done": task.done(),
+            "cancelling": task.cancelling() if hasattr(task, "cancelling") else None,
+            "await_chain": _await_chain(coro, limit),
+        })
+    tasks.sort(key=lambda item: item["coro"])
+    return tasks
+
+
+def dump_threads(limit: int = 40) -> List[Dict[str, Any]]:
+    """모든 스레드의 현재 스택 (바깥쪽 호출부터)"""
+    names = {thread.ident: thread for thread in threading.enumerate()}
+    threads = []
+    for thread_id, frame in sys._current_frames().items():
+        thread = names.get(thread_id)
+        threads.append({
+            "name": thread.name if thread else str(thread_id),
+            "daemon": thread.daemon if thread else None,
+            "stack": _frame_stack(frame, limit),
+        })
+    return threads
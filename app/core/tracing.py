@@ -0,0 +1,148 @@
+"""
+OpenTelemetry 트레이싱 설정
+
+TRACING_ENABLED=true이면 API 라우트 → CrawlService → 콘텐츠 서비스 → e-Class 요청 → 파서 → SQLAlchemy →
+StorageService로 이어지는 스팬을 만들어 OTLP 수집기(TRACING_EXPORTER=otlp) 또는 표준 출력(console)으로 내보냅니다.
+꺼져 있거나 opentelemetry 패키지가 없으면 span()/traced()는 아무 일도 하지 않는 공용 객체를 돌려주므로
+계측 코드의 비용은 전역 변수 확인 한 번 정도입니다.
+파서 모듈에서도 임포트하므로 설정(app.core.config)은 setup_tracing() 안에서만 읽습니다.
+"""
+import functools
+import logging
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    TRACING_AVAILABLE = True
+except ImportError:  # pragma: no cover - 선택 의존성
+    TRACING_AVAILABLE = False
+
+# 트레이싱이 꺼져 있을 때 span()이 돌려주는 객체 (nullcontext는 재사용 가능)
+_NOOP_SPAN = nullcontext()
+
+_tracer = None  # setup_tracing() 이후에만 설정됨
+_provider = None
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """
+    현재 스팬의 하위 스팬을 여는 컨텍스트 매니저
+
+    트레이싱이 꺼져 있으면 공용 nullcontext를 반환합니다.
+    예외는 스팬에 기록되고 그대로 전파됩니다.
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    async 함수 전체를 스팬으로 감싸는 데코레이터
+
+    스팬 이름을 생략하면 '클래스.메서드' 형식의 qualname을 씁니다.
+    트레이싱 사용 여부는 호출 시점에 확인하므로 모듈 임포트 순서와 관계없습니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return await func(*args, **kwargs)
+            with _tracer.start_as_current_span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """현재 스팬에 속성 추가 (트레이싱이 꺼져 있으면 무시)"""
+    if _tracer is None:
+        return
+    current = trace.get_current_span()
+    for key, value in attributes.items():
+        if value is not None:
+            current.set_attribute(key, value)
+
+
+def _create_exporter(settings):
+    """TRACING_EXPORTER 설정에 맞는 스팬 익스포터 생성"""
+    if settings.TRACING_EXPORTER == "console":
+        return ConsoleSpanExporter()
+    if settings.TRACING_EXPORTER == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+    raise ValueError(f"지원하지 않는 트레이싱 익스포터: {settings.TRACING_EXPORTER}")
+
+
+def setup_tracing(app=None, engine=None) -> bool:
+    """
+    트레이싱 초기화 (애플리케이션 생성 시 한 번 호출)
+
+    Args:
+        app: 계측할 FastAPI 앱 (opentelemetry-instrumentation-fastapi가 있으면 라우트 스팬 생성)
+        engine: 계측할 AsyncEngine (opentelemetry-instrumentation-sqlalchemy가 있으면 쿼리 스팬 생성)
+
+    Returns:
+        bool: 트레이싱 사용 여부
+    """
+    global _tracer, _provider
+    from app.core.config import settings
+
+    if not settings.TRACING_ENABLED:
+        return False
+    if not TRACING_AVAILABLE:
+        logger.warning("TRACING_ENABLED가 설정되었지만 opentelemetry-sdk가 설치되지 않아 트레이싱을 사용하지 않습니다.")
+        return False
+
+    if _provider is None:
+        try:
+            exporter = _create_exporter(settings)
+        except Exception as e:
+            logger.error(f"트레이싱 익스포터 생성 실패: {e}")
+            return False
+
+        _provider = TracerProvider(
+            resource=Resource.create({"service.name": settings.TRACING_SERVICE_NAME}),
+            sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+        )
+        _provider.add_span_processor(BatchSpanProcessor(exporter))
+        trace.set_tracer_provider(_provider)
+        _tracer = trace.get_tracer("autolms")
+        logger.info(f"트레이싱 사용: exporter={settings.TRACING_EXPORTER}, sample_ratio={settings.TRACING_SAMPLE_RATIO}")
+
+    if app is not None:
+        try:
+            from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+            FastAPIInstrumentor.instrument_app(app, tracer_provider=_provider, excluded_urls="metrics")
+        except ImportError:
+            logger.warning("opentelemetry-instrumentation-fastapi가 없어 API 라우트 스팬을 만들지 않습니다.")
+
+    if engine is not None:
+        try:
+            from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+            SQLAlchemyInstrumentor().instrument(engine=engine.sync_engine, tracer_provider=_provider)
+        except ImportError:
+            logger.warning("opentelemetry-instrumentation-sqlalchemy가 없어 쿼리 스팬을 만들지 않습니다.")
+
+    return True
+
+
+def shutdown_tracing() -> None:
+    """남은 스팬을 내보내고 트레이서 종료 (애플리케이션 종료 시 호출)"""
+    global _tracer, _provider
+
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
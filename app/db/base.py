@@ -3,6 +3,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.metrics import DB_POOL_CHECKED_OUT
 
 # 기본 Base 클래스 생성
 Base = declarative_base()
@@ -18,6 +19,14 @@ engine = create_async_engine(
     pool_recycle=3600
 )
 
+# 커넥션 풀 사용량 메트릭 (수집 시점에 풀에서 직접 읽음)
+DB_POOL_CHECKED_OUT.set_function(lambda: engine.sync_engine.pool.checkedout())
+
+# 쿼리 통계, 느린 쿼리 로그, N+1 감지
+if settings.DB_QUERY_STATS_ENABLED:
+    from app.db.query_stats import install_query_hooks
+    install_query_hooks(engine)
+
 # 세션 팩토리 생성
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
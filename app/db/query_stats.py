@@ -0,0 +1,192 @@
+"""
+SQLAlchemy 쿼리 통계, 느린 쿼리 로그, N+1 감지
+
+엔진의 before/after_cursor_execute 이벤트로 모든 쿼리의 소요 시간을 재고,
+컨텍스트 변수에 설정된 QueryStats(API 요청 또는 크롤링 작업 단위)에 누적합니다.
+
+- DB_SLOW_QUERY_MS 이상 걸린 쿼리는 파라미터 값을 가린 채(타입만 표시) 경고 로그로 남깁니다.
+- 한 단위 안에서 같은 형태의 쿼리가 DB_N_PLUS_ONE_THRESHOLD번을 넘으면 N+1 의심으로 경고합니다.
+  (행마다 commit하는 create, 수강 정보마다 실행하는 exists() 같은 반복 쿼리를 찾는 용도)
+"""
+import functools
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.metrics import DB_QUERIES_PER_UNIT, DB_SLOW_QUERIES
+
+logger = logging.getLogger(__name__)
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|:\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_MAX_STATEMENT_LOG = 500
+
+
+def statement_shape(statement: str) -> str:
+    """파라미터 자리와 IN 목록 길이를 무시한 쿼리 형태 (N+1 감지용)"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER.sub("?", shape)
+    return _PLACEHOLDER_LIST.sub("?, ...", shape)
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> str:
+    """파라미터 값을 가리고 타입만 표시"""
+    if executemany:
+        return f"<executemany {len(parameters)} rows>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return f"<{type(parameters).__name__}>"
+
+
+class QueryStats:
+    """한 단위(API 요청, 크롤링 작업)의 쿼리 통계"""
+
+    def __init__(self, label: str, parent: Optional["QueryStats"] = None):
+        self.label = label
+        self.parent = parent
+        self.count = 0
+        self.seconds = 0.0
+        self.slow = 0
+        self.shapes: Counter = Counter()
+
+    def record(self, shape: str, seconds: float, slow: bool) -> None:
+        # 상위 단위(예: 전체 강의 작업 안의 강의별 작업)에도 함께 누적
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            stats.slow += int(slow)
+            stats.shapes[shape] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> List[tuple]:
+        """threshold번을 넘게 반복된 쿼리 형태 (많은 순)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queries": self.count,
+            "ms": round(self.seconds * 1000, 1),
+            "slow": self.slow,
+            "distinct": len(self.shapes),
+        }
+
+    def report(self) -> None:
+        """통계 로그와 N+1 경고 출력"""
+        if not self.count:
+            return
+        DB_QUERIES_PER_UNIT.labels(unit=self.label).observe(self.count)
+        logger.debug(f"쿼리 통계 [{self.label}]: {self.to_dict()}")
+        for shape, count in self.repeated(settings.DB_N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                f"N+1 의심 [{self.label}]: 같은 형태의 쿼리 {count}회 실행 "
+                f"(전체 {self.count}회) - {shape[:_MAX_STATEMENT_LOG]}"
+            )
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 컨텍스트의 쿼리 통계 (없으면 None)"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(label: str) -> Iterator[QueryStats]:
+    """
+    with 블록 안에서 실행된 쿼리를 label 단위로 집계하고, 끝나면 통계와 N+1 경고를 로그로 남김
+
+    이미 집계 중인 단위 안에서 쓰면 하위 단위가 되어 상위 단위에도 함께 누적됩니다.
+    """
+    stats = QueryStats(label, parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        stats.report()
+
+
+def tracked_queries(label: str) -> Callable:
+    """async 함수 실행 동안의 쿼리를 label 단위로 집계하는 데코레이터 (백그라운드 크롤링 작업용)"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with track_queries(label):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_list = conn.info.get("query_started")
+    if not started_list:
+        return
+    seconds = time.perf_counter() - started_list.pop()
+
+    slow = seconds * 1000 >= settings.DB_SLOW_QUERY_MS
+    if slow:
+        DB_SLOW_QUERIES.inc()
+        logger.warning(
+            f"느린 쿼리 {seconds * 1000:.1f}ms: {_WHITESPACE.sub(' ', statement)[:_MAX_STATEMENT_LOG]} "
+            f"params={redact_parameters(parameters, executemany)}"
+        )
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement_shape(statement), seconds, slow)
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def install_query_hooks(engine) -> None:
+    """엔진에 쿼리 통계 이벤트 등록 (AsyncEngine이면 sync_engine에 등록)"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """API 요청마다 쿼리 통계를 집계하는 ASGI 미들웨어 (라벨은 라우트 템플릿)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats("request")
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_stats.reset(token)
+            route = scope.get("route")
+            stats.label = f"{scope.get('method', '')} {getattr(route, 'path', 'unmatched')}"
+            stats.report()
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional, Sequence
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -28,6 +28,22 @@ class AttachmentRepository(BaseRepository[Attachment]):
         result = await db.execute(query)
         return result.scalars().all()
     
+    async def upsert_attachments(
+        self, db: AsyncSession, objs_data: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> List[Tuple[Attachment, bool]]:
+        """
+        (source_type, source_id, file_name) 기준으로 첨부파일 메타데이터 일괄 생성 또는 갱신
+        같은 게시글을 여러 동기화가 동시에 처리해도 중복 행이 생기지 않습니다.
+        반환값: (데이터베이스 모델 객체, 새로 생성 여부) 목록 (순서 보장 없음)
+        """
+        # 한 게시글에 같은 이름의 파일이 두 번 있으면 마지막 것만 저장 (upsert는 같은 키를 두 번 갱신할 수 없음)
+        unique_rows = {
+            (row["source_type"], row["source_id"], row["file_name"]): row for row in objs_data
+        }
+        return await self.upsert_many(
+            db, list(unique_rows.values()), ("source_type", "source_id", "file_name"), commit=commit
+        )
+
     async def get_by_user_id(self, db: AsyncSession, user_id: str) -> Sequence[Any]:
         """
         사용자별 첨부파일 목록 조회
@@ -1,6 +1,9 @@
-from typing import List, Dict, Any, Optional, TypeVar, Generic, Type, Union, Sequence
-from sqlalchemy import select
+from typing import List, Dict, Any, Optional, TypeVar, Generic, Type, Union, Sequence, Tuple, Collection
+from sqlalchemy import select, insert, func, tuple_, distinct, literal_column
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload, selectinload
 from app.db.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -10,7 +13,29 @@ class BaseRepository(Generic[ModelType]):
     
     def __init__(self, model: Type[ModelType]):
         self.model = model
+        self.column_names = set(model.__table__.columns.keys())
+
+    def _filter_columns(self, obj_data: Dict[str, Any]) -> Dict[str, Any]:
+        """모델 컬럼에 해당하는 키만 남긴 딕셔너리 반환"""
+        return {key: value for key, value in obj_data.items() if key in self.column_names}
     
+    def load_options(self, fields: Optional[Collection[str]] = None, **relationships: Any) -> List[Any]:
+        """
+        조회할 필드에 맞는 로더 옵션
+        fields가 None이면 모든 컬럼과 relationships(이름=관계 속성)를 불러오고,
+        지정하면 그 컬럼(과 id)만 SELECT하고 fields에 이름이 있는 관계만 불러옵니다.
+        나머지 컬럼/관계는 접근하면 지연 로딩 대신 예외가 나도록 합니다 (비동기 세션에서는 지연 로딩 불가).
+        반환값: 쿼리 options에 넘길 로더 옵션 목록
+        """
+        if fields is None:
+            return [selectinload(relationship) for relationship in relationships.values()]
+
+        columns = [getattr(self.model, name) for name in fields if name in self.column_names and name != "id"]
+        options = [load_only(self.model.id, *columns, raiseload=True)]
+        for name, relationship in relationships.items():
+            options.append(selectinload(relationship) if name in fields else raiseload(relationship))
+        return options
+
     async def get_by_id(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
         """
         ID로 항목 조회
@@ -31,6 +56,65 @@ class BaseRepository(Generic[ModelType]):
         result = await db.execute(query)
         return result.scalars().all()
     
+    async def count(self, db: AsyncSession, *criteria: ColumnElement) -> int:
+        """
+        조건에 맞는 항목 수 조회 (SELECT count(*))
+        반환값: 항목 수
+        """
+        query = select(func.count()).select_from(self.model).where(*criteria)
+        result = await db.execute(query)
+        return result.scalar_one()
+
+    async def get_version(
+        self, db: AsyncSession, *criteria: ColumnElement, related: Optional[Any] = None
+    ) -> Tuple[Any, ...]:
+        """
+        조건에 맞는 항목들의 버전 조회 (행은 읽지 않고 항목 수와 최종 수정 시각만 집계)
+        related에 관계 속성(예: Notice.attachments)을 주면 관계 항목의 수와 최종 수정 시각도 함께 집계합니다.
+        조건부 GET의 ETag 계산에 사용합니다.
+        반환값: (항목 수, 최대 updated_at[, 관계 항목 수, 관계 최대 updated_at])
+        """
+        columns = [func.count(distinct(self.model.id)), func.max(self.model.updated_at)]
+        query = select(*columns).select_from(self.model)
+        if related is not None:
+            target = related.property.mapper.class_
+            query = query.outerjoin(related).add_columns(func.count(target.id), func.max(target.updated_at))
+
+        result = await db.execute(query.where(*criteria))
+        return tuple(result.one())
+
+    async def get_keyset_page(
+        self,
+        db: AsyncSession,
+        criteria: Sequence[ColumnElement],
+        sort_keys: Sequence[ColumnElement],
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+        descending: bool = True,
+        options: Sequence[Any] = ()
+    ) -> Tuple[List[ModelType], Optional[Tuple[Any, ...]]]:
+        """
+        키셋 페이지네이션으로 항목 조회
+        sort_keys의 마지막 요소는 유일해야 하며(보통 id), after는 이전 페이지 마지막 행의 정렬 키 값입니다.
+        OFFSET을 쓰지 않으므로 조회 비용이 페이지 위치와 관계없이 페이지 크기에 비례합니다.
+        반환값: (데이터베이스 모델 객체 목록, 다음 페이지 정렬 키 값 또는 None)
+        """
+        query = select(self.model, *sort_keys).where(*criteria)
+        if after is not None:
+            row_key = tuple_(*sort_keys)
+            query = query.where(row_key < tuple_(*after) if descending else row_key > tuple_(*after))
+        query = query.order_by(
+            *[key.desc() if descending else key.asc() for key in sort_keys]
+        ).limit(limit + 1)
+        if options:
+            query = query.options(*options)
+
+        result = await db.execute(query)
+        rows = result.all()
+
+        next_key = tuple(rows[limit - 1][1:]) if len(rows) > limit else None
+        return [row[0] for row in rows[:limit]], next_key
+
     async def create(self, db: AsyncSession, obj_data: Dict[str, Any]) -> ModelType:
         """
         새 항목 생성
@@ -41,6 +125,64 @@ class BaseRepository(Generic[ModelType]):
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
+
+    async def create_many(
+        self, db: AsyncSession, objs_data: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> List[ModelType]:
+        """
+        여러 항목을 한 번에 생성 (다중 행 INSERT ... RETURNING, 단일 트랜잭션)
+        모델 컬럼에 없는 키는 제외하고 저장합니다.
+        반환값: 생성된 데이터베이스 모델 객체 목록 (입력 순서와 동일)
+        """
+        if not objs_data:
+            return []
+
+        rows = [self._filter_columns(obj_data) for obj_data in objs_data]
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await db.scalars(stmt, rows)
+        db_objs = list(result.all())
+
+        if commit:
+            await db.commit()
+        return db_objs
+
+    async def upsert_many(
+        self,
+        db: AsyncSession,
+        objs_data: Sequence[Dict[str, Any]],
+        index_elements: Sequence[str],
+        commit: bool = True
+    ) -> List[Tuple[ModelType, bool]]:
+        """
+        여러 항목을 한 번에 생성 또는 갱신 (INSERT ... ON CONFLICT DO UPDATE ... RETURNING)
+        index_elements는 유니크 제약조건의 컬럼이어야 하며, 충돌 시 id와 created_at을 제외한
+        나머지 입력 컬럼을 갱신합니다.
+
+        충돌한 행은 기존(더 작은) id를 유지하므로 id 순 정렬로는 입력 순서를 되살릴 수 없습니다.
+        반환 순서는 보장하지 않으니 호출 측은 index_elements 값으로 입력과 짝지어야 합니다.
+        새로 생성 여부는 PostgreSQL의 xmax(새로 삽입한 행이면 0)로 판단합니다.
+        반환값: (데이터베이스 모델 객체, 새로 생성했으면 True) 목록 (순서 보장 없음)
+        """
+        if not objs_data:
+            return []
+
+        rows = [self._filter_columns(obj_data) for obj_data in objs_data]
+        update_columns = {key for row in rows for key in row} - set(index_elements) - {"id", "created_at"}
+        if "updated_at" in self.column_names:
+            update_columns.add("updated_at")
+
+        stmt = pg_insert(self.model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(index_elements),
+            set_={column: stmt.excluded[column] for column in update_columns}
+        ).returning(self.model, literal_column("xmax = 0").label("inserted"))
+
+        result = await db.execute(stmt, rows, execution_options={"populate_existing": True})
+        upserted = [(db_obj, bool(inserted)) for db_obj, inserted in result.all()]
+
+        if commit:
+            await db.commit()
+        return upserted
     
     async def update(
         self, db: AsyncSession, id: Any, obj_data: Dict[str, Any]
@@ -1,5 +1,7 @@
-from typing import List
-from sqlalchemy import select, join
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from datetime import datetime
+from sqlalchemy import select, join, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -26,6 +28,45 @@ class CourseRepository(BaseRepository):
         result = await db.execute(query)
         return result.scalars().all()
 
+    async def get_version_by_user_id(self, db: AsyncSession, user_id: str) -> Tuple[Any, ...]:
+        """
+        사용자 ID로 코스 목록 버전 조회 (행은 읽지 않고 집계만 조회)
+        반환값: (코스 수, 코스 최대 updated_at, 사용자-코스 연결 최대 updated_at)
+        """
+        query = select(
+            func.count(self.model.id),
+            func.max(self.model.updated_at),
+            func.max(user_courses.c.updated_at)
+        ).join(
+            user_courses,
+            self.model.id == user_courses.c.course_id
+        ).where(
+            user_courses.c.user_id == user_id
+        )
+
+        result = await db.execute(query)
+        return tuple(result.one())
+
+    async def get_course_list_hash(self, db: AsyncSession, user_id: str) -> Optional[str]:
+        """
+        사용자 강의 목록을 마지막으로 저장할 때 기록한 해시 조회
+        (연결이 없거나 행마다 해시가 다르거나 비어 있으면 None)
+        """
+        query = select(
+            func.min(user_courses.c.list_hash),
+            func.max(user_courses.c.list_hash),
+            func.count(),
+            func.count(user_courses.c.list_hash)
+        ).where(
+            user_courses.c.user_id == user_id
+        )
+
+        result = await db.execute(query)
+        min_hash, max_hash, total, hashed = result.one()
+        if not total or hashed != total or min_hash != max_hash:
+            return None
+        return min_hash
+
     async def get_by_course_id(self, db: AsyncSession, course_id: int) -> Course:
         """코스 ID로 단일 코스 조회"""
         query = select(self.model).where(self.model.id == course_id)
@@ -46,4 +87,63 @@ class CourseRepository(BaseRepository):
             setattr(db_obj, key, value)
         await db.commit()
         await db.refresh(db_obj)
-        return db_obj
\ No newline at end of file
+        return db_obj
+
+    async def upsert_courses(
+        self, db: AsyncSession, courses_data: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> List[Course]:
+        """코스 ID 기준으로 코스 목록 일괄 생성 또는 갱신 (순서 보장 없음)"""
+        upserted = await self.upsert_many(db, courses_data, ("id",), commit=commit)
+        return [course for course, _ in upserted]
+
+    async def upsert_user_courses(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        links: Sequence[Dict[str, Any]],
+        list_hash: Optional[str] = None,
+        commit: bool = True
+    ) -> None:
+        """
+        사용자-코스 연결(user_courses)을 (user_id, course_id) 기준으로 일괄 생성 또는 갱신
+        list_hash를 주면 이 사용자의 모든 연결 행에 기록 (get_course_list_hash로 변경 여부 판단)
+        """
+        if not links:
+            return
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "user_id": user_id,
+                "course_id": link["course_id"],
+                "semester": link.get("semester"),
+                "time": link.get("time"),
+                "list_hash": list_hash,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for link in links
+        ]
+
+        stmt = pg_insert(user_courses).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[user_courses.c.user_id, user_courses.c.course_id],
+            set_={
+                "semester": stmt.excluded.semester,
+                "time": stmt.excluded.time,
+                "list_hash": stmt.excluded.list_hash,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        await db.execute(stmt)
+
+        if list_hash is not None:
+            # 이번 목록에 없는 기존 연결 행도 같은 해시로 맞춰 둠 (행마다 해시가 다르면 항상 다시 저장하게 됨)
+            await db.execute(
+                update(user_courses)
+                .where(user_courses.c.user_id == user_id, user_courses.c.list_hash.is_distinct_from(list_hash))
+                .values(list_hash=list_hash)
+            )
+
+        if commit:
+            await db.commit()
@@ -1,5 +1,5 @@
-from typing import List, Dict, Any, Optional, Sequence
-from sqlalchemy import select
+from typing import Collection, List, Dict, Any, Optional, Sequence, Set, Tuple
+from sqlalchemy import select, func, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.repositories.base import BaseRepository
@@ -44,4 +44,60 @@ class MaterialRepository(BaseRepository[Material]):
             self.model.article_id == article_id
         )
         result = await db.execute(query)
-        return result.scalar_one_or_none() is not None
\ No newline at end of file
+        return result.scalar_one_or_none() is not None
+
+    async def get_article_ids(self, db: AsyncSession, course_id: str) -> Set[str]:
+        """
+        강의에 저장된 강의자료 게시글 ID 집합 조회 (article_id 컬럼만 조회)
+        반환값: 게시글 ID 집합
+        """
+        query = select(self.model.article_id).where(self.model.course_id == course_id)
+        result = await db.execute(query)
+        return set(result.scalars().all())
+
+    async def upsert_articles(
+        self, db: AsyncSession, objs_data: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> List[Tuple[Material, bool]]:
+        """
+        (course_id, article_id) 기준으로 강의자료 일괄 생성 또는 갱신
+        동시에 여러 동기화가 실행되어도 중복 행이 생기지 않습니다.
+        반환값: (데이터베이스 모델 객체, 새로 생성 여부) 목록 (순서 보장 없음, article_id로 짝지을 것)
+        """
+        return await self.upsert_many(db, objs_data, ("course_id", "article_id"), commit=commit)
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        course_id: str,
+        limit: int,
+        after: Optional[Sequence[Any]] = None,
+        fields: Optional[Collection[str]] = None
+    ) -> Tuple[List[Material], Optional[Tuple[Any, ...]]]:
+        """
+        강의 ID로 강의자료 한 페이지 조회 (작성일 최신순, (coalesce(date, ''), id) 키셋)
+        fields를 지정하면 해당 컬럼(과 'attachments'가 있으면 첨부파일)만 조회합니다.
+        반환값: (데이터베이스 모델 객체 목록, 다음 페이지 정렬 키 값 또는 None)
+        """
+        return await self.get_keyset_page(
+            db,
+            criteria=[self.model.course_id == course_id],
+            sort_keys=[func.coalesce(self.model.date, literal_column("''")), self.model.id],
+            limit=limit,
+            after=after,
+            descending=True,
+            options=self.load_options(fields, attachments=self.model.attachments)
+        )
+
+    async def count_by_course_id(self, db: AsyncSession, course_id: str) -> int:
+        """
+        강의 ID로 강의자료 수 조회
+        반환값: 항목 수
+        """
+        return await self.count(db, self.model.course_id == course_id)
+
+    async def get_version_by_course_id(self, db: AsyncSession, course_id: str) -> Tuple[Any, ...]:
+        """
+        강의 ID로 강의자료 목록 버전 조회 (첨부파일 포함, 집계 쿼리 한 번)
+        반환값: (항목 수, 최대 updated_at, 첨부파일 수, 첨부파일 최대 updated_at)
+        """
+        return await self.get_version(db, self.model.course_id == course_id, related=self.model.attachments)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, BigInteger
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, BigInteger, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,8 +7,14 @@ from app.db.base import Base
 class Attachment(Base):
     """첨부파일 메타데이터"""
     __tablename__ = "attachments"
+    __table_args__ = (
+        Index("ix_attachments_source_type_source_id", "source_type", "source_id"),
+        Index("ix_attachments_course_id_created_at", "course_id", "created_at"),
+        UniqueConstraint("source_type", "source_id", "file_name", name="uq_attachments_source_file_name"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    course_id = Column(String, nullable=False)
     source_type = Column(String, nullable=False)  # 'notice', 'material', 'assignment'
     source_id = Column(String, nullable=False)
     file_name = Column(String, nullable=False)
@@ -21,9 +27,9 @@ class Attachment(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계 정의 - polymorphic
-    notice_id = Column(Integer, ForeignKey("notices.id"))
-    material_id = Column(Integer, ForeignKey("materials.id"))
-    assignment_id = Column(Integer, ForeignKey("assignments.id"))
+    notice_id = Column(Integer, ForeignKey("notices.id"), index=True)
+    material_id = Column(Integer, ForeignKey("materials.id"), index=True)
+    assignment_id = Column(Integer, ForeignKey("assignments.id"), index=True)
     
     notice = relationship("Notice", back_populates="attachments")
     material = relationship("Material", back_populates="attachments")
@@ -33,6 +39,7 @@ class Attachment(Base):
         """모델을 딕셔너리로 변환"""
         return {
             'id': self.id,
+            'course_id': self.course_id,
             'source_type': self.source_type,
             'source_id': self.source_id,
             'file_name': self.file_name,
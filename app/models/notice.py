@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, UniqueConstraint, Index, func, literal_column
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,6 +7,9 @@ from app.db.base import Base
 class Notice(Base):
     """공지사항"""
     __tablename__ = "notices"
+    __table_args__ = (
+        UniqueConstraint("course_id", "article_id", name="uq_notices_course_id_article_id"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     article_id = Column(String, nullable=False)
@@ -37,4 +40,14 @@ class Notice(Base):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'attachments': [attachment.to_dict() for attachment in self.attachments] if self.attachments else []
-        }
\ No newline at end of file
+        }
+
+
+# 강의별 목록 키셋 페이지네이션 (course_id, coalesce(date, ''), id)
+# 리포지토리의 정렬 키와 같은 식이어야 플래너가 인덱스를 사용합니다.
+Index(
+    "ix_notices_course_id_date_id",
+    Notice.course_id,
+    func.coalesce(Notice.date, literal_column("''")),
+    Notice.id
+)
@@ -1,6 +1,5 @@
 from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text
-from sqlalchemy.orm import relationship
 
 from app.db.base import Base
 
@@ -17,8 +16,7 @@ class Session(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    # Relationships
-    user = relationship("User", back_populates="sessions")
+    # users 테이블은 Supabase가 관리하므로 ORM 모델(User)이 없음 - 관계 없이 user_id 외래키만 유지
 
     def __repr__(self):
         return f"<Session(id={self.id}, user_id={self.user_id}, is_active={self.is_active})>"
\ No newline at end of file
@@ -21,6 +21,7 @@ class Syllabus(Base):
     equipment = Column(Text)
     evaluation_method = Column(Text)
     weekly_plans = Column(JSON)
+    content_hash = Column(String(64))  # 마지막으로 저장한 파싱 결과의 해시 (변경 없으면 쓰기 생략)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -11,6 +11,7 @@ user_courses = Table(
     Column('course_id', String, ForeignKey('courses.id'), primary_key=True),
     Column('semester', String),
     Column('time', String),
+    Column('list_hash', String(64)),  # 마지막으로 저장한 사용자 강의 목록 전체의 해시 (변경 없으면 쓰기 생략)
     Column('created_at', DateTime, default=datetime.utcnow),
     Column('updated_at', DateTime, onupdate=datetime.utcnow)
 )
\ No newline at end of file
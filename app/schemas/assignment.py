@@ -2,6 +2,8 @@ from pydantic import BaseModel
 from typing import Optional, List, Any
 from datetime import datetime
 
+from app.schemas.attachment import AttachmentSummary
+
 class AssignmentBase(BaseModel):
     article_id: str
     title: str
@@ -30,8 +32,25 @@ class AssignmentInDBBase(AssignmentBase):
         from_attributes = True
 
 class Assignment(AssignmentInDBBase):
-    attachments: Optional[List[Any]] = []
+    attachments: List[AttachmentSummary] = []
+
+class AssignmentSummary(BaseModel):
+    """목록 화면용 과제 요약 (view=summary, 본문과 첨부파일 제외)"""
+    id: int
+    article_id: str
+    course_id: str
+    title: str
+    due_date: Optional[str] = None
+    status: Optional[str] = None
+    submission_status: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
 
 class AssignmentList(BaseModel):
     assignments: List[Assignment]
     total: int
+    limit: int
+    next_cursor: Optional[str] = None
@@ -51,3 +51,20 @@ class Attachment(AttachmentInDBBase):
 class AttachmentList(BaseModel):
     attachments: List[Attachment]
     total: int
+
+class AttachmentSummary(BaseModel):
+    """게시글(공지사항/강의자료/과제)에 포함되는 첨부파일 정보 (attachments 테이블 컬럼과 같음)"""
+    id: int
+    course_id: str
+    source_type: str
+    source_id: str
+    file_name: str
+    file_size: Optional[int] = None
+    content_type: Optional[str] = None
+    storage_path: str
+    original_url: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
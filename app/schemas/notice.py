@@ -2,6 +2,8 @@ from pydantic import BaseModel
 from typing import Optional, List, Any
 from datetime import datetime
 
+from app.schemas.attachment import AttachmentSummary
+
 class NoticeBase(BaseModel):
     article_id: str
     title: str
@@ -30,8 +32,25 @@ class NoticeInDBBase(NoticeBase):
         from_attributes = True
 
 class Notice(NoticeInDBBase):
-    attachments: Optional[List[Any]] = []
+    attachments: List[AttachmentSummary] = []
+
+class NoticeSummary(BaseModel):
+    """목록 화면용 공지사항 요약 (view=summary, 본문과 첨부파일 제외)"""
+    id: int
+    article_id: str
+    course_id: str
+    title: str
+    author: Optional[str] = None
+    date: Optional[str] = None
+    views: Optional[int] = 0
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
 
 class NoticeList(BaseModel):
     notices: List[Notice]
     total: int
+    limit: int
+    next_cursor: Optional[str] = None
@@ -13,7 +13,7 @@ class SyllabusBase(BaseModel):
     textbooks: Optional[str] = None
     equipment: Optional[str] = None
     evaluation_method: Optional[str] = None
-    weekly_plans: Optional[Dict[str, Any]] = None
+    weekly_plans: Optional[List[Dict[str, Any]]] = None  # [{'주차', '내용', '비고'}, ...]
 
 class SyllabusCreate(SyllabusBase):
     course_id: str
@@ -1,13 +1,16 @@
 import logging
-from typing import List, Dict, Any, Optional, Generic, TypeVar
+from typing import Collection, List, Dict, Any, Optional, Generic, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.base_service import ContentService as ContentServiceBase
 from app.services.session import EclassSessionManager
 from app.services.parsers.content_parser import ContentParser
+from app.services.parsers.executor import ParserExecutor
+from app.services.parsers.cache import ParseCache
 from app.db.repositories.base import BaseRepository
 from app.db.base import Base
+from app.utils.pagination import encode_cursor, decode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,9 @@ ModelType = TypeVar('ModelType', bound=Base)
 RepositoryType = TypeVar('RepositoryType', bound=BaseRepository)
 ParserType = TypeVar('ParserType', bound=ContentParser)
 
+# 목록 키셋 커서의 정렬 키 타입: (coalesce(date 또는 due_date, ''), id) - 날짜 키는 NULL이 될 수 없음
+PAGE_CURSOR_TYPES = ((str,), (int,))
+
 class ContentService(ContentServiceBase, Generic[ModelType, ParserType, RepositoryType]):
     """콘텐츠 서비스 구현 클래스"""
     
@@ -23,12 +29,18 @@ class ContentService(ContentServiceBase, Generic[ModelType, ParserType, Reposito
         session_service: EclassSessionManager,
         parser: ParserType,
         repository: RepositoryType,
-        content_type: str
+        content_type: str,
+        parser_executor: Optional[ParserExecutor] = None,
+        parse_cache: Optional[ParseCache] = None
     ):
         self.session_service = session_service
         self.parser = parser
         self.repository = repository
         self.content_type = content_type  # 'notices', 'materials', 'assignments' 등
+        # 파싱 실행기 (없으면 이벤트 루프에서 바로 파싱)
+        self.parser_executor = parser_executor or ParserExecutor()
+        # 파싱 결과 캐시 (없으면 캐시 없이 매번 파싱)
+        self.parse_cache = parse_cache or ParseCache(max_entries=0)
         logger.info(f"{self.content_type.capitalize()}Service 초기화 완료")
     
     async def initialize(self) -> None:
@@ -49,6 +61,47 @@ class ContentService(ContentServiceBase, Generic[ModelType, ParserType, Reposito
         """모든 항목 조회"""
         return await self.repository.get_all(db, skip=skip, limit=limit)
     
+    async def get_page(
+        self,
+        db: AsyncSession,
+        course_id: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[Collection[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        강의 ID로 항목 한 페이지 조회 (키셋 페이지네이션)
+
+        Args:
+            db: 데이터베이스 세션
+            course_id: 강의 ID
+            limit: 페이지 크기
+            cursor: 이전 응답의 next_cursor (첫 페이지는 None)
+            fields: 조회할 필드 (None이면 전체, 지정하면 해당 컬럼만 SELECT)
+
+        Returns:
+            Dict[str, Any]: items, total, next_cursor
+
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        after = decode_cursor(cursor, types=PAGE_CURSOR_TYPES)
+        items, next_key = await self.repository.get_page(db, course_id, limit, after=after, fields=fields)
+        total = await self.repository.count_by_course_id(db, course_id)
+        return {
+            "items": items,
+            "total": total,
+            "next_cursor": encode_cursor(next_key) if next_key else None
+        }
+    
+    async def get_list_version(self, db: AsyncSession, course_id: str) -> tuple:
+        """
+        강의 ID로 항목 목록의 버전 조회 (조건부 GET의 ETag용)
+        행은 읽지 않고 항목/첨부파일 수와 최종 수정 시각만 집계하므로, 목록이 바뀌지 않았으면
+        응답 본문을 만들지 않고 304로 답할 수 있습니다.
+        """
+        return await self.repository.get_version_by_course_id(db, course_id)
+
     async def get_by_course_id(self, db: AsyncSession, course_id: str, user_id: str = None) -> List[ModelType]:
         """강의 ID로 항목 조회"""
         return await self.repository.get_by_course_id(db, course_id)
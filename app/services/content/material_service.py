@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -7,6 +7,11 @@ from app.services.auth_service import AuthService
 from app.services.content.content_service import ContentService
 from app.services.session import EclassSessionManager
 from app.services.parsers.material_parser import MaterialParser
+from app.services.parsers.executor import ParserExecutor
+from app.services.parsers.cache import ParseCache
+from app.core.config import settings
+from app.core.tracing import traced
+from app.utils.timing import StageTimer
 from app.services.storage.storage_service import StorageService
 from app.db.repositories.material_repository import MaterialRepository
 from app.db.repositories.attachment_repository import AttachmentRepository
@@ -23,20 +28,25 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
             material_repository: MaterialRepository,
             attachment_repository: AttachmentRepository,
             storage_service: StorageService,
-            auth_service: AuthService
+            auth_service: AuthService,
+            parser_executor: Optional[ParserExecutor] = None,
+            parse_cache: Optional[ParseCache] = None
     ):
         # 부모 클래스 초기화 - 필수 매개변수만 전달
         super().__init__(
             eclass_session,
             material_parser,
             material_repository,
-            content_type="materials"
+            content_type="materials",
+            parser_executor=parser_executor,
+            parse_cache=parse_cache
         )
         # 클래스 변수 직접 설정
         self.auth_service = auth_service
         self.attachment_repository = attachment_repository
         self.storage_service = storage_service
 
+    @traced()
     async def refresh_all(
         self, 
         db: AsyncSession, 
@@ -57,10 +67,12 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
             Dict[str, Any]: 새로고침 결과
         """
         result = {"count": 0, "new": 0, "errors": 0}
+        timer = StageTimer()
         
         try:
             # 1. 세션 가져오기
-            eclass_session = await self.session_service.get_session(user_id)
+            with timer.stage("session"):
+                eclass_session = await self.session_service.get_session(user_id)
             if not eclass_session:
                 logger.error(f"이클래스 세션을 가져올 수 없음")
                 result["errors"] += 1
@@ -68,33 +80,41 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
             
             # 2. 강의자료 목록 페이지 접근
             # 이클래스 ID 조회
-            eclass_credentials = await self.auth_service.get_user_eclass_credentials(user_id)
+            with timer.stage("session"):
+                eclass_credentials = await self.auth_service.get_user_eclass_credentials(user_id)
             if not eclass_credentials or not eclass_credentials.get("username"):
                 logger.error(f"사용자 {user_id}의 이클래스 계정 정보를 찾을 수 없음")
                 return None
 
             eclass_id = eclass_credentials["username"]
 
-            base_url = "https://eclass.seoultech.ac.kr"
+            base_url = settings.ECLASS_BASE_URL.rstrip("/")
             material_url = f"{base_url}/lecture_material/lecture_material_list.jsp?ud={eclass_id}&ky={course_id}"
             
-            response = await eclass_session.get(material_url)
+            with timer.stage("list_fetch"):
+                response = await eclass_session.get(material_url)
             if not response:
                 logger.error("강의자료 목록 요청 실패")
                 result["errors"] += 1
                 return result
             
             # 3. 목록 파싱
-            materials = self.parser.parse_list(response.text)
+            # 목록 HTML이 지난번과 같으면 캐시된 결과 사용 (기존 게시글은 아래에서 건너뜀)
+            with timer.stage("list_parse"):
+                materials, _ = await self.parse_cache.parse(
+                    self.parser_executor, self.parser, "parse_list", response.text
+                )
             if not materials:
                 logger.info(f"강의 {course_id}의 강의자료가 없습니다.")
                 return result
             
             # 4. 기존 강의자료 조회
-            existing_materials = await self.repository.get_by_course_id(db, course_id)
-            existing_article_ids = {material.article_id for material in existing_materials}
+            # 상세 페이지 재요청을 피하기 위한 조회이며, 중복 방지는 upsert가 보장
+            with timer.stage("db_diff"):
+                existing_article_ids = await self.repository.get_article_ids(db, course_id)
             
-            # 5. 각 강의자료 처리
+            # 5. 각 강의자료 처리 (새 강의자료는 모아서 한 번에 저장)
+            pending = []  # (material_data, attachments)
             for material in materials:
                 result["count"] += 1
                 article_id = material.get("article_id")
@@ -110,7 +130,8 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
                     
                     # 상세 페이지 요청
                     detail_url = material.get("url")
-                    detail_response = await eclass_session.get(detail_url)
+                    with timer.stage("detail_fetch"):
+                        detail_response = await eclass_session.get(detail_url)
                     if not detail_response:
                         logger.error(f"강의자료 상세 정보 요청 실패: {article_id}")
                         result["errors"] += 1
@@ -120,13 +141,15 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
                     material_detail = await self.parser.parse_detail_with_attachments(
                         eclass_session, 
                         detail_response.text, 
-                        course_id
+                        course_id,
+                        executor=self.parser_executor,
+                        timer=timer
                     )
                     
                     # 기본 필드 정보 병합
                     material.update(material_detail)
                     
-                    # DB 저장
+                    # DB 저장 데이터 (아래에서 일괄 저장)
                     material_data = {
                         'article_id': article_id,
                         'course_id': course_id,
@@ -138,54 +161,92 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
                         'views': material.get('views'),
                         'video_url': material_detail.get('video_url', '')
                     }
-                    
-                    created_material = await self.repository.create(db, material_data)
-                    result["new"] += 1
-                    
-                    # 첨부파일 처리
-                    if auto_download and material.get("attachments"):
-                        attachment_count = await self._process_attachments(
-                            db,
-                            eclass_session,
-                            material["attachments"],
-                            created_material.id,
-                            course_id
-                        )
-                        logger.info(f"처리된 첨부파일 수: {attachment_count}")
+                    pending.append((material_data, material.get("attachments") or []))
+                    # 같은 목록에 중복 게시글이 있으면 한 번만 저장 (upsert는 같은 키를 두 번 갱신할 수 없음)
+                    existing_article_ids.add(article_id)
                     
                 except Exception as e:
                     logger.error(f"강의자료 {article_id} 처리 중 오류: {str(e)}")
                     result["errors"] += 1
             
+            if not pending:
+                return result
+            
+            # 6. DB 일괄 저장 (강의당 1회 트랜잭션)
+            try:
+                with timer.stage("db_write"):
+                    upserted = await self.repository.upsert_articles(
+                        db, [material_data for material_data, _ in pending]
+                    )
+                # 반환 순서는 입력과 다르므로 키로 짝짓고, 다른 동기화가 먼저 저장한 게시글(충돌 후 갱신)은 제외
+                created_materials = {
+                    (row.course_id, row.article_id): row for row, inserted in upserted if inserted
+                }
+                result["new"] += len(created_materials)
+            except Exception as e:
+                logger.error(f"강의자료 일괄 저장 중 오류: {str(e)}")
+                await db.rollback()
+                result["errors"] += len(pending)
+                return result
+            
+            # 7. 첨부파일 처리 (메타데이터는 모아서 한 번에 저장)
+            if auto_download:
+                attachment_rows = []
+                for material_data, attachments in pending:
+                    created_material = created_materials.get((material_data["course_id"], material_data["article_id"]))
+                    if created_material is not None and attachments:
+                        attachment_rows.extend(await self._process_attachments(
+                            eclass_session,
+                            attachments,
+                            created_material.id,
+                            course_id,
+                            timer
+                        ))
+                
+                if attachment_rows:
+                    try:
+                        with timer.stage("db_write"):
+                            await self.attachment_repository.upsert_attachments(db, attachment_rows)
+                        logger.info(f"처리된 첨부파일 수: {len(attachment_rows)}")
+                    except Exception as e:
+                        logger.error(f"첨부파일 메타데이터 일괄 저장 중 오류: {str(e)}")
+                        await db.rollback()
+                        result["errors"] += 1
+            
             return result
             
         except Exception as e:
             logger.error(f"강의자료 크롤링 중 오류 발생: {str(e)}")
             result["errors"] += 1
             return result
+        finally:
+            # 중간에 반환한 경우에도 단계별 소요 시간 포함
+            result["timings"] = timer.to_dict()
 
+    @traced()
     async def _process_attachments(
             self,
-            db: AsyncSession,
             eclass_session,
             attachments: List[Dict[str, Any]],
             source_id: int,
-            course_id: str
-    ) -> int:
+            course_id: str,
+            timer: Optional[StageTimer] = None
+    ) -> List[Dict[str, Any]]:
         """
-        첨부파일 처리 및 저장
+        첨부파일 다운로드 및 업로드 (메타데이터 저장은 호출 측에서 일괄 처리)
 
         Args:
-            db: 데이터베이스 세션
             eclass_session: 이클래스 세션 객체
             attachments: 첨부파일 정보 목록
             source_id: 소스(강의자료) ID
             course_id: 강의 ID
+            timer: 단계별 소요 시간 기록기 (attachment_download, upload)
 
         Returns:
-            int: 처리된 첨부파일 수
+            List[Dict[str, Any]]: 저장할 첨부파일 메타데이터 목록
         """
-        count = 0
+        attachment_rows = []
+        timer = timer or StageTimer()
 
         # 첨부파일 저장소와 스토리지 서비스가 클래스에 없으면 추가
         if not hasattr(self, 'attachment_repository'):
@@ -212,7 +273,8 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
                 # 이클래스에서 파일 다운로드
                 try:
                     # GET 요청으로 파일 다운로드
-                    download_response = await eclass_session.get(original_url)
+                    with timer.stage("attachment_download"):
+                        download_response = await eclass_session.get(original_url)
                     if not download_response:
                         logger.error(f"파일 다운로드 실패: {file_name}")
                         continue
@@ -231,12 +293,13 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
                     continue
 
                 # 스토리지에 업로드
-                storage_path = await self.storage_service.upload_file(
-                    file_content,
-                    file_name,
-                    course_id,
-                    "materials"  # 콘텐츠 타입
-                )
+                with timer.stage("upload"):
+                    storage_path = await self.storage_service.upload_file(
+                        file_content,
+                        file_name,
+                        course_id,
+                        "materials"  # 콘텐츠 타입
+                    )
 
                 if not storage_path:
                     logger.error(f"파일 업로드 실패: {file_name}")
@@ -248,6 +311,7 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
                 attachment_data = {
                     "source_type": "materials",
                     "source_id": str(source_id),
+                    "material_id": source_id,
                     "file_name": file_name,
                     "file_size": file_size,
                     "content_type": attachment.get("content_type", ""),
@@ -256,12 +320,9 @@ class MaterialService(ContentService[Material, MaterialParser, MaterialRepositor
                     "course_id": course_id
                 }
 
-                # 데이터베이스에 저장
-                await self.attachment_repository.create(db, attachment_data)
-                count += 1
-                logger.info(f"첨부파일 메타데이터 저장 완료: {file_name}")
+                attachment_rows.append(attachment_data)
 
             except Exception as e:
                 logger.error(f"첨부파일 '{attachment.get('file_name', '알 수 없음')}' 처리 중 오류: {str(e)}")
 
-        return count
\ No newline at end of file
+        return attachment_rows
\ No newline at end of file
@@ -1,11 +1,16 @@
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.content.content_service import ContentService
 from app.services.session import EclassSessionManager
 from app.services.parsers.notice_parser import NoticeParser
+from app.services.parsers.executor import ParserExecutor
+from app.services.parsers.cache import ParseCache
+from app.core.config import settings
+from app.core.tracing import traced
+from app.utils.timing import StageTimer
 from app.services.storage.storage_service import StorageService
 from app.db.repositories.notice_repository import NoticeRepository
 from app.db.repositories.attachment_repository import AttachmentRepository
@@ -22,14 +27,20 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
         notice_parser: NoticeParser,
         notice_repository: NoticeRepository,
         attachment_repository: AttachmentRepository,
-        storage_service: StorageService
+        storage_service: StorageService,
+        parser_executor: Optional[ParserExecutor] = None,
+        parse_cache: Optional[ParseCache] = None
     ):
         super().__init__(
             eclass_session,
             notice_parser,
             notice_repository,
-            content_type="notices"
+            content_type="notices",
+            parser_executor=parser_executor,
+            parse_cache=parse_cache
         )
+        self.attachment_repository = attachment_repository
+        self.storage_service = storage_service
     
     async def get_notices(self, user_id: str, course_id: str, db: AsyncSession) -> List[Notice]:
         """
@@ -69,6 +80,7 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
             logger.error(f"공지사항 조회 중 오류: {str(e)}")
             return []
     
+    @traced()
     async def refresh_all(
         self, 
         db: AsyncSession, 
@@ -89,17 +101,19 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
             Dict[str, Any]: 새로고침 결과
         """
         result = {"count": 0, "new": 0, "errors": 0}
+        timer = StageTimer()
         
         try:
             # 1. 세션 가져오기
-            eclass_session = await self.session_service.get_session(user_id)
+            with timer.stage("session"):
+                eclass_session = await self.session_service.get_session(user_id)
             if not eclass_session:
                 logger.error(f"이클래스 세션을 가져올 수 없음")
                 result["errors"] += 1
                 return result
             
             # 2. 공지사항 목록 페이지 접근
-            base_url = "https://eclass.seoultech.ac.kr"
+            base_url = settings.ECLASS_BASE_URL.rstrip("/")
             notice_url = f"{base_url}/notice/notice_list.jsp?ud={user_id}&ky={course_id}"
             
             data = {
@@ -111,23 +125,30 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                 'encoding': 'utf-8'
             }
             
-            response = await eclass_session.post(notice_url, data=data)
+            with timer.stage("list_fetch"):
+                response = await eclass_session.post(notice_url, data=data)
             if not response:
                 logger.error("공지사항 목록 요청 실패")
                 result["errors"] += 1
                 return result
             
             # 3. 목록 파싱
-            notices = self.parser.parse_list(response.text)
+            # 목록 HTML이 지난번과 같으면 캐시된 결과 사용 (기존 게시글은 아래에서 건너뜀)
+            with timer.stage("list_parse"):
+                notices, _ = await self.parse_cache.parse(
+                    self.parser_executor, self.parser, "parse_list", response.text
+                )
             if not notices:
                 logger.info(f"강의 {course_id}의 공지사항이 없습니다.")
                 return result
             
             # 4. 기존 공지사항 조회
-            existing_notices = await self.repository.get_by_course_id(db, course_id)
-            existing_article_ids = {notice.article_id for notice in existing_notices}
+            # 상세 페이지 재요청을 피하기 위한 조회이며, 중복 방지는 upsert가 보장
+            with timer.stage("db_diff"):
+                existing_article_ids = await self.repository.get_article_ids(db, course_id)
             
-            # 5. 각 공지사항 처리
+            # 5. 각 공지사항 처리 (새 공지사항은 모아서 한 번에 저장)
+            pending = []  # (notice_data, attachments)
             for notice in notices:
                 result["count"] += 1
                 article_id = notice.get("article_id")
@@ -143,7 +164,8 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                     
                     # 상세 페이지 요청
                     detail_url = notice.get("url")
-                    detail_response = await eclass_session.get(detail_url)
+                    with timer.stage("detail_fetch"):
+                        detail_response = await eclass_session.get(detail_url)
                     if not detail_response:
                         logger.error(f"공지사항 상세 정보 요청 실패: {article_id}")
                         result["errors"] += 1
@@ -153,13 +175,15 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                     notice_detail = await self.parser.parse_detail_with_attachments(
                         eclass_session, 
                         detail_response.text, 
-                        course_id
+                        course_id,
+                        executor=self.parser_executor,
+                        timer=timer
                     )
                     
                     # 기본 필드 정보 병합
                     notice.update(notice_detail)
                     
-                    # DB 저장
+                    # DB 저장 데이터 (아래에서 일괄 저장)
                     notice_data = {
                         'article_id': article_id,
                         'course_id': course_id,
@@ -170,54 +194,92 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                         'date': notice.get('date'),
                         'views': notice.get('views'),
                     }
-                    
-                    created_notice = await self.repository.create(db, notice_data)
-                    result["new"] += 1
-                    
-                    # 첨부파일 처리
-                    if auto_download and notice.get("attachments"):
-                        attachment_count = await self._process_attachments(
-                            db,
-                            eclass_session,
-                            notice["attachments"],
-                            created_notice.id,
-                            course_id
-                        )
-                        logger.info(f"처리된 첨부파일 수: {attachment_count}")
+                    pending.append((notice_data, notice.get("attachments") or []))
+                    # 같은 목록에 중복 게시글이 있으면 한 번만 저장 (upsert는 같은 키를 두 번 갱신할 수 없음)
+                    existing_article_ids.add(article_id)
                     
                 except Exception as e:
                     logger.error(f"공지사항 {article_id} 처리 중 오류: {str(e)}")
                     result["errors"] += 1
             
+            if not pending:
+                return result
+            
+            # 6. DB 일괄 저장 (강의당 1회 트랜잭션)
+            try:
+                with timer.stage("db_write"):
+                    upserted = await self.repository.upsert_articles(
+                        db, [notice_data for notice_data, _ in pending]
+                    )
+                # 반환 순서는 입력과 다르므로 키로 짝짓고, 다른 동기화가 먼저 저장한 게시글(충돌 후 갱신)은 제외
+                created_notices = {
+                    (row.course_id, row.article_id): row for row, inserted in upserted if inserted
+                }
+                result["new"] += len(created_notices)
+            except Exception as e:
+                logger.error(f"공지사항 일괄 저장 중 오류: {str(e)}")
+                await db.rollback()
+                result["errors"] += len(pending)
+                return result
+            
+            # 7. 첨부파일 처리 (메타데이터는 모아서 한 번에 저장)
+            if auto_download:
+                attachment_rows = []
+                for notice_data, attachments in pending:
+                    created_notice = created_notices.get((notice_data["course_id"], notice_data["article_id"]))
+                    if created_notice is not None and attachments:
+                        attachment_rows.extend(await self._process_attachments(
+                            eclass_session,
+                            attachments,
+                            created_notice.id,
+                            course_id,
+                            timer
+                        ))
+                
+                if attachment_rows:
+                    try:
+                        with timer.stage("db_write"):
+                            await self.attachment_repository.upsert_attachments(db, attachment_rows)
+                        logger.info(f"처리된 첨부파일 수: {len(attachment_rows)}")
+                    except Exception as e:
+                        logger.error(f"첨부파일 메타데이터 일괄 저장 중 오류: {str(e)}")
+                        await db.rollback()
+                        result["errors"] += 1
+            
             return result
             
         except Exception as e:
             logger.error(f"공지사항 크롤링 중 오류 발생: {str(e)}")
             result["errors"] += 1
             return result
+        finally:
+            # 중간에 반환한 경우에도 단계별 소요 시간 포함
+            result["timings"] = timer.to_dict()
 
+    @traced()
     async def _process_attachments(
             self,
-            db: AsyncSession,
             eclass_session,
             attachments: List[Dict[str, Any]],
             source_id: int,
-            course_id: str
-    ) -> int:
+            course_id: str,
+            timer: Optional[StageTimer] = None
+    ) -> List[Dict[str, Any]]:
         """
-        첨부파일 처리 및 저장
+        첨부파일 다운로드 및 업로드 (메타데이터 저장은 호출 측에서 일괄 처리)
 
         Args:
-            db: 데이터베이스 세션
             eclass_session: 이클래스 세션 객체
             attachments: 첨부파일 정보 목록
-            source_id: 소스(강의자료) ID
+            source_id: 소스(공지사항) ID
             course_id: 강의 ID
+            timer: 단계별 소요 시간 기록기 (attachment_download, upload)
 
         Returns:
-            int: 처리된 첨부파일 수
+            List[Dict[str, Any]]: 저장할 첨부파일 메타데이터 목록
         """
-        count = 0
+        attachment_rows = []
+        timer = timer or StageTimer()
 
         # 첨부파일 저장소와 스토리지 서비스가 클래스에 없으면 추가
         if not hasattr(self, 'attachment_repository'):
@@ -244,7 +306,8 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                 # 이클래스에서 파일 다운로드
                 try:
                     # GET 요청으로 파일 다운로드
-                    download_response = await eclass_session.get(original_url)
+                    with timer.stage("attachment_download"):
+                        download_response = await eclass_session.get(original_url)
                     if not download_response:
                         logger.error(f"파일 다운로드 실패: {file_name}")
                         continue
@@ -263,12 +326,13 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                     continue
 
                 # 스토리지에 업로드
-                storage_path = await self.storage_service.upload_file(
-                    file_content,
-                    file_name,
-                    course_id,
-                    "materials"  # 콘텐츠 타입
-                )
+                with timer.stage("upload"):
+                    storage_path = await self.storage_service.upload_file(
+                        file_content,
+                        file_name,
+                        course_id,
+                        "materials"  # 콘텐츠 타입
+                    )
 
                 if not storage_path:
                     logger.error(f"파일 업로드 실패: {file_name}")
@@ -278,8 +342,9 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
 
                 # 첨부파일 메타데이터 저장
                 attachment_data = {
-                    "source_type": "materials",
+                    "source_type": "notices",
                     "source_id": str(source_id),
+                    "notice_id": source_id,
                     "file_name": file_name,
                     "file_size": file_size,
                     "content_type": attachment.get("content_type", ""),
@@ -288,12 +353,9 @@ class NoticeService(ContentService[Notice, NoticeParser, NoticeRepository]):
                     "course_id": course_id
                 }
 
-                # 데이터베이스에 저장
-                await self.attachment_repository.create(db, attachment_data)
-                count += 1
-                logger.info(f"첨부파일 메타데이터 저장 완료: {file_name}")
+                attachment_rows.append(attachment_data)
 
             except Exception as e:
                 logger.error(f"첨부파일 '{attachment.get('file_name', '알 수 없음')}' 처리 중 오류: {str(e)}")
 
-        return count
\ No newline at end of file
+        return attachment_rows
\ No newline at end of file
@@ -6,11 +6,34 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.base_service import BaseService
 from app.services.session.eclass_session_manager import EclassSessionManager
 from app.services.parsers.syllabus_parser import SyllabusParser
+from app.services.parsers.executor import ParserExecutor
+from app.services.parsers.cache import ParseCache
+from app.core.config import settings
+from app.core.tracing import traced
+from app.utils.timing import StageTimer
+from app.utils.hashing import content_hash
 from app.db.repositories.syllabus_repository import SyllabusRepository
 from app.services.auth_service import AuthService
 
 logger = logging.getLogger(__name__)
 
+# Syllabus 컬럼별로 찾을 강의계획서 항목 이름 (앞에 있는 이름 우선, 학기/학과마다 표기가 조금씩 다름)
+SYLLABUS_COLUMN_LABELS = {
+    'year_semester': ('년도/학기', '연도/학기', '개설학기', '학기'),
+    'course_type': ('이수구분', '교과구분', '과목구분'),
+    'professor_name': ('성명', '담당교수', '교수명'),
+    'office_hours': ('면담시간', '상담시간', '면담가능시간'),
+    'homepage': ('홈페이지',),
+    'course_overview': ('교과목개요', '강의개요', '수업개요'),
+    'objectives': ('강의목표', '수업목표', '교과목표'),
+    'textbooks': ('교재', '교재 및 참고문헌', '주교재', '참고문헌'),
+    'equipment': ('기자재', '수업기자재', '준비물'),
+    'evaluation_method': ('평가방법', '성적평가', '평가기준'),
+}
+
+# 항목 이름으로 값을 찾을 섹션 (parse_syllabus 결과의 키)
+SYLLABUS_INFO_SECTIONS = ('수업기본정보', '담당교수정보', '강의계획')
+
 class SyllabusService(BaseService):
     """강의계획서 관련 서비스"""
     
@@ -19,12 +42,18 @@ class SyllabusService(BaseService):
         eclass_session: EclassSessionManager,
         syllabus_parser: SyllabusParser,
         syllabus_repository: SyllabusRepository,
-        auth_service: AuthService
+        auth_service: AuthService,
+        parser_executor: Optional[ParserExecutor] = None,
+        parse_cache: Optional[ParseCache] = None
     ):
         self.eclass_session_service = eclass_session
         self.parser = syllabus_parser
         self.repository = syllabus_repository
         self.auth_service = auth_service
+        # 파싱 실행기 (없으면 이벤트 루프에서 바로 파싱)
+        self.parser_executor = parser_executor or ParserExecutor()
+        # 파싱 결과 캐시 (없으면 캐시 없이 매번 파싱)
+        self.parse_cache = parse_cache or ParseCache(max_entries=0)
         logger.info("SyllabusService 초기화 완료")
     
     async def initialize(self) -> None:
@@ -37,12 +66,14 @@ class SyllabusService(BaseService):
         logger.info("SyllabusService 종료")
         pass
     
+    @traced()
     async def get_syllabus(
         self, 
         user_id: str, 
         course_id: str, 
         db: AsyncSession, 
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        timer: Optional[StageTimer] = None
     ) -> Optional[Dict[str, Any]]:
         """
         강의계획서 조회
@@ -52,10 +83,12 @@ class SyllabusService(BaseService):
             course_id: 강의 ID
             db: 데이터베이스 세션
             force_refresh: 강제 새로고침 여부
+            timer: 단계별 소요 시간 기록기 (강의계획서 페이지는 상세 페이지로 기록)
             
         Returns:
             Optional[Dict[str, Any]]: 강의계획서 정보
         """
+        timer = timer or StageTimer()
         logger.info(f"강의 {course_id}의 강의계획서 조회 시작 (user_id: {user_id})")
         
         # 이미 저장된 강의계획서 확인
@@ -68,13 +101,15 @@ class SyllabusService(BaseService):
         # 새로운 강의계획서 조회
         try:
             # 이클래스 세션 가져오기
-            eclass_session = await self.eclass_session_service.get_session(user_id)
+            with timer.stage("session"):
+                eclass_session = await self.eclass_session_service.get_session(user_id)
             if not eclass_session:
                 logger.error("이클래스 세션을 가져올 수 없음")
                 return None
 
             # 이클래스 ID 조회
-            eclass_credentials = await self.auth_service.get_user_eclass_credentials(user_id)
+            with timer.stage("session"):
+                eclass_credentials = await self.auth_service.get_user_eclass_credentials(user_id)
             if not eclass_credentials or not eclass_credentials.get("username"):
                 logger.error(f"사용자 {user_id}의 이클래스 계정 정보를 찾을 수 없음")
                 return None
@@ -82,33 +117,47 @@ class SyllabusService(BaseService):
             eclass_id = eclass_credentials["username"]
 
             # 강의계획서 URL 구성 및 요청
-            base_url = "https://eclass.seoultech.ac.kr"
+            base_url = settings.ECLASS_BASE_URL.rstrip("/")
             syllabus_url = f"{base_url}/lecture/course_info.jsp?ref=1&ud={eclass_id}&ky={course_id}"
             
-            response = await eclass_session.get(syllabus_url)
+            with timer.stage("detail_fetch"):
+                response = await eclass_session.get(syllabus_url)
             if not response:
                 logger.error(f"강의계획서 페이지 요청 실패 (course_id: {course_id})")
                 return None
             
             # 강의계획서 파싱
-            syllabus_data = self.parser.parse_syllabus(response.text)
+            with timer.stage("detail_parse"):
+                syllabus_data, _ = await self.parse_cache.parse(
+                    self.parser_executor, self.parser, "parse_syllabus", response.text
+                )
             if not syllabus_data:
                 logger.warning(f"강의계획서 파싱 결과 없음 (course_id: {course_id})")
                 return None
             
-            # JSON 형태로 변환
+            # Syllabus 컬럼으로 변환 (해시는 실제로 저장하는 값으로 계산)
+            columns = self._to_columns(syllabus_data)
             syllabus_json = {
                 'course_id': course_id,
-                'content': syllabus_data
+                **columns,
+                'content_hash': content_hash(columns)
             }
             
             # 저장소에 저장
-            existing_syllabus = await self.repository.get_by_course_id(db, course_id)
-            if existing_syllabus:
-                updated_syllabus = await self.repository.update(db, existing_syllabus.id, syllabus_json)
+            with timer.stage("db_diff"):
+                existing_syllabus = await self.repository.get_by_course_id(db, course_id)
+            if existing_syllabus and existing_syllabus.content_hash == syllabus_json['content_hash']:
+                # 파싱 결과가 DB에 마지막으로 저장한 내용과 같으면 쓰기 생략
+                # (파싱 캐시 적중 여부는 DB 내용과 무관하므로 판단에 쓰지 않음)
+                logger.info(f"강의계획서 변경 없음 (course_id: {course_id})")
+                saved_syllabus = existing_syllabus
+            elif existing_syllabus:
+                with timer.stage("db_write"):
+                    updated_syllabus = await self.repository.update(db, existing_syllabus.id, syllabus_json)
                 saved_syllabus = updated_syllabus
             else:
-                saved_syllabus = await self.repository.create(db, syllabus_json)
+                with timer.stage("db_write"):
+                    saved_syllabus = await self.repository.create(db, syllabus_json)
             
             logger.info(f"강의계획서 조회 완료 (course_id: {course_id})")
             return saved_syllabus.to_dict() if hasattr(saved_syllabus, 'to_dict') else vars(saved_syllabus)
@@ -117,6 +166,29 @@ class SyllabusService(BaseService):
             logger.error(f"강의계획서 조회 중 오류 발생: {str(e)}")
             return None
     
+    @staticmethod
+    def _to_columns(syllabus_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        parse_syllabus 결과(섹션별 항목 dict와 주별 계획 목록)를 Syllabus 컬럼 값으로 변환
+
+        Args:
+            syllabus_data: 파싱된 강의계획서
+
+        Returns:
+            Dict[str, Any]: 컬럼 이름과 값 (찾지 못한 항목은 None)
+        """
+        info: Dict[str, str] = {}
+        for section in SYLLABUS_INFO_SECTIONS:
+            for label, value in (syllabus_data.get(section) or {}).items():
+                info.setdefault(label, value)
+
+        columns = {
+            column: next((info[label] for label in labels if info.get(label)), None)
+            for column, labels in SYLLABUS_COLUMN_LABELS.items()
+        }
+        columns['weekly_plans'] = syllabus_data.get('주별강의계획') or []
+        return columns
+
     async def refresh_syllabus(self, user_id: str, course_id: str, db: AsyncSession) -> Dict[str, Any]:
         """
         강의계획서 새로고침
@@ -130,10 +202,11 @@ class SyllabusService(BaseService):
             Dict[str, Any]: 새로고침 결과
         """
         result = {"count": 0, "success": 0, "errors": 0}
+        timer = StageTimer()
         
         try:
             result["count"] = 1
-            syllabus = await self.get_syllabus(user_id, course_id, db, force_refresh=True)
+            syllabus = await self.get_syllabus(user_id, course_id, db, force_refresh=True, timer=timer)
             
             if syllabus:
                 result["success"] = 1
@@ -145,6 +218,7 @@ class SyllabusService(BaseService):
             result["count"] = 1
             result["errors"] = 1
         
+        result["timings"] = timer.to_dict()
         return result
         
     async def refresh_all(self, db: AsyncSession, course_id: str, user_id: str) -> Dict[str, Any]:
@@ -167,5 +241,6 @@ class SyllabusService(BaseService):
         return {
             "count": result.get("count", 0),
             "new": result.get("success", 0),
-            "errors": result.get("errors", 0)
+            "errors": result.get("errors", 0),
+            "timings": result.get("timings", {})
         }
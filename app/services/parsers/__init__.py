@@ -1,3 +1,6 @@
+from app.services.parsers.document import ParsedDocument
+from app.services.parsers.executor import ParserExecutor
+from app.services.parsers.cache import ParseCache
 from app.services.parsers.content_parser import ContentParser
 from app.services.parsers.course_parser import CourseParser
 from app.services.parsers.notice_parser import NoticeParser
@@ -6,6 +9,9 @@ from app.services.parsers.assignment_parser import AssignmentParser
 from app.services.parsers.syllabus_parser import SyllabusParser
 
 __all__ = [
+    'ParsedDocument',
+    'ParserExecutor',
+    'ParseCache',
     'ContentParser',
     'CourseParser',
     'NoticeParser',
@@ -1,11 +1,15 @@
-from typing import List, Dict, Any
-import re
+from typing import List, Dict, Any, Union
 import logging
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from app.services.parsers.content_parser import ContentParser
+from app.services.parsers import patterns
+from app.services.parsers.document import ParsedDocument
 
 logger = logging.getLogger(__name__)
 
+# 목록 페이지에서는 과제 테이블만 트리로 만듦 (내비게이션, 스크립트 등 제외)
+ASSIGNMENT_TABLE_STRAINER = SoupStrainer('table', class_='table_topic')
+
 class AssignmentParser(ContentParser):
     """과제 파싱 클래스"""
     
@@ -15,7 +19,7 @@ class AssignmentParser(ContentParser):
             if not html:
                 return []
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_document(html, parse_only=ASSIGNMENT_TABLE_STRAINER).soup
             # 과제 테이블 찾기
             assignment_table = soup.find('table', class_='table_topic')
             if not assignment_table:
@@ -62,13 +66,14 @@ class AssignmentParser(ContentParser):
             logger.error(f"과제 목록 파싱 중 오류 발생: {e}")
             return []
     
-    def parse_detail(self, html: str) -> Dict[str, Any]:
+    def parse_detail(self, html: Union[str, ParsedDocument]) -> Dict[str, Any]:
         """과제 상세 내용 파싱"""
         try:
             if not html:
                 return {}
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            doc = self.parse_document(html)
+            soup = doc.soup
             detail = {}
             
             # 과제 테이블 찾기
@@ -88,7 +93,7 @@ class AssignmentParser(ContentParser):
                     
             # 마감일 추출 (상세 페이지에서 다시 확인)
             due_date = ""
-            due_date_label = soup.find(string=re.compile('마감일|제출기한'))
+            due_date_label = soup.find(string=patterns.DUE_DATE_LABEL)
             if due_date_label and due_date_label.parent:
                 due_date_elem = due_date_label.parent.find_next_sibling()
                 if due_date_elem:
@@ -96,21 +101,21 @@ class AssignmentParser(ContentParser):
                     
             # 점수 정보 추출
             score_info = {}
-            score_label = soup.find(string=re.compile('배점|점수'))
+            score_label = soup.find(string=patterns.SCORE_LABEL)
             if score_label and score_label.parent:
                 score_elem = score_label.parent.find_next_sibling()
                 if score_elem:
                     score_info['max_score'] = self.clean_text(score_elem.text)
                     
             # 내 점수 정보 추출 (제출한 경우)
-            my_score_label = soup.find(string=re.compile('내 점수|획득 점수'))
+            my_score_label = soup.find(string=patterns.MY_SCORE_LABEL)
             if my_score_label and my_score_label.parent:
                 my_score_elem = my_score_label.parent.find_next_sibling()
                 if my_score_elem:
                     score_info['my_score'] = self.clean_text(my_score_elem.text)
                     
             # 기본 첨부파일 추출 (페이지에 있는 경우)
-            attachments = self.parse_attachments(html)
+            attachments = self.parse_attachments(doc)
             
             # 결과 취합
             if due_date:
@@ -0,0 +1,163 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.services.parsers.executor import ParserExecutor
+
+logger = logging.getLogger(__name__)
+
+# (파서 메서드 이름, 파서 버전, HTML의 sha256)
+CacheKey = Tuple[str, str, str]
+
+
+class ParseCache:
+    """
+    파싱 결과 캐시.
+    응답 HTML이 바이트 단위로 같으면 이전 파싱 결과를 그대로 돌려주어 다시 파싱하지 않습니다.
+
+    - 키: (파서 메서드, 파서 버전 + 백엔드 + e-Class 주소, HTML의 sha256)
+      파서 출력이 바뀌면 파서의 PARSER_VERSION을 올려 이전 항목이 쓰이지 않도록 하세요.
+    - 메모리: max_entries개까지 보관하며 가장 오래 쓰지 않은 항목부터 제거 (LRU)
+    - 디스크(선택): disk_dir을 지정하면 메모리에서 빠진 항목도 파일에서 다시 읽음
+
+    결과는 JSON 문자열로 보관하므로 호출자가 돌려받은 dict/list를 수정해도 캐시는 바뀌지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 512, disk_dir: Optional[str] = None):
+        # max_entries가 0이고 disk_dir도 없으면 캐시를 쓰지 않고 항상 파싱
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self._entries: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or bool(self.disk_dir)
+
+    @staticmethod
+    def make_key(parser: Any, method: str, html: str) -> CacheKey:
+        """파서 인스턴스, 메서드 이름, HTML로 캐시 키 생성"""
+        version = f"{getattr(parser, 'PARSER_VERSION', '0')}-{getattr(parser, 'backend', '')}"
+        base_url = getattr(parser, 'base_url', None)
+        if base_url:
+            # 절대 URL을 만드는 파서는 e-Class 주소에 따라 결과가 달라짐
+            version += f"-{hashlib.sha256(base_url.encode('utf-8')).hexdigest()[:8]}"
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        return f"{type(parser).__name__}.{method}", version, digest
+
+    def _disk_path(self, key: CacheKey) -> str:
+        name, version, digest = key
+        return os.path.join(self.disk_dir, name, version, f"{digest}.json")
+
+    def _read_disk(self, key: CacheKey) -> Optional[str]:
+        try:
+            with open(self._disk_path(key), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"파싱 캐시 파일 읽기 실패: {e}")
+            return None
+
+    def _write_disk(self, key: CacheKey, payload: str) -> None:
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 다른 워커가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"파싱 캐시 파일 쓰기 실패: {e}")
+
+    def _remember(self, key: CacheKey, payload: str) -> None:
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """메모리에서 조회 (없으면 None)"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+        return json.loads(payload) if payload is not None else None
+
+    def put(self, key: CacheKey, value: Any) -> Optional[str]:
+        """
+        메모리에 저장하고 직렬화된 결과 반환
+        JSON으로 직렬화할 수 없는 결과는 저장하지 않고 None을 반환합니다.
+        """
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        self._remember(key, payload)
+        return payload
+
+    async def parse(
+        self, executor: ParserExecutor, parser: Any, method: str, html: str
+    ) -> Tuple[Any, bool]:
+        """
+        캐시를 거쳐 파싱
+
+        Args:
+            executor: 캐시에 없을 때 파싱을 실행할 실행기
+            parser: 파서 인스턴스
+            method: 파서 메서드 이름 (예: 'parse_list')
+            html: 응답 HTML
+
+        Returns:
+            Tuple[Any, bool]: (파싱 결과, 캐시 적중 여부)
+        """
+        if not self.enabled:
+            return await executor.run(getattr(parser, method), html), False
+
+        key = self.make_key(parser, method, html)
+
+        cached = self.get(key)
+        if cached is None and self.disk_dir:
+            payload = await asyncio.to_thread(self._read_disk, key)
+            if payload is not None:
+                self._remember(key, payload)
+                cached = json.loads(payload)
+
+        if cached is not None:
+            self.hits += 1
+            logger.debug(f"파싱 캐시 적중: {key[0]} {key[2][:12]}")
+            return cached, True
+
+        self.misses += 1
+        result = await executor.run(getattr(parser, method), html)
+
+        # 빈 결과는 파싱 실패일 수 있으므로 저장하지 않음
+        if result:
+            payload = self.put(key, result)
+            if payload is not None and self.disk_dir:
+                await asyncio.to_thread(self._write_disk, key, payload)
+        return result, False
+
+    def clear(self) -> None:
+        """메모리 캐시 비우기 (디스크 파일은 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """캐시 상태"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_dir": self.disk_dir,
+        }
@@ -1,33 +1,62 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-import re
-from bs4 import BeautifulSoup
+from typing import List, Dict, Any, Optional, Union
 import logging
+from bs4 import SoupStrainer
+
+from app.services.parsers import patterns
+from app.services.parsers.document import ParsedDocument, DEFAULT_BACKEND, resolve_backend
+from app.services.parsers.executor import ParserExecutor
+from app.utils.timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
+# e-Class 기본 주소 (실제 값은 settings.ECLASS_BASE_URL로 주입)
+DEFAULT_BASE_URL = "https://eclass.seoultech.ac.kr"
+
+# 실행기를 넘기지 않은 호출은 이벤트 루프에서 바로 파싱
+INLINE_EXECUTOR = ParserExecutor("none")
+
 class ContentParser(ABC):
     """
     콘텐츠 파싱을 위한 추상 기본 클래스.
     공지사항, 강의자료, 과제 등 콘텐츠 파싱을 위한 공통 메서드를 정의합니다.
+    추출 메서드는 HTML 문자열 또는 ParsedDocument를 받으며, 같은 응답은 한 번만 파싱합니다.
     """
+
+    # 파싱 결과 형식이 바뀌면 올릴 것 (ParseCache 키에 포함되어 이전 캐시 항목을 무효화)
+    PARSER_VERSION = "2"
+
+    def __init__(self, backend: str = DEFAULT_BACKEND, base_url: str = DEFAULT_BASE_URL):
+        # BeautifulSoup 트리 빌더 ('html.parser' 또는 'lxml')
+        self.backend = resolve_backend(backend)
+        # 상대 URL을 절대 URL로 바꿀 때 사용할 e-Class 주소 (settings.ECLASS_BASE_URL)
+        self.base_url = base_url.rstrip('/')
+
+    def parse_document(
+        self, source: Union[str, ParsedDocument], parse_only: Optional[SoupStrainer] = None
+    ) -> ParsedDocument:
+        """
+        HTML 문자열을 ParsedDocument로 변환 (이미 파싱된 문서는 그대로 반환)
+        parse_only를 주면 필요한 요소만 트리로 만들어 목록 페이지의 메모리/CPU 사용을 줄입니다.
+        """
+        return ParsedDocument.of(source, self.backend, parse_only)
     
     def clean_text(self, text: str) -> str:
         """HTML에서 추출한 텍스트 정리"""
         if not text:
             return ""
         # 공백 문자 정리
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = patterns.WHITESPACE.sub(' ', text.strip())
         # HTML 엔티티 변환
         text = text.replace('&nbsp;', ' ').replace('&lt;', '<').replace('&gt;', '>')
         return text
     
-    def extract_table_data(self, html: str, selector: str) -> List[Dict[str, Any]]:
+    def extract_table_data(self, html: Union[str, ParsedDocument], selector: str) -> List[Dict[str, Any]]:
         """HTML 테이블에서 데이터 추출"""
         if not html:
             return []
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self.parse_document(html).soup
         table = soup.select_one(selector)
         if not table:
             return []
@@ -66,26 +95,28 @@ class ContentParser(ABC):
             
         return result
     
-    def extract_content_seq(self, html: str) -> Optional[str]:
+    def extract_content_seq(self, html: Union[str, ParsedDocument]) -> Optional[str]:
         """CONTENT_SEQ 파라미터 추출"""
         if not html:
             return None
             
+        doc = self.parse_document(html)
+        
         # URL에서 추출 시도
-        url_match = re.search(r'CONTENT_SEQ=([^&]+)', html)
+        url_match = patterns.CONTENT_SEQ_IN_URL.search(doc.html)
         if url_match:
             return url_match.group(1)
             
         # 스크립트에서 추출 시도
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = doc.soup
         for script in soup.find_all('script'):
             if script.string and 'CONTENT_SEQ' in script.string:
-                match = re.search(r'CONTENT_SEQ\s*:\s*["\']([^"\',]+)', script.string)
+                match = patterns.CONTENT_SEQ_IN_SCRIPT.search(script.string)
                 if match:
                     return match.group(1)
                     
         # hidden input에서 추출 시도
-        seq_input = soup.select_one('input[name="CONTENT_SEQ"]')
+        seq_input = patterns.CONTENT_SEQ_INPUT.select_one(soup)
         if seq_input:
             return seq_input.get('value')
             
@@ -97,8 +128,8 @@ class ContentParser(ABC):
             return None
 
         # ARTL_NUM 또는 NORCT_NUM 파라미터 찾기
-        for param in ['ARTL_NUM', 'NORCT_NUM']:
-            match = re.search(fr'{param}=([\d]+)', url)
+        for param in patterns.ARTICLE_ID_PARAMS:
+            match = patterns.url_param_pattern(param).search(url)
             if match:
                 return match.group(1)
 
@@ -106,23 +137,22 @@ class ContentParser(ABC):
     
     def extract_url_from_onclick(self, onclick_value: str) -> str:
         """onclick 속성에서 URL 추출"""
-        match = re.search(r"pageMove\('([^']+)'(?:,\s*event)?", onclick_value)
+        match = patterns.PAGE_MOVE_URL.search(onclick_value)
         if match:
             url = match.group(1)
-            base_url = "https://eclass.seoultech.ac.kr"
             if not url.startswith('http'):
-                url = base_url + url
+                url = self.base_url + url
             return url
         return ""
     
-    def parse_attachments(self, html: str) -> List[Dict[str, Any]]:
+    def parse_attachments(self, html: Union[str, ParsedDocument]) -> List[Dict[str, Any]]:
         """첨부파일 정보 파싱"""
         attachments = []
         
         if not html:
             return attachments
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self.parse_document(html).soup
         
         # 첨부파일 링크 찾기
         for file_link in soup.find_all('a', href=lambda h: h and 'efile_download.acl' in h):
@@ -132,7 +162,7 @@ class ContentParser(ABC):
 
                 # 상대 URL인 경우 절대 URL로 변환
                 if file_url and not file_url.startswith('http'):
-                    file_url = f"https://eclass.seoultech.ac.kr{file_url}"
+                    file_url = f"{self.base_url}{file_url}"
 
                 attachment = {
                     'file_name': file_name,
@@ -140,7 +170,7 @@ class ContentParser(ABC):
                 }
                 
                 # FILE_SEQ 추출
-                file_seq_match = re.search(r'FILE_SEQ=([^&]+)', file_url)
+                file_seq_match = patterns.FILE_SEQ.search(file_url)
                 if file_seq_match:
                     attachment['file_seq'] = file_seq_match.group(1)
                 
@@ -153,7 +183,14 @@ class ContentParser(ABC):
                 
         return attachments
     
-    async def fetch_attachments_via_ajax(self, eclass_session, content_seq: str, course_id: str) -> List[Dict[str, Any]]:
+    async def fetch_attachments_via_ajax(
+        self,
+        eclass_session,
+        content_seq: str,
+        course_id: str,
+        executor: Optional[ParserExecutor] = None,
+        timer: Optional[StageTimer] = None
+    ) -> List[Dict[str, Any]]:
         """
         AJAX 요청을 통해 첨부파일 목록 가져오기
         
@@ -161,16 +198,19 @@ class ContentParser(ABC):
             eclass_session: E-Class 세션 객체
             content_seq: 콘텐츠 시퀀스 번호
             course_id: 강의 ID
+            executor: 파싱 실행기 (없으면 이벤트 루프에서 바로 파싱)
+            timer: 단계별 소요 시간 기록기 (요청은 detail_fetch, 파싱은 detail_parse)
             
         Returns:
             List[Dict[str, Any]]: 첨부파일 정보 목록
         """
         if not content_seq or not course_id or not eclass_session:
             return []
+        timer = timer or StageTimer()
             
         try:
             # AJAX 요청 URL 및 데이터
-            efile_list_url = "https://eclass.seoultech.ac.kr/ilos/co/efile_list.acl"
+            efile_list_url = f"{self.base_url}/ilos/co/efile_list.acl"
             form_data = {
                 'ky': course_id,
                 'pf_st_flag': '2',  # 학생 권한
@@ -179,14 +219,16 @@ class ContentParser(ABC):
             }
             
             # AJAX 요청 수행
-            response = await eclass_session.post(efile_list_url, data=form_data)
+            with timer.stage("detail_fetch"):
+                response = await eclass_session.post(efile_list_url, data=form_data)
             
             if not response or not response.text:
                 logger.error("첨부파일 목록 AJAX 요청 실패")
                 return []
                 
             # 첨부파일 정보 파싱
-            return self.parse_attachments(response.text)
+            with timer.stage("detail_parse"):
+                return await (executor or INLINE_EXECUTOR).run(self.parse_attachments, response.text)
             
         except Exception as e:
             logger.error(f"첨부파일 AJAX 요청 중 오류: {str(e)}")
@@ -198,11 +240,32 @@ class ContentParser(ABC):
         pass
     
     @abstractmethod
-    def parse_detail(self, html: str) -> Dict[str, Any]:
+    def parse_detail(self, html: Union[str, ParsedDocument]) -> Dict[str, Any]:
         """콘텐츠 상세 페이지 파싱"""
         pass
         
-    async def parse_detail_with_attachments(self, eclass_session, html: str, course_id: str) -> Dict[str, Any]:
+    def parse_detail_bundle(self, html: str) -> Dict[str, Any]:
+        """
+        상세 페이지에서 필요한 정보를 한 번의 파싱으로 모두 추출
+        HTML 문자열을 받아 dict만 반환하므로 프로세스 풀에서 실행할 수 있습니다.
+        
+        Returns:
+            Dict[str, Any]: {'detail': parse_detail 결과, 'content_seq': CONTENT_SEQ 또는 None}
+        """
+        # 응답 HTML은 한 번만 파싱하고 모든 추출기가 같은 문서를 공유
+        doc = self.parse_document(html)
+        detail = self.parse_detail(doc)
+        content_seq = None if detail.get('attachments') else self.extract_content_seq(doc)
+        return {'detail': detail, 'content_seq': content_seq}
+        
+    async def parse_detail_with_attachments(
+        self,
+        eclass_session,
+        html: str,
+        course_id: str,
+        executor: Optional[ParserExecutor] = None,
+        timer: Optional[StageTimer] = None
+    ) -> Dict[str, Any]:
         """
         첨부파일 정보를 포함한 콘텐츠 상세 페이지 파싱
         
@@ -210,23 +273,29 @@ class ContentParser(ABC):
             eclass_session: E-Class 세션 객체
             html: 파싱할 HTML 내용
             course_id: 강의 ID
+            executor: 파싱 실행기 (없으면 이벤트 루프에서 바로 파싱)
+            timer: 단계별 소요 시간 기록기 (파싱은 detail_parse, AJAX 요청은 detail_fetch)
             
         Returns:
             Dict[str, Any]: 파싱 결과 (첨부파일 정보 포함)
         """
+        executor = executor or INLINE_EXECUTOR
+        timer = timer or StageTimer()
+        result = {}
+        
         try:
-            # 기본 상세 정보 파싱
-            result = self.parse_detail(html)
+            # 기본 상세 정보와 CONTENT_SEQ를 한 번에 파싱
+            with timer.stage("detail_parse"):
+                bundle = await executor.run(self.parse_detail_bundle, html)
+            result = bundle['detail']
             
-            # 첨부파일이 이미 파싱되었는지 확인
-            if not result.get('attachments') or len(result['attachments']) == 0:
-                # CONTENT_SEQ 추출
-                content_seq = self.extract_content_seq(html)
+            # 첨부파일이 페이지에 없으면 AJAX 요청으로 가져오기
+            if not result.get('attachments'):
+                content_seq = bundle['content_seq']
                 
                 if content_seq:
-                    # AJAX 요청으로 첨부파일 정보 가져오기
                     attachments = await self.fetch_attachments_via_ajax(
-                        eclass_session, content_seq, course_id
+                        eclass_session, content_seq, course_id, executor, timer
                     )
                     
                     if attachments:
@@ -237,4 +306,4 @@ class ContentParser(ABC):
         except Exception as e:
             logger.error(f"첨부파일 정보 포함 상세 파싱 중 오류: {str(e)}")
             # 기본 파싱 결과라도 반환
-            return self.parse_detail(html)
+            return result
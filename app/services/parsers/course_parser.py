@@ -1,11 +1,16 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import re
-from bs4 import BeautifulSoup
 import logging
-from app.services.parsers.content_parser import ContentParser
+from bs4 import SoupStrainer
+from app.services.parsers.content_parser import ContentParser, INLINE_EXECUTOR
+from app.services.parsers.executor import ParserExecutor
+from app.utils.timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
+# 목록 페이지에서는 강의 항목만 트리로 만듦 (내비게이션, 스크립트 등 제외)
+COURSE_ITEM_STRAINER = SoupStrainer('li', style=lambda value: value and 'background: url' in value)
+
 class CourseParser(ContentParser):
     """강의 정보 파싱 클래스"""
     
@@ -15,7 +20,7 @@ class CourseParser(ContentParser):
             if not html:
                 return []
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_document(html, parse_only=COURSE_ITEM_STRAINER).soup
             course_elements = soup.find_all('li', style=lambda value: value and 'background: url' in value)
             
             courses = []
@@ -72,7 +77,7 @@ class CourseParser(ContentParser):
             if not html:
                 return {}
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_document(html).soup
             menus = {}
             
             # 메뉴 매핑 정의
@@ -112,9 +117,13 @@ class CourseParser(ContentParser):
             logger.error(f"강의 메뉴 파싱 중 오류 발생: {e}")
             return {}
             
-    async def parse_detail_with_attachments(self, eclass_session, html: str, course_id: str) -> Dict[str, Any]:
+    async def parse_detail_with_attachments(
+        self, eclass_session, html: str, course_id: str, executor: Optional[ParserExecutor] = None,
+        timer: Optional[StageTimer] = None
+    ) -> Dict[str, Any]:
         """
         첨부파일 정보를 포함한 강의 상세 페이지 파싱
         (강의에는 첨부파일이 없으므로 기본 parse_detail을 사용)
         """
-        return self.parse_detail(html)
+        with (timer or StageTimer()).stage("detail_parse"):
+            return await (executor or INLINE_EXECUTOR).run(self.parse_detail, html)
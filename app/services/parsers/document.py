@@ -0,0 +1,60 @@
+import logging
+from typing import Optional, Union
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# BeautifulSoup 트리 빌더 백엔드
+DEFAULT_BACKEND = "html.parser"
+SUPPORTED_BACKENDS = ("html.parser", "lxml")
+
+
+def resolve_backend(backend: str = DEFAULT_BACKEND) -> str:
+    """
+    사용할 HTML 파서 백엔드 결정
+    지원하지 않는 이름이거나 lxml이 설치되지 않은 경우 기본 백엔드(html.parser)를 사용합니다.
+    """
+    if backend not in SUPPORTED_BACKENDS:
+        logger.warning(f"지원하지 않는 HTML 파서 백엔드: {backend}, {DEFAULT_BACKEND} 사용")
+        return DEFAULT_BACKEND
+
+    if backend == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            logger.warning(f"lxml이 설치되어 있지 않습니다. {DEFAULT_BACKEND} 사용")
+            return DEFAULT_BACKEND
+
+    return backend
+
+
+class ParsedDocument:
+    """
+    한 번만 파싱한 HTML 문서.
+    원문 HTML과 BeautifulSoup 트리를 함께 보관하여, 같은 응답을 여러 추출기
+    (상세 내용, 첨부파일, CONTENT_SEQ 등)가 다시 파싱하지 않고 공유하도록 합니다.
+    """
+
+    __slots__ = ('html', 'soup')
+
+    def __init__(
+        self,
+        html: str,
+        backend: str = DEFAULT_BACKEND,
+        parse_only: Optional[SoupStrainer] = None
+    ):
+        self.html = html or ""
+        # parse_only가 있으면 조건에 맞는 요소(와 그 하위 요소)만 트리로 만듦
+        self.soup = BeautifulSoup(self.html, backend, parse_only=parse_only)
+
+    @classmethod
+    def of(
+        cls,
+        source: Union[str, "ParsedDocument"],
+        backend: str = DEFAULT_BACKEND,
+        parse_only: Optional[SoupStrainer] = None
+    ) -> "ParsedDocument":
+        """HTML 문자열이면 파싱하고, 이미 파싱된 문서면 그대로 반환"""
+        if isinstance(source, cls):
+            return source
+        return cls(source, backend, parse_only)
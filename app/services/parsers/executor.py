@@ -0,0 +1,86 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 실행 모드
+# - none: 이벤트 루프에서 바로 실행 (기존 동작)
+# - thread: 스레드 풀에서 실행 (GIL을 해제하는 파서 백엔드일 때 유리)
+# - process: 프로세스 풀에서 실행 (BeautifulSoup 같은 순수 파이썬 파싱에 유리)
+EXECUTOR_MODES = ("none", "thread", "process")
+
+
+class ParserExecutor:
+    """
+    HTML 파싱 작업 실행기.
+    CPU를 많이 쓰는 파싱을 이벤트 루프 밖(스레드/프로세스 풀)에서 실행하여
+    크롤링 중에도 다른 API 요청의 지연 시간이 늘어나지 않도록 합니다.
+
+    process 모드에서는 함수와 인자, 반환값이 모두 pickle 가능해야 합니다.
+    파서 메서드에는 HTML 문자열을 넘기고 dict/list만 돌려받으세요 (ParsedDocument는 넘기지 않음).
+    """
+
+    def __init__(self, mode: str = "none", max_workers: Optional[int] = None):
+        if mode not in EXECUTOR_MODES:
+            logger.warning(f"지원하지 않는 파서 실행 모드: {mode}, none 사용")
+            mode = "none"
+        self.mode = mode
+        self.max_workers = max_workers
+        self._pool: Optional[Executor] = None
+
+    def _get_pool(self) -> Executor:
+        """풀을 처음 사용할 때 생성"""
+        if self._pool is None:
+            if self.mode == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="parser"
+                )
+            else:
+                # 이벤트 루프와 스레드가 돌고 있는 프로세스를 fork하지 않도록 spawn 사용
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            logger.info(f"파서 실행기 풀 생성: mode={self.mode}, max_workers={self.max_workers}")
+        return self._pool
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        파싱 함수 실행
+
+        Args:
+            func: 파싱 함수 (process 모드에서는 pickle 가능한 함수/바운드 메서드)
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값
+        """
+        with span(f"parse {getattr(func, '__name__', 'call')}", {"parser.executor": self.mode}):
+            if self.mode == "none":
+                return func(*args, **kwargs)
+
+            call = functools.partial(func, *args, **kwargs)
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(self._get_pool(), call)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료되면 풀을 버리고 이번 작업은 직접 실행
+                logger.error("파서 프로세스 풀이 손상되어 재생성합니다. 이번 작업은 직접 실행합니다.")
+                self._pool = None
+                return call()
+
+    def shutdown(self) -> None:
+        """풀 종료 (애플리케이션 종료 시 호출)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            logger.info("파서 실행기 풀 종료")
@@ -1,11 +1,15 @@
-from typing import List, Dict, Any
-import re
+from typing import List, Dict, Any, Union
 import logging
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from app.services.parsers.content_parser import ContentParser
+from app.services.parsers import patterns
+from app.services.parsers.document import ParsedDocument
 
 logger = logging.getLogger(__name__)
 
+# 목록 페이지에서는 게시글 행만 트리로 만듦 (내비게이션, 스크립트 등 제외)
+MATERIAL_ROW_STRAINER = SoupStrainer('tr', style=lambda value: value and 'cursor: pointer' in value)
+
 class MaterialParser(ContentParser):
     """강의자료 파싱 클래스"""
     
@@ -15,8 +19,8 @@ class MaterialParser(ContentParser):
             if not html:
                 return []
                 
-            soup = BeautifulSoup(html, 'html.parser')
-            material_rows = soup.select('tr[style*="cursor: pointer"]')
+            soup = self.parse_document(html, parse_only=MATERIAL_ROW_STRAINER).soup
+            material_rows = patterns.CLICKABLE_ROW.select(soup)
             
             if not material_rows:
                 logger.warning("강의자료 목록을 찾을 수 없습니다.")
@@ -30,7 +34,7 @@ class MaterialParser(ContentParser):
                         continue
                         
                     # 제목 열 찾기
-                    title_cell = row.select_one('td.left')
+                    title_cell = patterns.TITLE_CELL.select_one(row)
                     if not title_cell:
                         continue
                         
@@ -48,19 +52,19 @@ class MaterialParser(ContentParser):
                         continue
                         
                     # 제목 추출
-                    title_div = title_cell.select_one('.subjt_top')
+                    title_div = patterns.SUBJECT_TOP.select_one(title_cell)
                     title = title_div.get_text(strip=True) if title_div else ""
                     
                     # 작성자 추출
                     author = ""
-                    subjt_bottom = title_cell.select_one('.subjt_bottom')
+                    subjt_bottom = patterns.SUBJECT_BOTTOM.select_one(title_cell)
                     if subjt_bottom:
-                        author_span = subjt_bottom.select_one('span')
+                        author_span = patterns.SPAN.select_one(subjt_bottom)
                         if author_span:
                             author = author_span.get_text(strip=True)
                             
                     # 날짜 추출
-                    date_cell = row.select_one('td.number:last-child')
+                    date_cell = patterns.LAST_NUMBER_CELL.select_one(row)
                     date = date_cell.get_text(strip=True) if date_cell else ""
                     
                     # 조회수 추출
@@ -69,12 +73,12 @@ class MaterialParser(ContentParser):
                         spans = subjt_bottom.find_all('span')
                         if len(spans) > 1:
                             views_text = spans[-1].get_text(strip=True)
-                            views_match = re.search(r'\d+', views_text)
+                            views_match = patterns.DIGITS.search(views_text)
                             if views_match:
                                 views = views_match.group()
                     
                     # 첨부파일 아이콘 확인
-                    download_icons = row.select('img.download_icon')
+                    download_icons = patterns.DOWNLOAD_ICON.select(row)
                     has_attachment = len(download_icons) > 0
                     
                     material = {
@@ -98,30 +102,31 @@ class MaterialParser(ContentParser):
             logger.error(f"강의자료 목록 파싱 중 오류 발생: {e}")
             return []
     
-    def parse_detail(self, html: str) -> Dict[str, Any]:
+    def parse_detail(self, html: Union[str, ParsedDocument]) -> Dict[str, Any]:
         """강의자료 상세 페이지 파싱"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            doc = self.parse_document(html)
+            soup = doc.soup
             parsed_data = {}
             
             # 본문 내용 추출
-            content_element = soup.select_one('td.textviewer')
+            content_element = patterns.TEXTVIEWER_CELL.select_one(soup)
             if content_element:
                 parsed_data['content'] = content_element.get_text(strip=True)
                 parsed_data['content_html'] = str(content_element)
                 
             # 기본 첨부파일 추출 (페이지에 있는 경우)
-            attachments = self.parse_attachments(html)
+            attachments = self.parse_attachments(doc)
             if attachments:
                 parsed_data['attachments'] = attachments
                 
             # 영상 URL 추출 (HTML5 비디오 또는 iframe)
             video_url = ""
-            video_elem = soup.select_one('video source')
+            video_elem = patterns.VIDEO_SOURCE.select_one(soup)
             if video_elem and 'src' in video_elem.attrs:
                 video_url = video_elem['src']
             else:
-                iframe_elem = soup.select_one('iframe')
+                iframe_elem = patterns.IFRAME.select_one(soup)
                 if iframe_elem and 'src' in iframe_elem.attrs:
                     video_url = iframe_elem['src']
                     
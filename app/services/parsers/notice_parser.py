@@ -1,11 +1,15 @@
-from typing import List, Dict, Any
-import re
+from typing import List, Dict, Any, Union
 import logging
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from app.services.parsers.content_parser import ContentParser
+from app.services.parsers import patterns
+from app.services.parsers.document import ParsedDocument
 
 logger = logging.getLogger(__name__)
 
+# 목록 페이지에서는 게시글 행만 트리로 만듦 (내비게이션, 스크립트 등 제외)
+NOTICE_ROW_STRAINER = SoupStrainer('tr', style="cursor: pointer;")
+
 class NoticeParser(ContentParser):
     """공지사항 파싱 클래스"""
     
@@ -15,7 +19,7 @@ class NoticeParser(ContentParser):
             if not html:
                 return []
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_document(html, parse_only=NOTICE_ROW_STRAINER).soup
             logger.info("공지사항 HTML 파싱 시작")
 
             notice_rows = soup.find_all('tr', style="cursor: pointer;")
@@ -29,7 +33,7 @@ class NoticeParser(ContentParser):
             for row in notice_rows:
                 try:
                     # onclick 속성에서 URL과 article_id 추출
-                    onclick = row.select_one('td.left').get('onclick', '')
+                    onclick = patterns.TITLE_CELL.select_one(row).get('onclick', '')
                     article_id = None
                     detail_url = ''
 
@@ -56,7 +60,7 @@ class NoticeParser(ContentParser):
                                 author = spans[0].get_text(strip=True)
                                 if len(spans) > 1:
                                     views_text = spans[-1].get_text(strip=True)
-                                    views_match = re.search(r'\d+', views_text)
+                                    views_match = patterns.DIGITS.search(views_text)
                                     if views_match:
                                         views = views_match.group()
 
@@ -83,10 +87,11 @@ class NoticeParser(ContentParser):
             logger.error(f"공지사항 목록 파싱 중 오류 발생: {e}")
             return []
     
-    def parse_detail(self, html: str) -> Dict[str, Any]:
+    def parse_detail(self, html: Union[str, ParsedDocument]) -> Dict[str, Any]:
         """공지사항 상세 페이지 파싱"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            doc = self.parse_document(html)
+            soup = doc.soup
             detail = {}
             
             # 텍스트뷰어 찾기
@@ -116,7 +121,7 @@ class NoticeParser(ContentParser):
                     detail['content_html'] = str(textviewer)
 
             # 기본 첨부파일 추출 (페이지에 있는 경우)
-            attachments = self.parse_attac88thments(html)
+            attachments = self.parse_attachments(doc)
             if attachments:
                 detail['attachments'] = attachments
 
@@ -0,0 +1,48 @@
+"""
+파서 공용 정규식/CSS 선택자 테이블
+
+목록 페이지의 행 반복문처럼 자주 실행되는 곳에서 매번 패턴을 만들거나
+re/soupsieve 내부 캐시를 조회하지 않도록 모듈 로딩 시 한 번만 컴파일합니다.
+"""
+import re
+from functools import lru_cache
+from typing import Pattern
+
+import soupsieve as sv
+
+# 정규식
+WHITESPACE = re.compile(r'\s+')
+DIGITS = re.compile(r'\d+')
+PAGE_MOVE_URL = re.compile(r"pageMove\('([^']+)'(?:,\s*event)?")
+# 원문 HTML에서 찾으므로 따옴표/공백/태그 경계에서 멈춤 (href="...CONTENT_SEQ=X">...)
+CONTENT_SEQ_IN_URL = re.compile(r'CONTENT_SEQ=([^&"\'\s<>]+)')
+CONTENT_SEQ_IN_SCRIPT = re.compile(r'CONTENT_SEQ\s*:\s*["\']([^"\',]+)')
+FILE_SEQ = re.compile(r'FILE_SEQ=([^&]+)')
+
+# 과제 상세 페이지 항목 이름
+DUE_DATE_LABEL = re.compile('마감일|제출기한')
+SCORE_LABEL = re.compile('배점|점수')
+MY_SCORE_LABEL = re.compile('내 점수|획득 점수')
+
+# 게시글 ID가 들어 있는 URL 파라미터 (앞에 있는 것부터 확인)
+ARTICLE_ID_PARAMS = ('ARTL_NUM', 'NORCT_NUM')
+
+
+@lru_cache(maxsize=None)
+def url_param_pattern(param: str) -> Pattern[str]:
+    """숫자 값을 갖는 URL 파라미터 패턴 (파라미터 이름별로 한 번만 컴파일)"""
+    return re.compile(rf'{re.escape(param)}=(\d+)')
+
+
+# CSS 선택자 (soupsieve로 미리 컴파일, selector.select(tag) / selector.select_one(tag)로 사용)
+TITLE_CELL = sv.compile('td.left')
+SUBJECT_TOP = sv.compile('.subjt_top')
+SUBJECT_BOTTOM = sv.compile('.subjt_bottom')
+SPAN = sv.compile('span')
+LAST_NUMBER_CELL = sv.compile('td.number:last-child')
+DOWNLOAD_ICON = sv.compile('img.download_icon')
+CLICKABLE_ROW = sv.compile('tr[style*="cursor: pointer"]')
+CONTENT_SEQ_INPUT = sv.compile('input[name="CONTENT_SEQ"]')
+TEXTVIEWER_CELL = sv.compile('td.textviewer')
+VIDEO_SOURCE = sv.compile('video source')
+IFRAME = sv.compile('iframe')
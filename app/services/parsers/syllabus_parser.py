@@ -1,19 +1,28 @@
 from typing import List, Dict, Any
-import re
 import logging
 from bs4 import BeautifulSoup
 
+from app.services.parsers import patterns
+from app.services.parsers.document import ParsedDocument, DEFAULT_BACKEND, resolve_backend
+
 logger = logging.getLogger(__name__)
 
 class SyllabusParser:
     """강의계획서 파싱 클래스"""
     
+    # 파싱 결과 형식이 바뀌면 올릴 것 (ParseCache 키에 포함되어 이전 캐시 항목을 무효화)
+    PARSER_VERSION = "1"
+
+    def __init__(self, backend: str = DEFAULT_BACKEND):
+        # BeautifulSoup 트리 빌더 ('html.parser' 또는 'lxml')
+        self.backend = resolve_backend(backend)
+    
     def clean_text(self, text: str) -> str:
         """HTML에서 추출한 텍스트 정리"""
         if not text:
             return ""
         # 공백 문자 정리
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = patterns.WHITESPACE.sub(' ', text.strip())
         # HTML 엔티티 변환
         text = text.replace('&nbsp;', ' ').replace('&lt;', '<').replace('&gt;', '>')
         return text
@@ -24,7 +33,7 @@ class SyllabusParser:
             if not html:
                 return {}
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = ParsedDocument(html, self.backend).soup
             
             # 강의 기본 정보 추출
             syllabus_info = {
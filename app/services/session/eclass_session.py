@@ -1,14 +1,43 @@
 import httpx
 import logging
+import time
 from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+from app.core.metrics import ECLASS_REQUESTS, ECLASS_REQUEST_DURATION, ECLASS_LOGINS
+from app.core.tracing import span, set_span_attributes
 
 logger = logging.getLogger(__name__)
 
+# e-Class 경로 -> 메트릭 라벨 (목록에 없는 경로는 'other'로 묶어 라벨 수를 고정)
+URL_KINDS = {
+    "login.acl": "login",
+    "main_form.acl": "main",
+    "eclass_room_submain.acl": "course_access",
+    "submain_form.acl": "course_menu",
+    "notice_list.jsp": "notice_list",
+    "notice_view_form.acl": "notice_detail",
+    "lecture_material_list.jsp": "material_list",
+    "lecture_material_view_form.acl": "material_detail",
+    "report_list.jsp": "assignment_list",
+    "report_view_form.acl": "assignment_detail",
+    "course_info.jsp": "syllabus",
+    "efile_list.acl": "attachment_list",
+    "efile_download.acl": "attachment_download",
+}
+
+
+def url_kind(url: str) -> str:
+    """e-Class URL의 종류 (메트릭 라벨용)"""
+    return URL_KINDS.get(urlsplit(str(url)).path.rsplit("/", 1)[-1], "other")
+
 class EclassSession:
     """e-Class 웹 사이트와의 HTTP 통신 관리"""
     
-    def __init__(self):
-        self.base_url = "https://eclass.seoultech.ac.kr"
+    def __init__(self, base_url: Optional[str] = None):
+        # 기본값은 settings.ECLASS_BASE_URL (로컬 대역 서버 등으로 바꿀 수 있음)
+        self.base_url = (base_url or settings.ECLASS_BASE_URL).rstrip('/')
         self.login_url = f"{self.base_url}/ilos/lo/login.acl"
         self.main_url = f"{self.base_url}/ilos/main/main_form.acl"
         self.course_access_url = f"{self.base_url}/ilos/st/course/eclass_room_submain.acl"
@@ -27,6 +56,21 @@ class EclassSession:
         )
         self._is_logged_in = False
 
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """e-Class 요청 전송 (URL 종류별 요청 수와 소요 시간 기록, 트레이싱 사용 시 스팬 생성)"""
+        kind = url_kind(url)
+        started = time.perf_counter()
+        with span(f"eclass {method} {kind}", {"eclass.kind": kind, "http.method": method, "url.path": urlsplit(str(url)).path}):
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                ECLASS_REQUESTS.labels(kind=kind, method=method, status="error").inc()
+                raise
+            finally:
+                ECLASS_REQUEST_DURATION.labels(kind=kind, method=method).observe(time.perf_counter() - started)
+            ECLASS_REQUESTS.labels(kind=kind, method=method, status=str(response.status_code)).inc()
+            set_span_attributes(**{"http.status_code": response.status_code, "http.response_size": len(response.content)})
+            return response
 
     async def login(self, username: str, password: str) -> bool:
         """e-Class에 로그인"""
@@ -42,7 +86,7 @@ class EclassSession:
         }
 
         try:
-            response = await self.client.post(self.login_url, data=login_data)
+            response = await self._send("POST", self.login_url, data=login_data)
             response.raise_for_status()
 
             # 로그인 성공 확인 (실패 메시지가 없고 리다이렉트가 있는 경우)
@@ -56,16 +100,20 @@ class EclassSession:
                 is_valid = await self._validate_session()
                 if not is_valid:
                     logger.error("로그인 후 세션 검증 실패")
+                    ECLASS_LOGINS.labels(result="failure").inc()
                     self._is_logged_in = False
                     return False
 
+                ECLASS_LOGINS.labels(result="success").inc()
                 return True
             else:
+                ECLASS_LOGINS.labels(result="failure").inc()
                 self._is_logged_in = False
                 return False
 
         except httpx.HTTPError as e:
             logger.error(f"로그인 중 오류 발생: {e}")
+            ECLASS_LOGINS.labels(result="error").inc()
             self._is_logged_in = False
             return False
 
@@ -80,7 +128,7 @@ class EclassSession:
         """세션 유효성 검증"""
         try:
             # 메인 페이지 요청
-            response = await self.client.get(self.main_url)
+            response = await self._send("GET", self.main_url)
             response.raise_for_status()
 
             html_content = response.text
@@ -110,7 +158,7 @@ class EclassSession:
         """GET 요청 수행"""
         try:
             logger.debug(f"GET 요청: {url}, 파라미터: {params}")
-            response = await self.client.get(url, params=params)
+            response = await self._send("GET", url, params=params)
             response.raise_for_status()
             logger.debug(f"GET 응답: {response.status_code}, 내용 길이: {len(response.text)}")
             return response
@@ -125,7 +173,7 @@ class EclassSession:
         """POST 요청 수행"""
         try:
             logger.debug(f"POST 요청: {url}, 데이터: {data}")
-            response = await self.client.post(url, data=data)
+            response = await self._send("POST", url, data=data)
             response.raise_for_status()
             logger.debug(f"POST 응답: {response.status_code}, 내용 길이: {len(response.text)}")
             return response
@@ -140,7 +188,7 @@ class EclassSession:
         """강의 목록 페이지 가져오기"""
         logger.info("강의 목록 페이지 요청")
         # params=None 제거하여 테스트 통과
-        response = await self.client.get(self.main_url)
+        response = await self._send("GET", self.main_url)
         return response.text
 
     async def access_course(self, course_id: str) -> Optional[str]:
@@ -2,6 +2,7 @@ import logging
 import asyncio
 from typing import Dict, Optional
 
+from app.core.metrics import ECLASS_ACTIVE_SESSIONS
 from app.services.base_service import BaseService
 from app.services.session.eclass_session import EclassSession
 
@@ -91,6 +92,7 @@ class EclassSessionManager(BaseService):
                 # 세션 객체에 이클래스 ID 저장 (URL 생성 시 사용)
                 eclass_session.eclass_id = eclass_credentials["username"]
                 self.eclass_sessions[user_id] = eclass_session
+                ECLASS_ACTIVE_SESSIONS.set(len(self.eclass_sessions))
                 return eclass_session
             else:
                 logger.error(f"사용자 {user_id} 로그인 실패")
@@ -144,6 +146,7 @@ class EclassSessionManager(BaseService):
                 session = self.eclass_sessions[user_id]
                 await session.close()
                 del self.eclass_sessions[user_id]
+                ECLASS_ACTIVE_SESSIONS.set(len(self.eclass_sessions))
 
     async def check_sessions_health(self) -> None:
         """모든 세션의 건강 상태 확인 (주기적 호출)"""
@@ -181,6 +184,7 @@ class EclassSessionManager(BaseService):
                     logger.error(f"사용자 {user_id}의 세션 종료 중 오류: {str(e)}")
 
             self.eclass_sessions.clear()
+            ECLASS_ACTIVE_SESSIONS.set(0)
             logger.info("모든 세션 종료 완료")
 
     async def is_valid(self) -> bool:
@@ -1,6 +1,7 @@
 import logging
 import os
 import hashlib
+import time
 from typing import Dict, Any, Optional, BinaryIO, Union, List
 from pathlib import Path
 
@@ -10,6 +11,8 @@ from sqlalchemy import select
 
 from app.services.base_service import BaseService
 from app.core.config import settings
+from app.core.tracing import traced
+from app.core.metrics import STORAGE_UPLOAD_BYTES, STORAGE_UPLOAD_DURATION
 from app.models.attachment import Attachment
 from app.core.security import verify_attachment_access
 
@@ -45,6 +48,7 @@ class StorageService(BaseService):
         logger.info("StorageService 종료")
         pass
     
+    @traced()
     async def upload_file(
         self, 
         file_data: Union[bytes, BinaryIO], 
@@ -70,20 +74,25 @@ class StorageService(BaseService):
             
             # Supabase Storage에 업로드
             if self.supabase:
+                started = time.perf_counter()
                 try:
                     storage = self.supabase.storage.from_(self.bucket_name)
                     
                     # 바이트 데이터인 경우
                     if isinstance(file_data, bytes):
-                        response = storage.upload(file_path, file_data)
+                        payload = file_data
                     # 파일 객체인 경우
                     else:
                         file_data.seek(0)  # 파일 포인터를 처음으로 이동
-                        response = storage.upload(file_path, file_data.read())
-                        
+                        payload = file_data.read()
+                    response = storage.upload(file_path, payload)
+
+                    STORAGE_UPLOAD_DURATION.labels(backend="supabase", outcome="success").observe(time.perf_counter() - started)
+                    STORAGE_UPLOAD_BYTES.labels(backend="supabase").inc(len(payload))
                     logger.info(f"파일 '{filename}' 업로드 완료: {file_path}")
                     return file_path
                 except Exception as e:
+                    STORAGE_UPLOAD_DURATION.labels(backend="supabase", outcome="error").observe(time.perf_counter() - started)
                     logger.error(f"Supabase 업로드 중 오류: {str(e)}")
                     # 실패 시 로컬에 저장 시도
             
@@ -114,6 +123,7 @@ class StorageService(BaseService):
         Returns:
             str: 로컬 파일 경로
         """
+        started = time.perf_counter()
         try:
             # 저장 디렉토리 생성
             save_dir = os.path.join(self.local_download_dir, course_id, content_type)
@@ -125,19 +135,22 @@ class StorageService(BaseService):
             # 바이트 데이터인 경우
             if isinstance(file_data, bytes):
                 with open(file_path, 'wb') as f:
-                    f.write(file_data)
+                    written = f.write(file_data)
             # 파일 객체인 경우
             else:
                 file_data.seek(0)  # 파일 포인터를 처음으로 이동
                 with open(file_path, 'wb') as f:
-                    f.write(file_data.read())
+                    written = f.write(file_data.read())
             
+            STORAGE_UPLOAD_DURATION.labels(backend="local", outcome="success").observe(time.perf_counter() - started)
+            STORAGE_UPLOAD_BYTES.labels(backend="local").inc(written)
             logger.info(f"파일 '{filename}' 로컬 저장 완료: {file_path}")
             
             # 로컬 경로 반환
             return f"local://{course_id}/{content_type}/{filename}"
             
         except Exception as e:
+            STORAGE_UPLOAD_DURATION.labels(backend="local", outcome="error").observe(time.perf_counter() - started)
             logger.error(f"파일 '{filename}' 로컬 저장 중 오류 발생: {str(e)}")
             return ""
     
@@ -1,11 +1,15 @@
 import logging
 from typing import Dict, Any, List
 import asyncio
+import time
 from datetime import datetime
 import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.metrics import CRAWL_QUEUE_DEPTH, CRAWL_TASK_DURATION
+from app.core.tracing import traced
+from app.db.query_stats import tracked_queries
 from app.services.base_service import BaseService
 from app.services.session.eclass_session_manager import EclassSessionManager
 from app.services.content.course_service import CourseService
@@ -13,6 +17,7 @@ from app.services.content.notice_service import NoticeService
 from app.services.content.material_service import MaterialService
 from app.services.content.assignment_service import AssignmentService
 from app.services.content.syllabus_service import SyllabusService
+from app.utils.timing import StageTimer, merge_timings
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +41,16 @@ class CrawlService(BaseService):
         self.assignment_service = assignment_service
         self.syllabus_service = syllabus_service
         self.active_tasks = {}  # 활성 태스크 관리
+        CRAWL_QUEUE_DEPTH.set_function(self.pending_task_count)
         logger.info("CrawlService 초기화 완료")
 
+    def pending_task_count(self) -> int:
+        """실행 대기 또는 실행 중인 크롤링 작업 수"""
+        return sum(
+            1 for task_info in list(self.active_tasks.values())
+            if task_info.get("status") in ("running", "processing")
+        )
+
     async def initialize(self) -> None:
         """서비스 초기화"""
         logger.info("CrawlService 시작")
@@ -58,6 +71,8 @@ class CrawlService(BaseService):
                 task_info["end_time"] = datetime.now().isoformat()
         logger.info("CrawlService 종료 완료")
 
+    @traced()
+    @tracked_queries("crawl.crawl_all")
     async def crawl_all(
             self,
             user_id: str,
@@ -82,15 +97,21 @@ class CrawlService(BaseService):
             "syllabus": {"new": 0, "errors": 0},
             "notices": {"new": 0, "errors": 0},
             "materials": {"new": 0, "errors": 0},
-            "assignments": {"new": 0, "errors": 0}
+            "assignments": {"new": 0, "errors": 0},
+            "course_timings": {},  # 강의별 단계별 소요 시간
+            "timings": {}  # 전체 단계별 소요 시간 (강의 목록 조회 포함)
         }
+        timer = StageTimer()
+        status = "error"
 
         start_time = datetime.now()
+        started = time.perf_counter()
         logger.info(f"모든 콘텐츠 크롤링 시작 - 사용자: {user_id}")
 
         try:
             # 1. 강의 목록 가져오기
-            courses = await self.course_service.get_courses(user_id, db, force_refresh=True)
+            with timer.stage("course_list"):
+                courses = await self.course_service.get_courses(user_id, db, force_refresh=True)
             result["courses"] = len(courses)
 
             # 2. 특정 강의만 처리하는 경우
@@ -103,10 +124,12 @@ class CrawlService(BaseService):
             # 3. 각 강의별 처리
             for course in courses:
                 logger.info(f"강의 {course.id} - {course.name} 크롤링 시작")
+                course_timer = StageTimer()
 
                 # 3.1 강의계획서 크롤링
                 try:
                     syllabus_result = await self.syllabus_service.refresh_all(db, course.id, user_id)
+                    course_timer.merge(syllabus_result.get("timings"))
                     result["syllabus"]["new"] += syllabus_result.get("new", 0)
                     result["syllabus"]["errors"] += syllabus_result.get("errors", 0)
                 except Exception as e:
@@ -116,6 +139,7 @@ class CrawlService(BaseService):
                 # 3.2 공지사항 크롤링
                 try:
                     notice_result = await self.crawl_notices(user_id, course.id, db, auto_download)
+                    course_timer.merge(notice_result.get("timings"))
                     result["notices"]["new"] += notice_result.get("new", 0)
                     result["notices"]["errors"] += notice_result.get("errors", 0)
                 except Exception as e:
@@ -125,6 +149,7 @@ class CrawlService(BaseService):
                 # 3.3 강의자료 크롤링
                 try:
                     material_result = await self.material_service.refresh_all(db, course.id, user_id, auto_download)
+                    course_timer.merge(material_result.get("timings"))
                     result["materials"]["new"] += material_result.get("new", 0)
                     result["materials"]["errors"] += material_result.get("errors", 0)
                 except Exception as e:
@@ -134,12 +159,15 @@ class CrawlService(BaseService):
                 # 3.4 과제 크롤링
                 try:
                     assignment_result = await self.crawl_assignments(user_id, course.id, db, auto_download)
+                    course_timer.merge(assignment_result.get("timings"))
                     result["assignments"]["new"] += assignment_result.get("new", 0)
                     result["assignments"]["errors"] += assignment_result.get("errors", 0)
                 except Exception as e:
                     logger.error(f"과제 크롤링 중 오류: {str(e)}")
                     result["assignments"]["errors"] += 1
 
+                result["course_timings"][course.id] = course_timer.to_dict()
+                timer.merge(result["course_timings"][course.id])
                 logger.info(f"강의 {course.id} - {course.name} 크롤링 완료")
 
             end_time = datetime.now()
@@ -148,13 +176,19 @@ class CrawlService(BaseService):
 
             # 결과에 소요시간 추가
             result["duration_seconds"] = duration
+            result["timings"] = timer.to_dict()
+            status = "success"
 
             return result
 
         except Exception as e:
             logger.error(f"크롤링 중 오류 발생: {str(e)}")
+            result["timings"] = timer.to_dict()
             return result
+        finally:
+            CRAWL_TASK_DURATION.labels(kind="crawl_all", status=status).observe(time.perf_counter() - started)
 
+    @traced()
     async def crawl_notices(
             self,
             user_id: str,
@@ -190,6 +224,7 @@ class CrawlService(BaseService):
             logger.error(f"공지사항 크롤링 중 오류 발생: {str(e)}")
             return {"count": 0, "new": 0, "errors": 1}
 
+    @traced()
     async def crawl_assignments(
             self,
             user_id: str,
@@ -225,6 +260,7 @@ class CrawlService(BaseService):
             logger.error(f"과제 크롤링 중 오류 발생: {str(e)}")
             return {"count": 0, "new": 0, "errors": 1}
 
+    @traced()
     async def crawl_materials(
             self,
             user_id: str,
@@ -260,6 +296,7 @@ class CrawlService(BaseService):
             logger.error(f"강의자료 크롤링 중 오류 발생: {str(e)}")
             return {"count": 0, "new": 0, "errors": 1}
 
+    @traced()
     async def crawl_syllabus(
             self,
             user_id: str,
@@ -354,6 +391,8 @@ class CrawlService(BaseService):
             "courses": [course.name for course in courses]
         }
 
+    @traced()
+    @tracked_queries("crawl.all_courses")
     async def _crawl_all_courses_task(self, user_id: str, courses: List[Any], db_session: AsyncSession,
                                       auto_download: bool, task_id: str) -> Dict[str, Any]:
         """
@@ -369,6 +408,8 @@ class CrawlService(BaseService):
         Returns:
             Dict[str, Any]: 크롤링 결과
         """
+        started = time.perf_counter()
+        status = "error"
         try:
             # 작업 상태 업데이트
             if task_id in self.active_tasks:
@@ -388,17 +429,19 @@ class CrawlService(BaseService):
                     "notices": {"count": 0, "new": 0, "errors": 0},
                     "materials": {"count": 0, "new": 0, "errors": 0},
                     "assignments": {"count": 0, "new": 0, "errors": 0},
-                    "syllabus": {"new": 0, "errors": 0}
+                    "syllabus": {"new": 0, "errors": 0},
+                    "timings": {}
                 }
             }
+            timer = StageTimer()
 
             # 각 강의 순차적으로 크롤링
             for course in courses:
                 try:
                     course_id = course.id
 
-                    # 개별 강의 크롤링
-                    course_result = await self.crawl_course(
+                    # 개별 강의 크롤링 (같은 DB 세션을 쓰므로 별도 태스크로 띄우지 않고 순서대로 완료까지 대기)
+                    course_result = await self._crawl_course_task(
                         user_id, course_id, db_session, auto_download, f"{task_id}_{course_id}"
                     )
 
@@ -407,8 +450,10 @@ class CrawlService(BaseService):
                         "name": course.name,
                         "code": course.code,
                         "status": course_result.get("status", "unknown"),
-                        "details": course_result.get("details", {})
+                        "details": course_result.get("details", {}),
+                        "timings": course_result.get("timings", {})
                     }
+                    timer.merge(course_result.get("timings"))
 
                     # 요약 정보 업데이트
                     if course_result.get("status") == "success":
@@ -433,12 +478,15 @@ class CrawlService(BaseService):
                     }
                     result["summary"]["failed"] += 1
 
+            result["summary"]["timings"] = timer.to_dict()
+
             # 작업 완료
             if task_id in self.active_tasks:
                 self.active_tasks[task_id]["status"] = "completed"
                 self.active_tasks[task_id]["end_time"] = datetime.now().isoformat()
                 self.active_tasks[task_id]["result"] = result
 
+            status = "success"
             logger.info(f"모든 강의 크롤링 작업 완료: {task_id}")
             return result
 
@@ -458,6 +506,8 @@ class CrawlService(BaseService):
                 "message": f"크롤링 중 오류 발생: {str(e)}",
                 "timestamp": datetime.now().isoformat()
             }
+        finally:
+            CRAWL_TASK_DURATION.labels(kind="all_courses", status=status).observe(time.perf_counter() - started)
 
     async def crawl_course(self, user_id: str, course_id: str, db_session: AsyncSession,
                            auto_download: bool = False, task_id: str = None) -> Dict[str, Any]:
@@ -525,6 +575,8 @@ class CrawlService(BaseService):
             "course_name": course.name
         }
 
+    @traced()
+    @tracked_queries("crawl.course")
     async def _crawl_course_task(self, user_id: str, course_id: str, db_session: AsyncSession,
                                  auto_download: bool, task_id: str) -> Dict[str, Any]:
         """
@@ -540,6 +592,8 @@ class CrawlService(BaseService):
         Returns:
             Dict[str, Any]: 크롤링 결과
         """
+        started = time.perf_counter()
+        status = "error"
         try:
             # 작업 상태 업데이트
             if task_id in self.active_tasks:
@@ -592,12 +646,18 @@ class CrawlService(BaseService):
                 logger.error(f"과제 크롤링 중 오류: {str(e)}")
                 result["details"]["assignments"]["errors"] += 1
 
+            # 강의 단위 단계별 소요 시간 (콘텐츠별 결과의 timings 합산)
+            result["timings"] = merge_timings(
+                *(details.get("timings") for details in result["details"].values())
+            )
+
             # 작업 완료
             if task_id in self.active_tasks:
                 self.active_tasks[task_id]["status"] = "completed"
                 self.active_tasks[task_id]["end_time"] = datetime.now().isoformat()
                 self.active_tasks[task_id]["result"] = result
 
+            status = "success"
             logger.info(f"강의 크롤링 작업 완료: {task_id}")
             return result
 
@@ -618,6 +678,8 @@ class CrawlService(BaseService):
                 "message": f"크롤링 중 오류 발생: {str(e)}",
                 "timestamp": datetime.now().isoformat()
             }
+        finally:
+            CRAWL_TASK_DURATION.labels(kind="course", status=status).observe(time.perf_counter() - started)
 
     async def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
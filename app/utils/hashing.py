@@ -0,0 +1,16 @@
+"""
+저장 내용 해시 헬퍼
+
+파싱 결과를 키 순서와 관계없는 JSON으로 직렬화해 sha256을 구합니다.
+행에 이 해시를 함께 저장해 두면 다음 동기화에서 e-Class 페이지 내용이 그대로인지 DB 기준으로 판단할 수 있습니다.
+(파싱 캐시 적중은 "언젠가 같은 HTML을 파싱한 적이 있다"는 뜻일 뿐 DB 내용과 같다는 보장이 아닙니다.)
+"""
+import hashlib
+import json
+from typing import Any
+
+
+def content_hash(value: Any) -> str:
+    """value(파싱 결과 dict/list)의 sha256 16진수 문자열"""
+    raw = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
@@ -0,0 +1,62 @@
+"""
+키셋(keyset) 페이지네이션 커서 헬퍼
+
+커서는 마지막으로 반환된 행의 정렬 키 값 목록을 JSON으로 직렬화한 뒤
+URL-safe base64로 인코딩한 문자열입니다. 클라이언트는 값을 해석하지 않고
+다음 요청의 cursor 파라미터로 그대로 전달합니다.
+"""
+import base64
+import json
+from typing import Any, Optional, Sequence, Tuple
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    정렬 키 값 목록을 커서 문자열로 인코딩
+
+    Args:
+        values: 마지막 행의 정렬 키 값 (예: (date, id))
+
+    Returns:
+        str: URL-safe base64 커서 문자열
+    """
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+        cursor: Optional[str],
+        types: Sequence[Tuple[type, ...]]
+) -> Optional[Tuple[Any, ...]]:
+    """
+    커서 문자열을 정렬 키 값 튜플로 디코딩
+
+    커서는 클라이언트가 임의로 만들 수 있으므로 값 개수뿐 아니라 각 값의 타입도 정렬 키와 맞는지 확인합니다.
+    (타입이 다른 값이 그대로 키셋 비교 쿼리에 들어가면 DB 오류로 500이 됩니다.)
+
+    Args:
+        cursor: encode_cursor로 만든 커서 문자열 (없으면 None)
+        types: 정렬 키별로 허용하는 타입 (예: ((str,), (int,)))
+
+    Returns:
+        Optional[Tuple[Any, ...]]: 정렬 키 값 튜플 (커서가 없으면 None)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    for value, allowed in zip(values, types):
+        # JSON의 true/false는 bool이지만 isinstance(True, int)도 참이므로 따로 거름
+        if not isinstance(value, allowed) or (isinstance(value, bool) and bool not in allowed):
+            raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return tuple(values)
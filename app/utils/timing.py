@@ -0,0 +1,73 @@
+"""
+크롤링 단계별 소요 시간 측정 헬퍼
+
+콘텐츠 서비스의 새로고침 결과(refresh_all)와 CrawlService 작업 결과에
+단계별 누적 시간과 횟수를 담아, 느린 동기화가 어느 단계에서 시간을 쓰는지 확인할 수 있게 합니다.
+결과 형식: {"list_fetch": {"ms": 120.5, "count": 1}, "detail_fetch": {"ms": 2310.2, "count": 24}, ...}
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from app.core.tracing import span
+
+# 단계 이름 (결과에는 이 순서로 표시하고, 목록에 없는 단계는 뒤에 붙임)
+STAGES = (
+    "course_list",  # 강의 목록 조회 (crawl_all)
+    "session",  # e-Class 세션 획득 (로그인 포함)
+    "list_fetch",  # 목록 페이지 요청
+    "list_parse",  # 목록 파싱 (파싱 캐시 조회 포함)
+    "db_diff",  # 기존 게시글 조회 (새 게시글 판별)
+    "detail_fetch",  # 상세 페이지와 첨부파일 목록(AJAX) 요청
+    "detail_parse",  # 상세 페이지와 첨부파일 목록 파싱
+    "attachment_download",  # 첨부파일 다운로드
+    "upload",  # 스토리지 업로드
+    "db_write",  # 게시글/첨부파일 저장
+)
+
+Timings = Dict[str, Dict[str, float]]
+
+
+class StageTimer:
+    """단계별 소요 시간 누적기"""
+
+    def __init__(self):
+        self._seconds: Dict[str, float] = defaultdict(float)
+        self._counts: Dict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with 블록 실행 시간을 name 단계에 더함 (예외가 나도 기록, 트레이싱 사용 시 같은 이름의 스팬 생성)"""
+        started = time.perf_counter()
+        try:
+            with span(f"stage {name}"):
+                yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float, count: int = 1) -> None:
+        self._seconds[name] += seconds
+        self._counts[name] += count
+
+    def merge(self, timings: Optional[Timings]) -> "StageTimer":
+        """to_dict() 형식의 결과를 더함 (하위 작업 결과 집계용)"""
+        for name, value in (timings or {}).items():
+            self.add(name, value.get("ms", 0.0) / 1000, int(value.get("count", 0)))
+        return self
+
+    def to_dict(self) -> Timings:
+        names = [name for name in STAGES if name in self._counts]
+        names += sorted(name for name in self._counts if name not in STAGES)
+        return {
+            name: {"ms": round(self._seconds[name] * 1000, 1), "count": self._counts[name]}
+            for name in names
+        }
+
+
+def merge_timings(*timings: Optional[Timings]) -> Timings:
+    """여러 단계별 소요 시간 결과 합산"""
+    timer = StageTimer()
+    for value in timings:
+        timer.merge(value)
+    return timer.to_dict()
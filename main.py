@@ -1,29 +1,37 @@
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 import logging
 import sys
 import socket
-from contextlib import closing
+from contextlib import closing, asynccontextmanager
 
 logger = logging.getLogger(__name__)
 
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.logging_config import setup_logging, shutdown_logging
 from app.api.api import api_router
+from app.api.deps import get_parser_executor
+from app.core.metrics import PROMETHEUS_AVAILABLE, CONTENT_TYPE_LATEST, PrometheusMiddleware, render_metrics
+from app.core.tracing import setup_tracing, shutdown_tracing
+from app.db.base import engine
+from app.db.query_stats import QueryStatsMiddleware
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('app.log')
-    ]
-)
+# 로깅 설정 (큐 기반 비동기 로깅, 모듈별 레벨은 LOG_MODULE_LEVELS)
+setup_logging()
 
-# 각 모듈의 로거 레벨 설정
-logging.getLogger('app.core.parsers.eclass_parser').setLevel(logging.DEBUG)
-logging.getLogger('app.services').setLevel(logging.DEBUG)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 시 리소스 관리"""
+    yield
+    # 파서 실행기 풀 종료
+    get_parser_executor().shutdown()
+    # 남은 트레이스 스팬 내보내기
+    shutdown_tracing()
+    # 큐에 남은 로그 기록
+    shutdown_logging()
 
 def create_app() -> FastAPI:
     """FastAPI 애플리케이션 생성"""
@@ -31,7 +39,8 @@ def create_app() -> FastAPI:
         title="AutoLMS",
         description="서울과학기술대학교 e-Class 자동화 시스템",
         version="1.0.0",
-        openapi_url=f"{settings.API_V1_STR}/openapi.json"
+        openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        lifespan=lifespan
     )
 
     # CORS 설정
@@ -45,13 +54,42 @@ def create_app() -> FastAPI:
             allow_headers=["*"],
         )
 
+    # 응답 압축 (brotli/gzip, 메트릭의 처리 시간에 압축 시간도 포함되도록 안쪽에 둠)
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MIN_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+            brotli_enabled=settings.COMPRESSION_BROTLI_ENABLED,
+        )
+
+    # 요청별 쿼리 통계와 N+1 감지
+    if settings.DB_QUERY_STATS_ENABLED:
+        app.add_middleware(QueryStatsMiddleware)
+
+    # 요청 메트릭 (가장 바깥에서 전체 처리 시간을 측정하도록 마지막에 추가)
+    if settings.METRICS_ENABLED:
+        app.add_middleware(PrometheusMiddleware)
+
     # API 라우터 포함
     app.include_router(api_router, prefix=settings.API_V1_STR)
 
+    # 트레이싱 (TRACING_ENABLED일 때만 라우트/쿼리 스팬 생성)
+    setup_tracing(app, engine)
+
     @app.get("/")
     def root():
         return {"message": f"Welcome to {settings.API_V1_STR}"}
 
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        def metrics():
+            """Prometheus 메트릭"""
+            if not PROMETHEUS_AVAILABLE:
+                return Response("prometheus_client가 설치되지 않았습니다.\n", status_code=503, media_type="text/plain")
+            return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
     return app
 
 def is_port_in_use(host: str, port: int) -> bool:
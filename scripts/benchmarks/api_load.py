@@ -0,0 +1,495 @@
+"""
+조회 API 부하 테스트 (asyncio 드라이버)
+
+합성 데이터를 채운 별도 스키마(bench_api)와 인증을 대체한 앱을 띄우고,
+동시 접속 클라이언트로 조회 엔드포인트를 호출해 엔드포인트별 RPS, 지연 시간 백분위수, 오류율을 보고합니다.
+API 성능 작업의 기준선(baseline)으로 쓰기 위한 도구입니다.
+
+- serve: bench_api 스키마에 데이터를 채우고 의존성을 바꾼 앱을 uvicorn으로 실행
+    - get_current_user: Bearer 토큰 값을 그대로 사용자 ID로 사용 (Supabase 호출 없음)
+    - get_db_session: bench_api 스키마를 search_path로 쓰는 세션
+    - get_storage_service: Supabase 없이 동작하는 StorageService
+- run (기본): serve를 하위 프로세스로 띄우거나(--target이 없을 때) 주어진 주소에 부하를 걸고 결과를 JSON으로 출력
+
+사용법:
+    DATABASE_URL=postgresql+asyncpg://... python scripts/benchmarks/api_load.py run \\
+        --concurrency 32 --duration 30 --save /tmp/api_before.json
+    (변경 후)
+    ... run --concurrency 32 --duration 30 --compare /tmp/api_before.json
+
+    (서버를 따로 띄우기) python scripts/benchmarks/api_load.py serve --port 8920
+                        python scripts/benchmarks/api_load.py run --target http://127.0.0.1:8920
+
+클라이언트와 서버가 같은 머신에서 CPU를 나눠 쓰므로 결과는 같은 환경에서 측정한 값끼리만 비교하세요.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+import httpx
+
+SCHEMA = "bench_api"
+
+# (엔드포인트 이름, 가중치, 경로 생성 함수(dataset, rng, 사용자 번호))
+Scenario = Tuple[str, int, Callable[["Dataset", random.Random, int], str]]
+
+
+class Dataset:
+    """합성 데이터 규칙 (serve의 시드 데이터와 run의 요청 경로가 같은 규칙을 사용)"""
+
+    def __init__(self, users: int, courses: int, courses_per_user: int, rows: int):
+        self.users = users
+        self.courses = courses
+        self.courses_per_user = min(courses_per_user, courses)
+        self.rows = rows
+
+    @staticmethod
+    def user_id(index: int) -> str:
+        return f"bench-user-{index:04d}"
+
+    @staticmethod
+    def course_id(index: int) -> str:
+        return f"BENCH{index:04d}"
+
+    def user_courses(self, user_index: int) -> List[int]:
+        """사용자가 수강하는 강의 번호 목록"""
+        start = user_index * self.courses_per_user
+        return [(start + j) % self.courses for j in range(self.courses_per_user)]
+
+    def row_id(self, course_index: int, row: int) -> int:
+        """강의별 콘텐츠 행의 기본 키 (공지사항/강의자료/과제 모두 같은 규칙)"""
+        return course_index * self.rows + row + 1
+
+    def pick(self, rng: random.Random, user_index: int) -> Tuple[str, int]:
+        """사용자가 수강하는 강의 하나와 그 강의의 게시글 하나 선택"""
+        course_index = rng.choice(self.user_courses(user_index))
+        return self.course_id(course_index), self.row_id(course_index, rng.randrange(self.rows))
+
+
+def _course(path: str) -> Callable[[Dataset, random.Random, int], str]:
+    def build(data: Dataset, rng: random.Random, user_index: int) -> str:
+        course_id, row_id = data.pick(rng, user_index)
+        return path.format(course_id=course_id, row_id=row_id)
+    return build
+
+
+SCENARIOS: List[Scenario] = [
+    ("courses.list", 10, lambda data, rng, user: "/courses/"),
+    ("courses.get", 5, _course("/courses/{course_id}")),
+    ("notices.list", 15, _course("/courses/{course_id}/notices/?limit=20")),
+    ("notices.get", 10, _course("/courses/{course_id}/notices/{row_id}")),
+    ("materials.list", 10, _course("/courses/{course_id}/materials/?limit=20")),
+    ("materials.get", 5, _course("/courses/{course_id}/materials/{row_id}")),
+    ("assignments.list", 10, _course("/courses/{course_id}/assignments/?limit=20")),
+    ("assignments.get", 5, _course("/courses/{course_id}/assignments/{row_id}")),
+    ("attachments.by_source", 8, _course("/attachments/notices/{row_id}")),
+    ("attachments.search", 4, lambda data, rng, user: "/attachments/search?query=pdf"),
+    ("syllabus.get", 8, _course("/courses/{course_id}/syllabus/")),
+]
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--users", type=int, default=200, help="합성 사용자 수")
+    parser.add_argument("--courses", type=int, default=60, help="강의 수")
+    parser.add_argument("--courses-per-user", type=int, default=6)
+    parser.add_argument("--rows", type=int, default=200, help="강의별 공지사항/강의자료/과제 수")
+
+
+def dataset_from(args) -> Dataset:
+    return Dataset(args.users, args.courses, args.courses_per_user, args.rows)
+
+
+# ---------------------------------------------------------------------------
+# serve
+# ---------------------------------------------------------------------------
+
+def bench_engine(pool_size: int = 20, max_overflow: int = 10):
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.core.config import settings
+
+    # 서비스 코드에는 스키마 없는 경량 table()도 있어 schema_translate_map 대신 연결의 search_path를 바꿈
+    return create_async_engine(
+        settings.SQLALCHEMY_DATABASE_URI,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        connect_args={"server_settings": {"search_path": SCHEMA}}
+    )
+
+
+async def seed(data: Dataset) -> None:
+    """bench_api 스키마를 새로 만들고 합성 데이터 삽입"""
+    from sqlalchemy import Table, Column, String, text
+    from app.db.base import Base
+    from app.models.user_courses import user_courses
+
+    users = Table("users", Base.metadata, Column("id", String, primary_key=True), extend_existing=True)
+    tables = Base.metadata.tables
+    now = datetime.utcnow()
+
+    def content_rows(kind: str) -> List[Dict[str, Any]]:
+        rows = []
+        for c in range(data.courses):
+            for r in range(data.rows):
+                row = {
+                    "id": data.row_id(c, r),
+                    "article_id": str(r + 1),
+                    "course_id": data.course_id(c),
+                    "title": f"{kind} {r + 1}",
+                    "content": f"<p>{kind} {r + 1} 본문</p>" * 20,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                day = f"2025-{3 + r % 4:02d}-{1 + r % 28:02d}"
+                if kind == "assignments":
+                    row.update(due_date=f"{day} 23:59", status="진행중", submission_status="미제출")
+                else:
+                    row.update(author="교수", date=day, views=r)
+                rows.append(row)
+        return rows
+
+    async def insert(conn, table, rows: List[Dict[str, Any]], batch: int = 5000) -> None:
+        for start in range(0, len(rows), batch):
+            await conn.execute(table.insert(), rows[start:start + batch])
+
+    engine = bench_engine(pool_size=1, max_overflow=0)
+    started = time.perf_counter()
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.run_sync(Base.metadata.create_all)
+
+            await insert(conn, users, [{"id": data.user_id(u)} for u in range(data.users)])
+            await insert(conn, tables["courses"], [
+                {"id": data.course_id(c), "name": f"벤치마크 강의 {c}", "code": f"B{c:04d}",
+                 "semester": "2025-1", "created_at": now, "updated_at": now}
+                for c in range(data.courses)
+            ])
+            await insert(conn, user_courses, [
+                {"user_id": data.user_id(u), "course_id": data.course_id(c), "semester": "2025-1",
+                 "created_at": now}
+                for u in range(data.users) for c in data.user_courses(u)
+            ])
+            for kind in ("notices", "materials", "assignments"):
+                await insert(conn, tables[kind], content_rows(kind))
+            await insert(conn, tables["attachments"], [
+                {"course_id": data.course_id(c), "source_type": "notices", "source_id": str(data.row_id(c, r)),
+                 "file_name": f"notice_{data.row_id(c, r)}.pdf", "file_size": 1024 * (r + 1),
+                 "content_type": "application/pdf", "storage_path": f"{data.course_id(c)}/notices/{r}.pdf",
+                 "notice_id": data.row_id(c, r), "created_at": now, "updated_at": now}
+                for c in range(data.courses) for r in range(data.rows)
+            ])
+            await insert(conn, tables["syllabus"], [
+                {"course_id": data.course_id(c), "year_semester": "2025-1", "course_type": "전공",
+                 "professor_name": "교수", "course_overview": "개요 " * 50, "objectives": "목표 " * 30,
+                 "weekly_plans": [{"week": w, "content": f"{w}주차 내용"} for w in range(1, 16)],
+                 "created_at": now, "updated_at": now}
+                for c in range(data.courses)
+            ])
+            for table in ("users", "courses", "user_courses", "notices", "materials", "assignments",
+                          "attachments", "syllabus"):
+                await conn.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+    finally:
+        await engine.dispose()
+    print(f"시드 데이터 생성 완료 ({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+
+
+async def drop_schema() -> None:
+    from sqlalchemy import text
+
+    engine = bench_engine(pool_size=1, max_overflow=0)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    finally:
+        await engine.dispose()
+
+
+def build_app(args):
+    """main.create_app()에 벤치마크용 의존성 대체를 적용한 앱"""
+    from fastapi import Depends
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    import main
+    from app.api import deps
+    from app.core.config import settings
+    from app.services.storage import StorageService
+
+    if args.log_level:
+        logging.getLogger().setLevel(args.log_level.upper())
+        logging.getLogger("app.services").setLevel(args.log_level.upper())
+
+    engine = bench_engine(settings.DATABASE_POOL_SIZE, settings.DATABASE_MAX_OVERFLOW)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, autocommit=False, autoflush=False)
+    storage_service = StorageService()
+    storage_service.supabase = None
+
+    async def bench_db_session():
+        async with session_factory() as session:
+            yield session
+
+    async def bench_current_user(token: str = Depends(deps.oauth2_scheme)):
+        return {"id": token, "email": f"{token}@bench.local"}
+
+    app = main.create_app()
+    app.dependency_overrides[deps.get_db_session] = bench_db_session
+    app.dependency_overrides[deps.get_current_user] = bench_current_user
+    app.dependency_overrides[deps.get_storage_service] = lambda: storage_service
+    return app
+
+
+def serve(args) -> int:
+    import uvicorn
+
+    if not args.no_seed:
+        asyncio.run(seed(dataset_from(args)))
+    try:
+        uvicorn.run(build_app(args), host=args.host, port=args.port, log_level="warning", access_log=False)
+    finally:
+        if not args.keep:
+            asyncio.run(drop_schema())
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# run
+# ---------------------------------------------------------------------------
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """최근접 순위(nearest-rank) 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(latencies: List[float], statuses: Counter, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    errors = sum(count for status, count in statuses.items() if not str(status).isdigit() or int(status) >= 400)
+    return {
+        "requests": len(ordered),
+        "rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1e3, 2),
+        "p90_ms": round(percentile(ordered, 90) * 1e3, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1e3, 2),
+        "max_ms": round(ordered[-1] * 1e3, 2) if ordered else 0.0,
+        "errors": errors,
+        "error_rate": round(errors / len(ordered), 4) if ordered else 0.0,
+        "statuses": {str(status): count for status, count in sorted(statuses.items(), key=lambda i: str(i[0]))},
+    }
+
+
+async def wait_until_ready(client: httpx.AsyncClient, process: Optional[subprocess.Popen], timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"벤치마크 서버가 종료됨 (exit {process.returncode})")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"서버에 연결할 수 없음: {client.base_url}")
+        await asyncio.sleep(0.5)
+
+
+async def drive(args, client: httpx.AsyncClient, scenarios: List[Scenario], data: Dataset) -> Dict[str, Any]:
+    """closed-loop 부하: concurrency개의 가상 사용자가 응답을 받자마자 다음 요청을 보냄"""
+    names = [name for name, _, _ in scenarios]
+    weights = [weight for _, weight, _ in scenarios]
+    builders = {name: build for name, _, build in scenarios}
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+
+    loop_start = time.perf_counter()
+    measure_start = loop_start + args.warmup
+    end = measure_start + args.duration
+
+    async def virtual_user(worker: int) -> None:
+        rng = random.Random(f"{args.seed}:{worker}")
+        user_index = worker % data.users
+        headers = {"Authorization": f"Bearer {data.user_id(user_index)}"}
+        while time.perf_counter() < end:
+            name = rng.choices(names, weights)[0]
+            path = builders[name](data, rng, user_index)
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, headers=headers)
+                status: Any = response.status_code
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            if started >= measure_start:
+                latencies[name].append(time.perf_counter() - started)
+                statuses[name][status] += 1
+
+    await asyncio.gather(*(virtual_user(worker) for worker in range(args.concurrency)))
+    elapsed = time.perf_counter() - measure_start
+
+    endpoints = {name: summarize(latencies[name], statuses[name], elapsed) for name in names if latencies[name]}
+    overall_statuses: Counter = Counter()
+    for counter in statuses.values():
+        overall_statuses.update(counter)
+    overall = summarize([v for values in latencies.values() for v in values], overall_statuses, elapsed)
+    return {"elapsed_s": round(elapsed, 3), "overall": overall, "endpoints": endpoints}
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    header = f"{'엔드포인트':<24} {'요청':>7} {'RPS':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'오류율':>7}"
+    print(header, file=sys.stderr)
+    rows = list(result["endpoints"].items()) + [("(전체)", result["overall"])]
+    for name, stats in rows:
+        print(
+            f"{name:<24} {stats['requests']:>7} {stats['rps']:>8.1f} {stats['p50_ms']:>8.2f} "
+            f"{stats['p90_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['error_rate']:>7.2%}",
+            file=sys.stderr
+        )
+
+
+def print_comparison(result: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    print("\n이전 결과 대비 (이전 -> 현재)", file=sys.stderr)
+    rows = list(result["endpoints"].items()) + [("(전체)", result["overall"])]
+    before_rows = dict(previous["endpoints"], **{"(전체)": previous["overall"]})
+    for name, stats in rows:
+        before = before_rows.get(name)
+        if not before:
+            continue
+        print(
+            f"{name:<24} RPS {before['rps']:>8.1f} -> {stats['rps']:<8.1f} "
+            f"p50 {before['p50_ms']:>7.2f} -> {stats['p50_ms']:<7.2f} "
+            f"p99 {before['p99_ms']:>7.2f} -> {stats['p99_ms']:<7.2f}",
+            file=sys.stderr
+        )
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> int:
+    from app.core.config import settings
+
+    scenarios = SCENARIOS
+    if args.endpoints:
+        wanted = {name.strip() for name in args.endpoints.split(",")}
+        unknown = wanted - {name for name, _, _ in SCENARIOS}
+        if unknown:
+            print(f"알 수 없는 엔드포인트: {', '.join(sorted(unknown))}", file=sys.stderr)
+            return 2
+        scenarios = [scenario for scenario in SCENARIOS if scenario[0] in wanted]
+
+    server = None
+    target = args.target
+    if not target:
+        command = [
+            sys.executable, os.path.abspath(__file__), "serve", "--port", str(args.port),
+            "--users", str(args.users), "--courses", str(args.courses),
+            "--courses-per-user", str(args.courses_per_user), "--rows", str(args.rows),
+        ]
+        if args.log_level:
+            command += ["--log-level", args.log_level]
+        server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL)
+        target = f"http://127.0.0.1:{args.port}"
+
+    data = dataset_from(args)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"{target.rstrip('/')}{settings.API_V1_STR}", limits=limits, timeout=args.timeout
+        ) as client:
+            await wait_until_ready(client, server, args.startup_timeout)
+            result = await drive(args, client, scenarios, data)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report = {
+        "meta": {
+            "benchmark": "api_load",
+            "git_commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "target": target,
+            "config": {
+                key: value for key, value in vars(args).items()
+                if key not in ("save", "compare", "command")
+            },
+        },
+        **result,
+    }
+    print_report(result)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(result, json.load(f))
+
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+        print(f"\n결과 저장: {args.save}", file=sys.stderr)
+    else:
+        print(payload)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="조회 API 부하 테스트")
+    commands = parser.add_subparsers(dest="command")
+
+    serve_parser = commands.add_parser("serve", help="시드 데이터와 인증 대체를 적용한 앱 실행")
+    add_dataset_arguments(serve_parser)
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8920)
+    serve_parser.add_argument("--no-seed", action="store_true", help="기존 bench_api 스키마를 그대로 사용")
+    serve_parser.add_argument("--keep", action="store_true", help="종료 후 bench_api 스키마를 삭제하지 않음")
+    serve_parser.add_argument("--log-level", help="앱 로그 레벨 (지정하지 않으면 main.py 설정 그대로)")
+
+    run_parser = commands.add_parser("run", help="부하 실행 (기본)")
+    add_dataset_arguments(run_parser)
+    run_parser.add_argument("--target", help="이미 실행 중인 서버 주소 (지정하지 않으면 serve를 직접 실행)")
+    run_parser.add_argument("--port", type=int, default=8920, help="직접 실행하는 서버의 포트")
+    run_parser.add_argument("--concurrency", type=int, default=32, help="동시 가상 사용자 수")
+    run_parser.add_argument("--duration", type=float, default=30.0, help="측정 시간(초)")
+    run_parser.add_argument("--warmup", type=float, default=5.0, help="측정 전 워밍업 시간(초)")
+    run_parser.add_argument("--endpoints", help="측정할 엔드포인트 (쉼표 구분, 기본: 전체)")
+    run_parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃(초)")
+    run_parser.add_argument("--startup-timeout", type=float, default=300.0, help="서버 준비 대기 시간(초)")
+    run_parser.add_argument("--log-level", help="직접 실행하는 서버의 로그 레벨")
+    run_parser.add_argument("--seed", type=int, default=1)
+    run_parser.add_argument("--save", help="결과 JSON 경로 (지정하지 않으면 표준 출력)")
+    run_parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in ("serve", "run", "-h", "--help"):
+        argv = ["run", *argv]
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return serve(args)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,535 @@
+"""
+크롤링 처리량 종단 간(end-to-end) 벤치마크
+
+로컬 e-Class 대역 서버(scripts/eclass_standin.py)와 로컬 Postgres를 대상으로
+CrawlService.crawl_all / _crawl_all_courses_task를 실제 서비스·리포지토리 구성 그대로 실행하고
+다음 지표를 JSON으로 출력합니다.
+
+- courses_per_second: 초당 처리한 강의 수 (사용자별 강의 수 합 / 경과 시간)
+- eclass_requests_per_course: 강의당 e-Class 요청 수 (대역 서버 통계 기준)
+- db_round_trips_per_course: 강의당 DB 왕복 수 (커서 실행 횟수)
+- stages: 단계별(로그인, e-Class 요청, 파싱, 콘텐츠별 새로고침, DB 문장) p50/p99
+- peak_rss_mib: 벤치마크 프로세스의 최대 RSS (대역 서버 프로세스 제외)
+
+단계(phase)
+- cold: 빈 스키마에 처음 크롤링 (모든 게시글이 새 항목)
+- warm: 같은 데이터를 다시 크롤링 (새 항목 없음, 목록 요청과 비교만 수행)
+- task: _crawl_all_courses_task 실행 (강의별 결과 상태와 단계별 소요 시간 합계 포함)
+
+대역 서버는 모든 사용자에게 같은 강의 목록을 주므로, 사용자들은 같은 강의를 공유하는 수강생처럼 동작합니다.
+
+사용법:
+    DATABASE_URL=postgresql+asyncpg://... python scripts/benchmarks/crawl_bench.py \\
+        --users 20 --courses 6 --notices 50 --concurrency 4 --latency-ms 30 --output /tmp/crawl.json
+    (이미 실행 중인 대역 서버 사용) ... --eclass-url http://127.0.0.1:8900
+
+운영 데이터는 건드리지 않으며, 실행이 끝나면 bench_crawl 스키마를 삭제합니다 (--keep 으로 유지 가능).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+import httpx
+from sqlalchemy import Table, Column, String, event, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.repositories.course_repository import CourseRepository
+from app.db.repositories.notice_repository import NoticeRepository
+from app.db.repositories.material_repository import MaterialRepository
+from app.db.repositories.assignment_repository import AssignmentRepository
+from app.db.repositories.attachment_repository import AttachmentRepository
+from app.db.repositories.syllabus_repository import SyllabusRepository
+from app.models.user_courses import user_courses  # noqa: F401 (metadata 등록)
+from app.services.content import (
+    CourseService,
+    NoticeService,
+    MaterialService,
+    AssignmentService,
+    SyllabusService,
+)
+from app.services.parsers import (
+    CourseParser,
+    NoticeParser,
+    MaterialParser,
+    AssignmentParser,
+    SyllabusParser,
+    ParserExecutor,
+    ParseCache
+)
+from app.services.session import EclassSessionManager
+from app.services.session.eclass_session import EclassSession
+from app.services.storage import StorageService
+from app.services.sync import CrawlService
+from app.utils.timing import StageTimer
+
+SCHEMA = "bench_crawl"
+STANDIN = os.path.join(ROOT, "scripts", "eclass_standin.py")
+
+# users 테이블은 Supabase가 관리하므로 ORM 모델이 없음 - user_courses 외래키 대상만 선언
+users = Table("users", Base.metadata, Column("id", String, primary_key=True), extend_existing=True)
+
+
+def bench_user_id(index: int) -> str:
+    return f"bench-user-{index:04d}"
+
+
+def bench_eclass_id(user_id: str) -> str:
+    return user_id.replace("bench-user-", "bench")
+
+
+class BenchSessionManager(EclassSessionManager):
+    """합성 사용자의 e-Class 계정을 Supabase 대신 사용자 ID에서 만드는 세션 관리자"""
+
+    _instance = None
+    _initialized = False
+
+    def __init__(self, password: str):
+        super().__init__()
+        self.password = password
+
+    async def _get_user_eclass_credentials(self, user_id: str) -> Optional[Dict[str, str]]:
+        return {"username": bench_eclass_id(user_id), "password": self.password}
+
+
+class BenchAuthService:
+    """MaterialService/SyllabusService가 사용하는 AuthService.get_user_eclass_credentials 대체"""
+
+    def __init__(self, password: str):
+        self.password = password
+
+    async def get_user_eclass_credentials(self, user_id: str) -> Optional[Dict[str, str]]:
+        return {"username": bench_eclass_id(user_id), "password": self.password}
+
+
+class StageRecorder:
+    """단계별 소요 시간 수집 (메서드를 감싸 호출마다 경과 시간 기록)"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.samples[stage].append(seconds)
+
+    def wrap(self, owner: Any, name: str, stage: str) -> None:
+        """owner(클래스 또는 인스턴스)의 비동기 메서드 name을 시간 측정 메서드로 교체"""
+        original = getattr(owner, name)
+
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - started)
+
+        setattr(owner, name, timed)
+
+    def wrap_executor(self, executor: ParserExecutor) -> None:
+        """파싱 시간은 파서 메서드 이름별로 기록 (parse.parse_list, parse.parse_detail ...)"""
+        original = executor.run
+
+        async def timed(func, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await original(func, *args, **kwargs)
+            finally:
+                self.record(f"parse.{getattr(func, '__name__', 'call')}", time.perf_counter() - started)
+
+        executor.run = timed
+
+    def reset(self) -> None:
+        self.samples.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {stage: summarize(values) for stage, values in sorted(self.samples.items())}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """최근접 순위(nearest-rank) 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(percentile(ordered, 50) * 1e3, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1e3, 3),
+        "max_ms": round(ordered[-1] * 1e3, 3) if ordered else 0.0,
+        "total_s": round(sum(ordered), 4),
+    }
+
+
+class RoundTripCounter:
+    """엔진의 커서 실행 횟수(DB 왕복)와 문장별 소요 시간 집계"""
+
+    def __init__(self, sync_engine, recorder: StageRecorder):
+        self.count = 0
+        self.recorder = recorder
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        conn.info.setdefault("bench_started", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["bench_started"].pop()
+        self.recorder.record("db.statement", time.perf_counter() - started)
+
+
+def peak_rss_mib() -> float:
+    """현재 프로세스의 최대 RSS (Linux는 KiB, macOS는 바이트 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def start_standin(args) -> subprocess.Popen:
+    """대역 서버를 하위 프로세스로 실행"""
+    command = [
+        sys.executable, STANDIN, "--port", str(args.standin_port),
+        "--courses", str(args.courses), "--notices", str(args.notices),
+        "--materials", str(args.materials), "--assignments", str(args.assignments),
+        "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate), "--file-kb", str(args.file_kb),
+        "--password", args.password,
+    ]
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL)
+
+
+async def wait_for_standin(client: httpx.AsyncClient, timeout: float = 20.0) -> Dict[str, Any]:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            response = await client.get("/_standin/stats")
+            if response.status_code == 200:
+                return response.json()
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"대역 서버에 연결할 수 없음: {client.base_url}")
+        await asyncio.sleep(0.2)
+
+
+def build_services(args, executor: ParserExecutor, parse_cache: Optional[ParseCache], download_dir: str):
+    """deps.py와 같은 구성으로 서비스 생성 (계정 조회와 파일 저장소만 벤치마크용으로 교체)"""
+    backend = settings.HTML_PARSER_BACKEND
+    base_url = settings.ECLASS_BASE_URL
+    session_manager = BenchSessionManager(args.password)
+    auth_service = BenchAuthService(args.password)
+
+    # 첨부파일은 Supabase 대신 임시 디렉터리에 저장
+    storage_service = StorageService()
+    storage_service.supabase = None
+    storage_service.local_download_dir = download_dir
+
+    attachment_repository = AttachmentRepository()
+    course_service = CourseService(
+        session_service=session_manager,
+        course_parser=CourseParser(backend=backend, base_url=base_url),
+        course_repository=CourseRepository(),
+        parser_executor=executor,
+        parse_cache=parse_cache
+    )
+    notice_service = NoticeService(
+        eclass_session=session_manager,
+        notice_parser=NoticeParser(backend=backend, base_url=base_url),
+        notice_repository=NoticeRepository(),
+        attachment_repository=attachment_repository,
+        storage_service=storage_service,
+        parser_executor=executor,
+        parse_cache=parse_cache
+    )
+    material_service = MaterialService(
+        eclass_session=session_manager,
+        material_parser=MaterialParser(backend=backend, base_url=base_url),
+        material_repository=MaterialRepository(),
+        attachment_repository=attachment_repository,
+        storage_service=storage_service,
+        auth_service=auth_service,
+        parser_executor=executor,
+        parse_cache=parse_cache
+    )
+    assignment_service = AssignmentService(
+        session_service=session_manager,
+        assignment_parser=AssignmentParser(backend=backend, base_url=base_url),
+        assignment_repository=AssignmentRepository(),
+        attachment_repository=attachment_repository,
+        parser_executor=executor,
+        parse_cache=parse_cache
+    )
+    # AssignmentService는 스토리지 서비스를 직접 만들므로 교체
+    assignment_service.storage = storage_service
+    assignment_service.storage_service = storage_service
+    syllabus_service = SyllabusService(
+        eclass_session=session_manager,
+        syllabus_parser=SyllabusParser(backend=backend),
+        syllabus_repository=SyllabusRepository(),
+        auth_service=auth_service,
+        parser_executor=executor,
+        parse_cache=parse_cache
+    )
+    return CrawlService(
+        eclass_session=session_manager,
+        course_service=course_service,
+        notice_service=notice_service,
+        material_service=material_service,
+        assignment_service=assignment_service,
+        syllabus_service=syllabus_service
+    )
+
+
+def instrument(crawl_service: CrawlService, recorder: StageRecorder) -> None:
+    """단계별 측정 지점 설치"""
+    recorder.wrap(EclassSession, "login", "eclass.login")
+    recorder.wrap(EclassSession, "get", "eclass.get")
+    recorder.wrap(EclassSession, "post", "eclass.post")
+    recorder.wrap(crawl_service.session_service, "get_session", "session.acquire")
+    recorder.wrap(crawl_service.course_service, "get_courses", "courses.refresh")
+    recorder.wrap(crawl_service.syllabus_service, "refresh_all", "syllabus.refresh")
+    recorder.wrap(crawl_service.notice_service, "refresh_all", "notices.refresh")
+    recorder.wrap(crawl_service.material_service, "refresh_all", "materials.refresh")
+    recorder.wrap(crawl_service.assignment_service, "refresh_all", "assignments.refresh")
+    recorder.wrap(crawl_service.notice_service.storage_service, "upload_file", "attachments.store")
+    recorder.wrap_executor(crawl_service.course_service.parser_executor)
+
+
+def add_totals(totals: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """crawl_all 결과의 콘텐츠별 new/errors 합산"""
+    for category in ("syllabus", "notices", "materials", "assignments"):
+        for key, value in result.get(category, {}).items():
+            totals[category][key] += value
+
+
+async def standin_requests(client: httpx.AsyncClient) -> Dict[str, int]:
+    return (await client.get("/_standin/stats")).json()["requests"]
+
+
+async def run_crawl_all(crawl_service, session_factory, user_ids, args) -> Dict[str, Any]:
+    """사용자별 AsyncSession으로 crawl_all 실행 (동시 실행 수는 --concurrency)"""
+    semaphore = asyncio.Semaphore(args.concurrency)
+    totals = {category: defaultdict(int) for category in ("syllabus", "notices", "materials", "assignments")}
+    outcome = {"courses": 0, "failed_users": 0}
+    timer = StageTimer()
+
+    async def crawl_user(user_id: str) -> None:
+        async with semaphore:
+            async with session_factory() as db:
+                result = await crawl_service.crawl_all(user_id, db=db, auto_download=args.auto_download)
+            if not result.get("courses"):
+                outcome["failed_users"] += 1
+            outcome["courses"] += result.get("courses", 0)
+            add_totals(totals, result)
+            timer.merge(result.get("timings"))
+
+    await asyncio.gather(*(crawl_user(user_id) for user_id in user_ids))
+    outcome["content"] = {category: dict(values) for category, values in totals.items()}
+    outcome["timings"] = timer.to_dict()
+    return outcome
+
+
+async def run_course_tasks(crawl_service, session_factory, user_ids, args) -> Dict[str, Any]:
+    """사용자별 AsyncSession으로 _crawl_all_courses_task 실행 (강의별 결과 상태와 단계별 소요 시간 집계)"""
+    semaphore = asyncio.Semaphore(args.concurrency)
+    outcome = {"courses": 0, "statuses": defaultdict(int)}
+    timer = StageTimer()
+
+    async def crawl_user(index: int, user_id: str) -> None:
+        task_id = f"bench_{index:04d}"
+        async with semaphore:
+            async with session_factory() as db:
+                courses = await crawl_service.course_service.get_courses(user_id, db, force_refresh=True)
+                outcome["courses"] += len(courses)
+                result = await crawl_service._crawl_all_courses_task(
+                    user_id, courses, db, args.auto_download, task_id
+                )
+            for course_result in result.get("course_results", {}).values():
+                outcome["statuses"][course_result.get("status", "unknown")] += 1
+            timer.merge(result.get("summary", {}).get("timings"))
+
+    await asyncio.gather(*(crawl_user(index, user_id) for index, user_id in enumerate(user_ids)))
+    outcome["statuses"] = dict(outcome["statuses"])
+    outcome["timings"] = timer.to_dict()
+    return outcome
+
+
+async def run_phase(name, runner, crawl_service, session_factory, user_ids, args,
+                    recorder, round_trips, client, parse_cache) -> Dict[str, Any]:
+    recorder.reset()
+    round_trips.count = 0
+    await client.post("/_standin/reset")
+
+    started = time.perf_counter()
+    outcome = await runner(crawl_service, session_factory, user_ids, args)
+    elapsed = time.perf_counter() - started
+
+    requests = await standin_requests(client)
+    errors = requests.pop("errors", 0)
+    request_count = sum(requests.values())
+    courses = outcome["courses"] or 1
+    phase = {
+        "elapsed_s": round(elapsed, 3),
+        "users": len(user_ids),
+        "courses": outcome["courses"],
+        "courses_per_second": round(outcome["courses"] / elapsed, 3) if elapsed else 0.0,
+        "eclass_requests": request_count,
+        "eclass_requests_per_course": round(request_count / courses, 2),
+        "eclass_errors": errors,
+        "eclass_requests_by_path": dict(sorted(requests.items())),
+        "db_round_trips": round_trips.count,
+        "db_round_trips_per_course": round(round_trips.count / courses, 2),
+        "stages": recorder.summary(),
+        "peak_rss_mib": peak_rss_mib(),
+        "outcome": outcome,
+    }
+    if parse_cache is not None:
+        phase["parse_cache"] = parse_cache.stats()
+    print(
+        f"[{name}] {phase['courses']}개 강의 {elapsed:.2f}s  "
+        f"{phase['courses_per_second']:.2f} courses/s  "
+        f"요청 {phase['eclass_requests_per_course']}/강의  DB {phase['db_round_trips_per_course']}/강의  "
+        f"RSS {phase['peak_rss_mib']} MiB",
+        file=sys.stderr
+    )
+    return phase
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="크롤링 처리량 종단 간 벤치마크")
+    parser.add_argument("--users", type=int, default=10, help="합성 사용자 수")
+    parser.add_argument("--courses", type=int, default=6, help="사용자별 강의 수")
+    parser.add_argument("--notices", type=int, default=30, help="강의별 공지사항 수")
+    parser.add_argument("--materials", type=int, default=30, help="강의별 강의자료 수")
+    parser.add_argument("--assignments", type=int, default=15, help="강의별 과제 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 크롤링할 사용자 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="대역 서버 응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--file-kb", type=int, default=64)
+    parser.add_argument("--auto-download", action="store_true", help="첨부파일 다운로드/저장 포함")
+    parser.add_argument("--phases", default="cold,warm,task", help="실행할 단계 (쉼표 구분)")
+    parser.add_argument("--parser-executor", default=settings.PARSER_EXECUTOR, choices=("none", "thread", "process"))
+    parser.add_argument("--no-parse-cache", action="store_true", help="파싱 캐시 비활성화")
+    parser.add_argument("--eclass-url", help="이미 실행 중인 대역 서버 주소 (지정하지 않으면 직접 실행)")
+    parser.add_argument("--standin-port", type=int, default=8911)
+    parser.add_argument("--password", default="bench", help="대역 서버 로그인 비밀번호")
+    parser.add_argument("--output", help="결과 JSON 경로 (지정하지 않으면 표준 출력)")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 스키마를 삭제하지 않음")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s %(name)s: %(message)s")
+
+    phases = [name.strip() for name in args.phases.split(",") if name.strip()]
+    unknown = set(phases) - {"cold", "warm", "task"}
+    if unknown:
+        parser.error(f"알 수 없는 단계: {', '.join(sorted(unknown))}")
+
+    standin = None
+    if args.eclass_url:
+        base_url = args.eclass_url.rstrip("/")
+    else:
+        standin = start_standin(args)
+        base_url = f"http://127.0.0.1:{args.standin_port}"
+    # EclassSession과 콘텐츠 서비스는 요청할 때 settings.ECLASS_BASE_URL을 읽음
+    settings.ECLASS_BASE_URL = base_url
+
+    # 서비스 코드에는 스키마 없는 경량 table()도 있어 schema_translate_map 대신 연결의 search_path를 바꿈
+    engine = create_async_engine(
+        settings.SQLALCHEMY_DATABASE_URI,
+        pool_size=max(args.concurrency, 1) + 2,
+        max_overflow=args.concurrency * args.courses,
+        connect_args={"server_settings": {"search_path": SCHEMA}}
+    )
+    recorder = StageRecorder()
+    round_trips = RoundTripCounter(engine.sync_engine, recorder)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
+    executor = ParserExecutor(mode=args.parser_executor, max_workers=settings.PARSER_MAX_WORKERS)
+    parse_cache = None if args.no_parse_cache else ParseCache(max_entries=settings.PARSE_CACHE_SIZE)
+    download_dir = tempfile.mkdtemp(prefix="crawl_bench_")
+    crawl_service = build_services(args, executor, parse_cache, download_dir)
+    instrument(crawl_service, recorder)
+    user_ids = [bench_user_id(i) for i in range(args.users)]
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "benchmark": "crawl_bench",
+            "git_commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "html_parser_backend": settings.HTML_PARSER_BACKEND,
+            "config": {key: value for key, value in vars(args).items() if key not in ("password", "output")},
+        },
+        "phases": {},
+    }
+
+    schema_created = False
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            report["meta"]["standin"] = (await wait_for_standin(client))["config"]
+
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+                await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+                schema_created = True
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.execute(users.insert(), [{"id": user_id} for user_id in user_ids])
+
+            runners = {"cold": run_crawl_all, "warm": run_crawl_all, "task": run_course_tasks}
+            for name in phases:
+                report["phases"][name] = await run_phase(
+                    name, runners[name], crawl_service, session_factory, user_ids, args,
+                    recorder, round_trips, client, parse_cache
+                )
+    finally:
+        await crawl_service.session_service.close_all_sessions()
+        executor.shutdown()
+        if standin is not None:
+            standin.terminate()
+            standin.wait(timeout=10)
+        if schema_created and not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,198 @@
+"""
+조회 경로별 실행 계획 벤치마크 (인덱스 적용 전/후)
+
+별도 스키마(bench_indexes)에 모델과 같은 테이블을 만들고 대량의 행을 채운 뒤,
+리포지토리가 실제로 실행하는 쿼리 형태를 EXPLAIN (ANALYZE)로 비교합니다.
+인덱스 정의는 모델(app/models)의 것을 그대로 사용하므로 마이그레이션과 일치합니다.
+
+사용법:
+    DATABASE_URL=postgresql+asyncpg://... python scripts/benchmarks/index_plans.py --rows 1000000
+
+운영 데이터는 건드리지 않으며, 실행이 끝나면 bench_indexes 스키마를 삭제합니다 (--keep 으로 유지 가능).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import Table, Column, String, select, func, text, tuple_, literal_column
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.user_courses import user_courses
+
+SCHEMA = "bench_indexes"
+
+notices = Base.metadata.tables["notices"]
+materials = Base.metadata.tables["materials"]
+assignments = Base.metadata.tables["assignments"]
+attachments = Base.metadata.tables["attachments"]
+courses = Base.metadata.tables["courses"]
+
+# users 테이블은 Supabase가 관리하므로 ORM 모델이 없음 - user_courses 외래키 대상만 선언
+users = Table("users", Base.metadata, Column("id", String, primary_key=True), extend_existing=True)
+
+BENCH_TABLES = [users, courses, notices, materials, assignments, attachments, user_courses]
+
+
+def query_shapes(course_count: int) -> List[Tuple[str, Any]]:
+    """리포지토리/서비스가 실행하는 쿼리 형태 목록"""
+    course_id = f"C{course_count // 2}"
+    course_ids = [f"C{i}" for i in range(0, course_count, max(course_count // 8, 1))]
+    notice_date = func.coalesce(notices.c.date, literal_column("''"))
+    due_date = func.coalesce(assignments.c.due_date, literal_column("''"))
+
+    return [
+        ("notices 첫 페이지 (NoticeRepository.get_page)",
+         select(notices).where(notices.c.course_id == course_id)
+         .order_by(notice_date.desc(), notices.c.id.desc()).limit(101)),
+        ("notices 다음 페이지 (키셋)",
+         select(notices).where(
+             notices.c.course_id == course_id,
+             tuple_(notice_date, notices.c.id) < tuple_("2025-03-15", 10 ** 9)
+         ).order_by(notice_date.desc(), notices.c.id.desc()).limit(101)),
+        ("notices 개수 (count_by_course_id)",
+         select(func.count()).select_from(notices).where(notices.c.course_id == course_id)),
+        ("materials 첫 페이지",
+         select(materials).where(materials.c.course_id == course_id)
+         .order_by(func.coalesce(materials.c.date, literal_column("''")).desc(), materials.c.id.desc())
+         .limit(101)),
+        ("assignments 첫 페이지 (마감일 순)",
+         select(assignments).where(assignments.c.course_id == course_id)
+         .order_by(due_date.asc(), assignments.c.id.asc()).limit(101)),
+        ("notices (course_id, article_id) 조회",
+         select(notices).where(notices.c.course_id == course_id, notices.c.article_id == "500")),
+        ("notices article_id 집합 (get_article_ids)",
+         select(notices.c.article_id).where(notices.c.course_id == course_id)),
+        ("attachments 소스별 조회 (get_attachments_by_source)",
+         select(attachments).where(attachments.c.source_type == "notices", attachments.c.source_id == "12345")),
+        ("attachments selectinload (notice_id IN ...)",
+         select(attachments).where(attachments.c.notice_id.in_(list(range(1000, 1100))))),
+        ("attachments 강의별 최신순 (search_attachments)",
+         select(attachments).where(attachments.c.course_id.in_(course_ids))
+         .order_by(attachments.c.created_at.desc()).limit(50)),
+        ("user_courses 사용자별 조회 (get_by_user_id)",
+         select(user_courses).where(user_courses.c.user_id == "U42")),
+    ]
+
+
+def plan_nodes(plan: Dict[str, Any]) -> List[str]:
+    """실행 계획 트리에서 스캔 노드 요약 추출"""
+    nodes = []
+    node_type = plan.get("Node Type", "")
+    if "Scan" in node_type:
+        target = plan.get("Index Name") or plan.get("Relation Name") or ""
+        nodes.append(f"{node_type}({target})")
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
+
+
+async def explain(conn, stmt) -> Tuple[str, float]:
+    """EXPLAIN (ANALYZE, FORMAT JSON) 실행 후 (스캔 노드 요약, 실행 시간 ms) 반환"""
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    result = await conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"))
+    raw = result.scalar()
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    return ", ".join(plan_nodes(plan["Plan"])), plan["Execution Time"]
+
+
+async def analyze(conn) -> None:
+    """벤치마크 테이블 통계 갱신"""
+    for table in BENCH_TABLES:
+        await conn.execute(text(f"ANALYZE {SCHEMA}.{table.name}"))
+
+
+async def load_data(conn, rows: int, course_count: int) -> None:
+    """generate_series로 벤치마크 데이터 생성 (rows, course_count는 정수이므로 SQL에 직접 삽입)"""
+    await conn.execute(text(
+        "INSERT INTO courses (id, name, created_at, updated_at) "
+        f"SELECT 'C' || g, 'course ' || g, now(), now() FROM generate_series(0, {course_count - 1}) g"
+    ))
+    for table, date_column in (("notices", "date"), ("materials", "date"), ("assignments", "due_date")):
+        await conn.execute(text(
+            f"INSERT INTO {table} (article_id, course_id, title, {date_column}, created_at, updated_at) "
+            f"SELECT (g / {course_count})::text, 'C' || (g % {course_count}), 'title ' || g, "
+            "CASE WHEN g % 10 = 0 THEN NULL "
+            "ELSE to_char(date '2025-03-01' + (g % 120), 'YYYY-MM-DD') END, now(), now() "
+            f"FROM generate_series(0, {rows - 1}) g"
+        ))
+    await conn.execute(text(
+        "INSERT INTO attachments (course_id, source_type, source_id, file_name, storage_path, "
+        "notice_id, created_at, updated_at) "
+        f"SELECT 'C' || (g % {course_count}), 'notices', (g + 1)::text, 'file' || g || '.pdf', 'path/' || g, "
+        "g + 1, now() - make_interval(secs => g), now() "
+        f"FROM generate_series(0, {rows - 1}) g"
+    ))
+    user_links = max(rows // 10, 1)
+    await conn.execute(text(
+        f"INSERT INTO users (id) SELECT 'U' || g FROM generate_series(0, {user_links // 20}) g"
+    ))
+    await conn.execute(text(
+        "INSERT INTO user_courses (user_id, course_id, created_at) "
+        f"SELECT 'U' || (g / 20), 'C' || (g % {course_count}), now() "
+        f"FROM generate_series(0, {user_links - 1}) g ON CONFLICT DO NOTHING"
+    ))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="인덱스 적용 전/후 실행 계획 비교")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="콘텐츠/첨부파일 테이블별 행 수")
+    parser.add_argument("--courses", type=int, default=2_000, help="강의 수")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 스키마를 삭제하지 않음")
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URI)
+    engine = engine.execution_options(schema_translate_map={None: SCHEMA})
+
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.execute(text(f"SET LOCAL search_path TO {SCHEMA}"))
+            # 모델 정의대로 테이블 생성 후 보조 인덱스만 제거 (마이그레이션 적용 전 상태)
+            for table in BENCH_TABLES:
+                await conn.run_sync(lambda sync_conn, t=table: t.create(sync_conn))
+                for index in table.indexes:
+                    await conn.run_sync(lambda sync_conn, i=index: i.drop(sync_conn))
+
+            started = time.perf_counter()
+            await load_data(conn, args.rows, args.courses)
+            await analyze(conn)
+            print(f"데이터 생성 완료: 테이블별 {args.rows:,}행 ({time.perf_counter() - started:.1f}s)")
+
+        shapes = query_shapes(args.courses)
+        results: Dict[str, Dict[str, Tuple[str, float]]] = {}
+
+        for phase in ("before", "after"):
+            async with engine.begin() as conn:
+                await conn.execute(text(f"SET LOCAL search_path TO {SCHEMA}"))
+                if phase == "after":
+                    for table in BENCH_TABLES:
+                        for index in table.indexes:
+                            await conn.run_sync(lambda sync_conn, i=index: i.create(sync_conn))
+                    await analyze(conn)
+                for name, stmt in shapes:
+                    results.setdefault(name, {})[phase] = await explain(conn, stmt)
+
+        for name, phases in results.items():
+            before_plan, before_ms = phases["before"]
+            after_plan, after_ms = phases["after"]
+            print(f"\n{name}")
+            print(f"  before: {before_ms:9.2f} ms  {before_plan}")
+            print(f"  after : {after_ms:9.2f} ms  {after_plan}")
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,349 @@
+"""
+파서 벤치마크용 e-Class 페이지 코퍼스 생성
+
+실제 e-Class 응답과 같은 구조(머리말, 상단/좌측 메뉴, 스크립트, 꼬리말 포함)의 전체 페이지를
+고정된 시드로 만들어 test_data/eclass/bench/ 에 저장합니다. 이름, 학번, 이메일, 강의 코드는 모두
+가상의 값이므로 저장소에 그대로 커밋해도 됩니다. 같은 시드로 실행하면 항상 같은 파일이 나옵니다.
+
+사용법:
+    python scripts/benchmarks/make_parser_corpus.py
+    python scripts/benchmarks/parser_bench.py --update   # 코퍼스를 바꾼 뒤 기대 결과 갱신
+"""
+import argparse
+import os
+import random
+from html import escape
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CORPUS_DIR = os.path.join(ROOT, "test_data", "eclass", "bench")
+
+SUBJECTS = ["자료구조", "운영체제", "컴퓨터네트워크", "데이터베이스", "알고리즘", "소프트웨어공학",
+            "인공지능", "컴파일러", "선형대수", "확률과통계", "캡스톤디자인", "웹프로그래밍"]
+TOPICS = ["강의 슬라이드", "실습 안내", "퀴즈 공지", "보강 일정", "시험 범위", "과제 안내",
+          "참고 자료", "수업 녹화본", "성적 공지", "팀 구성 안내", "휴강 안내", "설문 안내"]
+PROFESSORS = ["교수A", "교수B", "교수C", "조교A", "조교B"]
+EXTENSIONS = ["pdf", "pptx", "hwp", "zip", "docx", "xlsx"]
+
+MENU_ITEMS = [
+    ("st_plan", "plan_form", "강의계획서"), ("st_onlineclass", "online_list_form", "온라인강의"),
+    ("st_notice", "notice_list_form", "공지사항"), ("st_lecture_material", "lecture_material_list_form", "강의자료"),
+    ("st_attendance", "attendance_list_form", "출석"), ("st_report", "report_list_form", "과제"),
+    ("st_qna", "qna_list_form", "질의응답"), ("st_discuss", "discuss_list_form", "토론"),
+    ("st_team", "team_list_form", "팀프로젝트"), ("st_survey", "survey_list_form", "설문"),
+]
+
+
+def page(title: str, body: str, rng: random.Random, course_menu: bool = True) -> str:
+    """e-Class 공통 레이아웃으로 본문을 감쌈"""
+    script = "\n".join(
+        f"  function fn_{i}(a, b) {{ if (a > b) {{ return a - {i}; }} return b + {i}; }}"
+        for i in range(rng.randint(60, 90))
+    )
+    style = "\n".join(
+        f"  .ui_{i} {{ margin: {i % 7}px; padding: {i % 5}px; color: #{i * 4099 % 0xFFFFFF:06x}; }}"
+        for i in range(rng.randint(40, 60))
+    )
+    top_menu = "\n".join(
+        f'      <li><a href="/ilos/main/menu_{i}.acl">메뉴 {i}</a></li>' for i in range(12)
+    )
+    side = ""
+    if course_menu:
+        side = "\n".join(
+            f'    <li class="course_menu_item" id="{mid}"><a href="/ilos/st/course/{path}.acl">{name}</a></li>'
+            for mid, path, name in MENU_ITEMS
+        )
+    quick_links = "\n".join(
+        f'      <li><a href="https://www.example.ac.kr/link/{i}" target="_blank">바로가기 {i}</a></li>'
+        for i in range(15)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta http-equiv="X-UA-Compatible" content="IE=edge">
+<title>{escape(title)} | e-Class</title>
+<link rel="stylesheet" href="/ilos/css/common.css">
+<link rel="stylesheet" href="/ilos/css/layout.css">
+<style type="text/css">
+{style}
+</style>
+<script type="text/javascript" src="/ilos/js/jquery-1.12.4.min.js"></script>
+<script type="text/javascript">
+{script}
+</script>
+</head>
+<body>
+<div id="header">
+  <h1 class="logo"><a href="/ilos/main/main_form.acl"><img src="/ilos/images/logo.png" alt="e-Class"></a></h1>
+  <div class="util"><span class="user_name">학생A(20250000)</span> <a href="/ilos/lo/logout.acl">로그아웃</a></div>
+  <div id="gnb">
+    <ul>
+{top_menu}
+    </ul>
+  </div>
+</div>
+<div id="container">
+  <div id="lnb">
+  <ul id="course_menu">
+{side}
+  </ul>
+  </div>
+  <div id="content">
+{body}
+  </div>
+</div>
+<div id="footer">
+  <div class="quick_links">
+    <ul>
+{quick_links}
+    </ul>
+  </div>
+  <address>가상대학교 교육혁신원 | 서울특별시 가상구 가상로 1</address>
+  <p class="copyright">Copyright (c) Example University. All rights reserved.</p>
+</div>
+</body>
+</html>
+"""
+
+
+def course_list(rng: random.Random, count: int = len(SUBJECTS)) -> str:
+    items = []
+    for i in range(count):
+        subject = SUBJECTS[i % len(SUBJECTS)]
+        day = rng.choice(["월", "화", "수", "목", "금"])
+        items.append(
+            '    <li style="background: url(/ilos/images/main/lecture_icon.gif) no-repeat 0 5px;">\n'
+            f'      <em class="sub_open" kj="A2025{1000000 + i * 7919:07d}" title="강의실 들어가기">'
+            f'{subject}({10100 + i * 37}-0{i % 3 + 1})</em>\n'
+            f'      <span>{day} {i % 8 + 1}-{i % 8 + 2}</span>\n'
+            '    </li>'
+        )
+    notices = "\n".join(
+        f'    <li class="notice_item"><a href="/ilos/main/notice_view.acl?SEQ={i}">전체 공지 {i}</a></li>'
+        for i in range(10)
+    )
+    body = f"""  <ul class="my_lecture">
+{chr(10).join(items)}
+  </ul>
+  <ul class="main_notice">
+{notices}
+  </ul>"""
+    return page("나의 강의실", body, rng, course_menu=False)
+
+
+def course_menu(rng: random.Random) -> str:
+    return page("강의실", '  <div class="course_home"><p>강의실 홈</p></div>', rng)
+
+
+def list_pager(rng: random.Random) -> str:
+    return '  <div class="paging">' + "".join(
+        f'<a href="#" onclick="listPage({i});">{i}</a>' for i in range(1, 11)
+    ) + "</div>"
+
+
+def notice_list(rng: random.Random, count: int = 50) -> str:
+    rows = []
+    for i in range(count, 0, -1):
+        article = 1000 + i * 13
+        attach = '<img class="download_icon" src="/ilos/images/file.gif">' if rng.random() < 0.4 else ""
+        rows.append(f"""  <tr style="cursor: pointer;">
+    <td class="center">{i}</td>
+    <td class="center">{'<img src="/ilos/images/new.gif" alt="new">' if i > count - 3 else ''}</td>
+    <td class="left" onclick="pageMove('/ilos/st/course/notice_view_form.acl?ARTL_NUM={article}&amp;SCH_VALUE=&amp;start=1', event);">
+      <div class="subjt_top">{i}주차 {rng.choice(TOPICS)} &amp; 일정</div>
+      <div class="subjt_bottom"><span>{rng.choice(PROFESSORS)}</span> <span>조회 {rng.randint(10, 400)}</span></div>
+    </td>
+    <td class="center">{attach}</td>
+    <td class="center">2025-{3 + i // 20:02d}-{i % 28 + 1:02d}</td>
+  </tr>""")
+    body = f"""  <div class="bbs_list">
+  <table class="bbslist">
+    <thead><tr><th>번호</th><th></th><th>제목</th><th>첨부</th><th>작성일</th></tr></thead>
+    <tbody>
+{chr(10).join(rows)}
+    </tbody>
+  </table>
+  </div>
+{list_pager(rng)}"""
+    return page("공지사항", body, rng)
+
+
+def material_list(rng: random.Random, count: int = 50) -> str:
+    rows = []
+    for i in range(count, 0, -1):
+        article = 900 + i * 7
+        notitop = ' class="notitop"' if i > count - 2 else ""
+        number = "공지" if i > count - 2 else str(i)
+        attach = '<img class="download_icon" src="/ilos/images/file.gif">' if rng.random() < 0.7 else ""
+        rows.append(f"""  <tr style="cursor: pointer;"{notitop}>
+    <td class="number">{number}</td>
+    <td class="left" onclick="pageMove('/ilos/st/course/lecture_material_view_form.acl?ARTL_NUM={article}', event);">
+      <div class="subjt_top">{i}주차 {rng.choice(TOPICS)}</div>
+      <div class="subjt_bottom"><span>{rng.choice(PROFESSORS)}</span><span>조회 {rng.randint(10, 400)}</span></div>
+    </td>
+    <td>{attach}</td>
+    <td class="number">2025-{3 + i // 20:02d}-{i % 28 + 1:02d}</td>
+  </tr>""")
+    body = f"""  <table class="bbslist">
+    <tr><th>번호</th><th>제목</th><th>첨부</th><th>작성일</th></tr>
+{chr(10).join(rows)}
+  </table>
+{list_pager(rng)}"""
+    return page("강의자료", body, rng)
+
+
+def assignment_list(rng: random.Random, count: int = 30) -> str:
+    rows = []
+    for i in range(count, 0, -1):
+        article = 3200 + i * 11
+        status = rng.choice(["미제출", "제출완료", "채점완료"])
+        score = "-" if status == "미제출" else str(rng.randint(5, 20))
+        rows.append(
+            f"  <tr onclick=\"pageMove('/ilos/st/course/report_view_form.acl?ARTL_NUM={article}', event);\">\n"
+            f"    <td>{i}</td><td>과제 {i}: {rng.choice(TOPICS)}</td><td>파일</td>"
+            f"<td>2025-03-{i % 28 + 1:02d}</td><td>2025-04-{i % 28 + 1:02d} 23:59</td>"
+            f"<td>{status}</td><td>{score}</td>\n"
+            "  </tr>"
+        )
+    body = f"""  <table class="table_topic">
+    <tr><th>번호</th><th>제목</th><th>제출방식</th><th>시작일</th><th>마감일</th><th>상태</th><th>점수</th></tr>
+{chr(10).join(rows)}
+  </table>"""
+    return page("과제", body, rng)
+
+
+def paragraphs(rng: random.Random, count: int) -> str:
+    return "\n".join(
+        f"        <p>{rng.choice(TOPICS)} 관련 안내 {i}입니다. <b>{rng.choice(SUBJECTS)}</b> 수업의 "
+        f"{i % 15 + 1}주차 내용을 참고하세요.<br>문의는 {rng.choice(PROFESSORS)}에게 해 주세요.</p>"
+        for i in range(count)
+    )
+
+
+def attach_area(rng: random.Random, content_seq: str, count: int) -> str:
+    links = "\n".join(
+        f'    <a href="/ilos/co/efile_download.acl?FILE_SEQ={88000 + i}&amp;CONTENT_SEQ={content_seq}">'
+        f"첨부_{i}.{rng.choice(EXTENSIONS)}</a>"
+        for i in range(count)
+    )
+    return f'  <div class="attach_area">\n{links}\n  </div>'
+
+
+def notice_detail(rng: random.Random) -> str:
+    content_seq = "CS_202503171187"
+    body = f"""  <script type="text/javascript">
+    var viewParam = {{ ARTL_NUM: "1187", CONTENT_SEQ: "{content_seq}", pf_st_flag: "2" }};
+  </script>
+  <table class="bbsview">
+    <tr><th>제목</th><td>3주차 휴강 &amp; 보강 일정</td></tr>
+    <tr><th>작성자</th><td>교수A</td></tr>
+    <tr>
+      <td class="textviewer" colspan="2">
+      <div>
+{paragraphs(rng, 40)}
+        <ul>{''.join(f'<li>항목 {i}</li>' for i in range(20))}</ul>
+      </div>
+      </td>
+    </tr>
+  </table>
+{attach_area(rng, content_seq, 5)}"""
+    return page("공지사항", body, rng)
+
+
+def material_detail(rng: random.Random) -> str:
+    body = f"""  <form name="viewForm"><input type="hidden" name="CONTENT_SEQ" value="CS_202503040905"></form>
+  <table class="bbsview">
+    <tr><th>제목</th><td>1주차 강의 영상</td></tr>
+    <tr>
+      <td class="textviewer" colspan="2">
+{paragraphs(rng, 30)}
+        <video controls width="640"><source src="https://vod.example.ac.kr/media/week1.mp4" type="video/mp4"></video>
+      </td>
+    </tr>
+  </table>"""
+    return page("강의자료", body, rng)
+
+
+def assignment_detail(rng: random.Random) -> str:
+    body = f"""  <script>
+    function openEfile() {{ efileList({{ CONTENT_SEQ: 'CS_202504013301', ky: 'A20251234567' }}); }}
+  </script>
+  <table class="bbsview">
+    <tr><th>제목</th><td>과제 2: 해시 테이블 구현</td></tr>
+    <tr><th>마감일</th><td>2025-04-15 23:59</td></tr>
+    <tr><th>배점</th><td>20</td></tr>
+    <tr><th>내 점수</th><td>  -  </td></tr>
+    <tr>
+      <td class="textviewer" colspan="2">
+{paragraphs(rng, 25)}
+      </td>
+    </tr>
+  </table>"""
+    return page("과제", body, rng)
+
+
+def efile_list(rng: random.Random) -> str:
+    # efile_list.acl은 레이아웃 없이 목록 조각만 반환
+    items = "\n".join(
+        f'  <li><a href="/ilos/co/efile_download.acl?FILE_SEQ={99100 + i}&amp;CONTENT_SEQ=CS_202504013301">'
+        f"자료_{i}.{rng.choice(EXTENSIONS)}</a> <span>({rng.randint(10, 900)}KB)</span></li>"
+        for i in range(12)
+    )
+    return f'<ul class="efile_list">\n{items}\n</ul>\n'
+
+
+def syllabus(rng: random.Random) -> str:
+    def section(title: str, rows: List[str]) -> str:
+        return (f'  <div style="padding-top: 20px; font-weight: bold;">[{title}]</div>\n'
+                '  <table class="bbsview">\n' + "\n".join(rows) + "\n  </table>")
+
+    basic = [f"    <tr><th>{k}</th><td>{v}</td></tr>" for k, v in
+             [("교과목명", "자료구조"), ("학수번호", "10123-01"), ("학점", "3"), ("이수구분", "전공필수"),
+              ("강의시간", "화 3-4, 목 3-4"), ("강의실", "가상관 301호")]]
+    professor = [f"    <tr><th>{k}</th><td>{v}</td></tr>" for k, v in
+                 [("성명", "교수A"), ("이메일", "prof-a@example.ac.kr"), ("연구실", "가상관 512호"),
+                  ("면담시간", "수 14:00-16:00")]]
+    plan = [f"    <tr><th>{k}</th><td>{v}</td></tr>" for k, v in
+            [("강의목표", "기본 자료구조의 원리와 구현을 익힌다."), ("평가방법", "중간 30%, 기말 40%, 과제 30%"),
+             ("교재", "가상 출판사, 자료구조 입문"), ("선수과목", "프로그래밍 기초")]]
+    weekly = ["    <tr><th>주차</th><th>내용</th><th>비고</th></tr>"] + [
+        f"    <tr><td>{week}</td><td>{rng.choice(TOPICS)} ({week}주차)</td><td>{'과제' if week % 4 == 0 else ''}</td></tr>"
+        for week in range(1, 16)
+    ]
+    body = "\n".join([
+        section("수업기본정보", basic), section("담당교수정보", professor),
+        section("강의계획", plan), section("주별강의계획", weekly),
+    ])
+    return page("강의계획서", body, rng)
+
+
+PAGES: Dict[str, Callable[[random.Random], str]] = {
+    "course_list": course_list,
+    "course_menu": course_menu,
+    "notice_list": notice_list,
+    "notice_detail": notice_detail,
+    "material_list": material_list,
+    "material_detail": material_detail,
+    "assignment_list": assignment_list,
+    "assignment_detail": assignment_detail,
+    "efile_list": efile_list,
+    "syllabus": syllabus,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="파서 벤치마크 코퍼스 생성")
+    parser.add_argument("--seed", type=int, default=20250301, help="난수 시드")
+    args = parser.parse_args()
+
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    for name, build in PAGES.items():
+        html = build(random.Random(f"{args.seed}:{name}"))
+        with open(os.path.join(CORPUS_DIR, f"{name}.html"), "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"{name:<20} {len(html.encode('utf-8')):>8,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+파서 벤치마크 및 회귀 검사
+
+test_data/eclass/bench/ 의 전체 크기 e-Class 페이지(make_parser_corpus.py로 생성)를
+각 파서와 백엔드로 반복 파싱하여 초당 페이지 수와 메모리 할당량을 측정합니다.
+외부 서비스나 DB 없이 로컬에서만 실행됩니다.
+
+- 정확성: 매 실행마다 결과를 test_data/eclass/bench/expected/*.json 과 비교합니다.
+- 속도/메모리: --save 로 결과를 저장하고, --compare 로 저장된 기준과 비교하여
+  허용 범위(--tolerance)를 넘게 느려지거나 메모리가 늘면 종료 코드 1로 끝납니다.
+
+사용법:
+    python scripts/benchmarks/parser_bench.py
+    python scripts/benchmarks/parser_bench.py --backend lxml --min-time 2
+    python scripts/benchmarks/parser_bench.py --save /tmp/before.json
+    python scripts/benchmarks/parser_bench.py --compare /tmp/before.json --tolerance 0.15
+    python scripts/benchmarks/parser_bench.py --update   # 기대 결과 갱신
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from app.services.parsers.course_parser import CourseParser
+from app.services.parsers.notice_parser import NoticeParser
+from app.services.parsers.material_parser import MaterialParser
+from app.services.parsers.assignment_parser import AssignmentParser
+from app.services.parsers.syllabus_parser import SyllabusParser
+from app.services.parsers.document import SUPPORTED_BACKENDS, DEFAULT_BACKEND, resolve_backend
+
+CORPUS_DIR = os.path.join(ROOT, "test_data", "eclass", "bench")
+EXPECTED_DIR = os.path.join(CORPUS_DIR, "expected")
+
+
+def detail_extractors(parser) -> Callable[[str], Dict[str, Any]]:
+    """상세 페이지 동기화가 실행하는 추출 작업 전체 (한 번 파싱한 문서를 공유)"""
+    def run(html: str) -> Dict[str, Any]:
+        doc = parser.parse_document(html)
+        return {
+            "detail": parser.parse_detail(doc),
+            "content_seq": parser.extract_content_seq(doc),
+        }
+    return run
+
+
+# (케이스 이름, 코퍼스 파일, 백엔드별 파싱 함수 생성기)
+CASES: List[Tuple[str, str, Callable[[str], Callable[[str], Any]]]] = [
+    ("course_list", "course_list.html", lambda b: CourseParser(b).parse_list),
+    ("course_menu", "course_menu.html", lambda b: CourseParser(b).parse_course_menus),
+    ("notice_list", "notice_list.html", lambda b: NoticeParser(b).parse_list),
+    ("notice_detail", "notice_detail.html", lambda b: detail_extractors(NoticeParser(b))),
+    ("material_list", "material_list.html", lambda b: MaterialParser(b).parse_list),
+    ("material_detail", "material_detail.html", lambda b: detail_extractors(MaterialParser(b))),
+    ("assignment_list", "assignment_list.html", lambda b: AssignmentParser(b).parse_list),
+    ("assignment_detail", "assignment_detail.html", lambda b: detail_extractors(AssignmentParser(b))),
+    ("efile_list", "efile_list.html", lambda b: NoticeParser(b).parse_attachments),
+    ("syllabus", "syllabus.html", lambda b: SyllabusParser(b).parse_syllabus),
+]
+
+
+def dump(result: Any) -> str:
+    return json.dumps(result, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+
+
+def load(fixture: str) -> str:
+    with open(os.path.join(CORPUS_DIR, fixture), encoding="utf-8") as f:
+        return f.read()
+
+
+def measure_speed(func: Callable[[str], Any], html: str, min_time: float) -> Tuple[int, float]:
+    """min_time초 이상 반복 실행하여 (반복 횟수, 경과 시간) 반환"""
+    func(html)  # 워밍업
+    iterations = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        func(html)
+        iterations += 1
+        elapsed = time.perf_counter() - started
+    return iterations, elapsed
+
+
+def measure_memory(func: Callable[[str], Any], html: str) -> Tuple[int, int]:
+    """한 번 파싱할 때의 (최대 사용 메모리 바이트, 할당 블록 수) 반환"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = func(html)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return peak - base, blocks
+
+
+def check(name: str, actual: str) -> bool:
+    with open(os.path.join(EXPECTED_DIR, f"{name}.json"), encoding="utf-8") as f:
+        return f.read() == actual
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline_path: str, tolerance: float) -> int:
+    """기준 결과와 비교하여 회귀 건수 반환"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = 0
+    print(f"\n기준({baseline_path})과 비교 (허용 범위 {tolerance:.0%})")
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        speed = current["pages_per_sec"] / previous["pages_per_sec"] - 1
+        memory = current["peak_kib"] / previous["peak_kib"] - 1 if previous["peak_kib"] else 0.0
+        regressed = speed < -tolerance or memory > tolerance
+        regressions += regressed
+        print(f"{'[REGRESSION]' if regressed else '[OK]':<13} {key:<32} "
+              f"속도 {speed:+7.1%}  최대 메모리 {memory:+7.1%}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="파서 벤치마크 및 회귀 검사")
+    parser.add_argument("--backend", choices=SUPPORTED_BACKENDS, action="append",
+                        help="측정할 백엔드 (여러 번 지정 가능, 기본: 설치된 모든 백엔드)")
+    parser.add_argument("--case", action="append", help="측정할 케이스 이름 (기본: 전체)")
+    parser.add_argument("--min-time", type=float, default=1.0, help="케이스별 최소 측정 시간(초)")
+    parser.add_argument("--save", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 회귀 비율")
+    parser.add_argument("--update", action="store_true", help="html.parser 결과로 기대 결과 갱신")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if not args.case or case[0] in args.case]
+
+    if args.update:
+        os.makedirs(EXPECTED_DIR, exist_ok=True)
+        for name, fixture, factory in cases:
+            with open(os.path.join(EXPECTED_DIR, f"{name}.json"), "w", encoding="utf-8") as f:
+                f.write(dump(factory(DEFAULT_BACKEND)(load(fixture))))
+            print(f"기대 결과 갱신: {name}")
+        return 0
+
+    backends = [b for b in (args.backend or SUPPORTED_BACKENDS) if resolve_backend(b) == b]
+
+    results: Dict[str, Dict[str, float]] = {}
+    failures = 0
+    print(f"{'케이스':<20} {'백엔드':<12} {'KiB':>7} {'pages/s':>10} {'ms/page':>9} "
+          f"{'최대 KiB':>10} {'블록':>8}  정확성")
+    for name, fixture, factory in cases:
+        html = load(fixture)
+        size_kib = len(html.encode("utf-8")) / 1024
+        for backend in backends:
+            func = factory(backend)
+            correct = check(name, dump(func(html)))
+            failures += not correct
+
+            iterations, elapsed = measure_speed(func, html, args.min_time)
+            peak, blocks = measure_memory(func, html)
+            pages_per_sec = iterations / elapsed
+            results[f"{name}/{backend}"] = {
+                "pages_per_sec": pages_per_sec,
+                "ms_per_page": 1000 / pages_per_sec,
+                "peak_kib": peak / 1024,
+                "blocks": blocks,
+                "page_kib": size_kib,
+            }
+            print(f"{name:<20} {backend:<12} {size_kib:7.1f} {pages_per_sec:10.1f} "
+                  f"{1000 / pages_per_sec:9.3f} {peak / 1024:10.1f} {blocks:8d}  "
+                  f"{'OK' if correct else 'FAIL'}")
+
+    if failures:
+        print(f"\n정확성 검사 실패 {failures}건 - 결과가 expected/*.json 과 다릅니다.")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"\n결과 저장: {args.save}")
+
+    regressions = compare(results, args.compare, args.tolerance) if args.compare else 0
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
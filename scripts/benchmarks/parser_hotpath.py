@@ -0,0 +1,102 @@
+"""
+파서 행 단위 핫패스 마이크로벤치마크
+
+100행짜리 공지사항/강의자료/과제 목록 페이지(make_parser_corpus.py와 같은 레이아웃)로
+트리 생성 시간과, 미리 만든 트리(ParsedDocument)에 대한 parse_list 실행 시간을 따로 잽니다.
+후자를 행 수로 나눈 값(us/row)이 정규식/선택자 등 파서 핫패스의 행당 비용입니다.
+행마다 호출되는 보조 메서드(extract_url_from_onclick, extract_article_id, clean_text)도 따로 측정합니다.
+
+사용법:
+    python scripts/benchmarks/parser_hotpath.py --save /tmp/hotpath_before.json
+    (파서 변경 후)
+    python scripts/benchmarks/parser_hotpath.py --compare /tmp/hotpath_before.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from make_parser_corpus import notice_list, material_list, assignment_list
+from app.services.parsers import notice_parser, material_parser, assignment_parser
+from app.services.parsers.document import DEFAULT_BACKEND, SUPPORTED_BACKENDS
+
+ROWS = 100
+
+# (케이스 이름, 페이지 생성 함수, 파서 클래스, 목록 페이지 strainer)
+CASES = [
+    ("notice_list", notice_list, notice_parser.NoticeParser, notice_parser.NOTICE_ROW_STRAINER),
+    ("material_list", material_list, material_parser.MaterialParser, material_parser.MATERIAL_ROW_STRAINER),
+    ("assignment_list", assignment_list, assignment_parser.AssignmentParser,
+     assignment_parser.ASSIGNMENT_TABLE_STRAINER),
+]
+
+ONCLICK = "pageMove('/ilos/st/course/notice_view_form.acl?ARTL_NUM=1203&SCH_VALUE=&start=1', event);"
+DETAIL_URL = "https://eclass.seoultech.ac.kr/ilos/st/course/report_view_form.acl?NORCT_NUM=3301&start=1"
+TEXT = "  3주차   휴강 &amp; \n\t 보강&nbsp;일정  "
+
+
+def best(func, number: int, repeat: int) -> float:
+    """repeat번 측정 중 가장 빠른 1회 실행 시간(초)"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="파서 행 단위 핫패스 마이크로벤치마크")
+    parser.add_argument("--backend", choices=SUPPORTED_BACKENDS, default=DEFAULT_BACKEND)
+    parser.add_argument("--number", type=int, default=20, help="측정 1회당 페이지 파싱 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--save", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    results: Dict[str, float] = {}
+    print(f"{'케이스':<18} {'행':>4} {'트리 ms':>9} {'추출 ms':>9} {'us/row':>9}")
+    for name, build, parser_class, strainer in CASES:
+        html = build(random.Random(f"hotpath:{name}"), count=ROWS)
+        content_parser = parser_class(args.backend)
+        # 목록 파싱은 트리를 수정하지 않으므로 같은 문서를 반복해서 넘겨 추출 비용만 측정
+        doc = content_parser.parse_document(html, parse_only=strainer)
+        rows = len(content_parser.parse_list(doc))
+
+        tree = best(lambda: content_parser.parse_document(html, parse_only=strainer), args.number, args.repeat)
+        extract = best(lambda: content_parser.parse_list(doc), args.number * 5, args.repeat)
+        per_row = extract / rows * 1e6
+        results[f"{name}/us_per_row"] = per_row
+        print(f"{name:<18} {rows:>4} {tree * 1e3:9.2f} {extract * 1e3:9.2f} {per_row:9.2f}")
+
+    helper = notice_parser.NoticeParser(args.backend)
+    helpers = {
+        "extract_url_from_onclick": lambda: helper.extract_url_from_onclick(ONCLICK),
+        "extract_article_id": lambda: helper.extract_article_id(DETAIL_URL),
+        "clean_text": lambda: helper.clean_text(TEXT),
+    }
+    print(f"\n{'보조 메서드':<28} {'ns/call':>9}")
+    for name, func in helpers.items():
+        per_call = best(func, 50000, args.repeat) * 1e9
+        results[f"{name}/ns_per_call"] = per_call
+        print(f"{name:<28} {per_call:9.0f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n결과 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        print(f"\n이전 결과({args.compare}) 대비")
+        for key, value in results.items():
+            if key in previous and value:
+                print(f"{key:<40} {previous[key]:10.2f} -> {value:10.2f}  ({previous[key] / value:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+목록 응답 직렬화 마이크로벤치마크
+
+공지사항/강의자료/과제 100개짜리 페이지(ORM 객체, 본문 약 2KB, 첨부파일 0~2개)를
+다음 세 가지 방법으로 JSON 바이트까지 만드는 시간을 잽니다.
+
+- fastapi: FastAPI 기본 경로 (serialize_response로 response_model 검증/변환 → JSONResponse.render)
+- fast: app.api.responses.render_json (캐시한 TypeAdapter로 검증 → pydantic-core dump_json)
+- orjson: 같은 TypeAdapter로 검증 → dump_python → orjson.dumps (참고용, orjson이 설치된 경우만)
+
+세 방법의 출력이 같은지도 확인합니다.
+
+사용법:
+    python scripts/benchmarks/serialization_bench.py --save /tmp/serialization_before.json
+    (변경 후)
+    python scripts/benchmarks/serialization_bench.py --compare /tmp/serialization_before.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.responses import get_type_adapter, render_json
+from app.db import base  # noqa: F401  (모든 모델을 매퍼에 등록)
+from app.models.assignment import Assignment
+from app.models.attachment import Attachment
+from app.models.material import Material
+from app.models.notice import Notice
+from app.schemas.assignment import AssignmentList
+from app.schemas.material import MaterialList
+from app.schemas.notice import NoticeList
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+ROWS = 100
+WORDS = ["강의", "과제", "제출", "안내", "시험", "일정", "변경", "자료", "참고", "주차", "보강", "휴강"]
+
+
+def text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def attachments(rng: random.Random, source_type: str, source_id: int, now: datetime):
+    return [
+        Attachment(
+            id=source_id * 10 + index, course_id="BENCH0001", source_type=source_type,
+            source_id=str(source_id), file_name=f"file_{source_id}_{index}.pdf", file_size=rng.randint(1_000, 5_000_000),
+            content_type="application/pdf", storage_path=f"BENCH0001/{source_type}/file_{source_id}_{index}.pdf",
+            original_url=f"https://eclass.example/ilos/co/efile_download.acl?FILE_SEQ={source_id}{index}",
+            created_at=now, updated_at=now
+        )
+        for index in range(rng.randint(0, 2))
+    ]
+
+
+def build_page(kind: str, rng: random.Random) -> Dict:
+    now = datetime(2025, 3, 1, 9, 0, 0)
+    items = []
+    for row in range(1, ROWS + 1):
+        common = dict(
+            id=row, article_id=str(1000 + row), course_id="BENCH0001", title=text(rng, 6),
+            content=text(rng, 300), created_at=now + timedelta(minutes=row), updated_at=now + timedelta(minutes=row)
+        )
+        if kind == "notices":
+            item = Notice(author="교수", date="2025-03-01", views=rng.randint(0, 500), **common)
+        elif kind == "materials":
+            item = Material(author="교수", date="2025-03-01", views=rng.randint(0, 500), **common)
+        else:
+            item = Assignment(due_date="2025-04-01 23:59", status="진행중", submission_status="미제출", **common)
+        item.attachments = attachments(rng, kind, row, now)
+        items.append(item)
+    return {kind: items, "total": ROWS, "limit": ROWS, "next_cursor": None}
+
+
+CASES = [("notices", NoticeList), ("materials", MaterialList), ("assignments", AssignmentList)]
+
+
+def best(func: Callable, number: int, repeat: int) -> float:
+    """repeat번 측정 중 가장 빠른 1회 실행 시간(초)"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 마이크로벤치마크")
+    parser.add_argument("--number", type=int, default=20, help="측정 1회당 직렬화 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--save", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    results: Dict[str, float] = {}
+    print(f"{'목록':<12} {'KB':>6} {'fastapi ms':>11} {'fast ms':>9} {'orjson ms':>10} {'배율':>6}")
+    for kind, model in CASES:
+        page = build_page(kind, random.Random(f"serialization:{kind}"))
+        field = create_model_field("response", model)
+        adapter = get_type_adapter(model)
+
+        def fastapi_default() -> bytes:
+            content = loop.run_until_complete(
+                serialize_response(field=field, response_content=page, is_coroutine=True)
+            )
+            return JSONResponse(content).body
+
+        def fast() -> bytes:
+            return render_json(model, page)
+
+        def with_orjson() -> bytes:
+            return orjson.dumps(adapter.dump_python(adapter.validate_python(page, from_attributes=True)))
+
+        expected = fastapi_default()
+        assert json.loads(fast()) == json.loads(expected), f"{kind}: fast 경로 출력이 다릅니다"
+        if orjson is not None:
+            assert json.loads(with_orjson()) == json.loads(expected), f"{kind}: orjson 경로 출력이 다릅니다"
+
+        default_time = best(fastapi_default, args.number, args.repeat)
+        fast_time = best(fast, args.number, args.repeat)
+        orjson_time = best(with_orjson, args.number, args.repeat) if orjson is not None else float("nan")
+        results[f"{kind}/fastapi_ms"] = default_time * 1e3
+        results[f"{kind}/fast_ms"] = fast_time * 1e3
+        if orjson is not None:
+            results[f"{kind}/orjson_ms"] = orjson_time * 1e3
+        print(
+            f"{kind:<12} {len(expected) / 1024:6.0f} {default_time * 1e3:11.2f} {fast_time * 1e3:9.2f} "
+            f"{orjson_time * 1e3:10.2f} {default_time / fast_time:5.2f}x"
+        )
+    loop.close()
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n결과 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        print(f"\n이전 결과({args.compare}) 대비")
+        for key, value in results.items():
+            if key in previous and value:
+                print(f"{key:<28} {previous[key]:8.2f} -> {value:8.2f}  ({previous[key] / value:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
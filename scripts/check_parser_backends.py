@@ -0,0 +1,112 @@
+"""
+HTML 파서 백엔드 동등성 검사
+
+test_data/eclass/ 의 e-Class 페이지를 모든 파서(Course/Notice/Material/Assignment/Syllabus)로
+각 백엔드(html.parser, lxml)에서 파싱하고, 결과가 스냅샷(test_data/eclass/expected/*.json)과
+완전히 같은지 확인합니다. 하나라도 다르면 종료 코드 1로 끝나므로 CI에서 그대로 사용할 수 있습니다.
+
+사용법:
+    python scripts/check_parser_backends.py            # 모든 백엔드 검사
+    python scripts/check_parser_backends.py --update   # html.parser 결과로 스냅샷 갱신
+
+HTML_PARSER_BACKEND 설정을 바꾸기 전에 이 검사가 통과하는지 확인하세요.
+"""
+import argparse
+import difflib
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.parsers.course_parser import CourseParser
+from app.services.parsers.notice_parser import NoticeParser
+from app.services.parsers.material_parser import MaterialParser
+from app.services.parsers.assignment_parser import AssignmentParser
+from app.services.parsers.syllabus_parser import SyllabusParser
+from app.services.parsers.document import SUPPORTED_BACKENDS, DEFAULT_BACKEND, resolve_backend
+
+FIXTURE_DIR = os.path.join(ROOT, "test_data", "eclass")
+EXPECTED_DIR = os.path.join(FIXTURE_DIR, "expected")
+
+
+def detail_extractors(parser) -> Callable[[str], Dict[str, Any]]:
+    """상세 페이지에서 실제 동기화가 사용하는 추출 결과를 모두 모음"""
+    def run(html: str) -> Dict[str, Any]:
+        doc = parser.parse_document(html)
+        return {
+            "detail": parser.parse_detail(doc),
+            "content_seq": parser.extract_content_seq(doc),
+        }
+    return run
+
+
+# (케이스 이름, 픽스처 파일, 백엔드별 파싱 함수 생성기)
+CASES: List[Tuple[str, str, Callable[[str], Callable[[str], Any]]]] = [
+    ("course_list", "course_list.html", lambda b: CourseParser(b).parse_list),
+    ("course_menu", "course_menu.html", lambda b: CourseParser(b).parse_course_menus),
+    ("notice_list", "notice_list.html", lambda b: NoticeParser(b).parse_list),
+    ("notice_detail", "notice_detail.html", lambda b: detail_extractors(NoticeParser(b))),
+    ("material_list", "material_list.html", lambda b: MaterialParser(b).parse_list),
+    ("material_detail", "material_detail.html", lambda b: detail_extractors(MaterialParser(b))),
+    ("assignment_list", "assignment_list.html", lambda b: AssignmentParser(b).parse_list),
+    ("assignment_detail", "assignment_detail.html", lambda b: detail_extractors(AssignmentParser(b))),
+    ("efile_list", "efile_list.html", lambda b: NoticeParser(b).parse_attachments),
+    ("syllabus", "syllabus.html", lambda b: SyllabusParser(b).parse_syllabus),
+]
+
+
+def dump(result: Any) -> str:
+    return json.dumps(result, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 동등성 검사")
+    parser.add_argument("--update", action="store_true", help="html.parser 결과로 스냅샷 갱신")
+    args = parser.parse_args()
+
+    if args.update:
+        os.makedirs(EXPECTED_DIR, exist_ok=True)
+        for name, fixture, factory in CASES:
+            with open(os.path.join(FIXTURE_DIR, fixture), encoding="utf-8") as f:
+                html = f.read()
+            with open(os.path.join(EXPECTED_DIR, f"{name}.json"), "w", encoding="utf-8") as f:
+                f.write(dump(factory(DEFAULT_BACKEND)(html)))
+            print(f"스냅샷 갱신: {name}")
+        return 0
+
+    backends = [b for b in SUPPORTED_BACKENDS if resolve_backend(b) == b]
+    skipped = sorted(set(SUPPORTED_BACKENDS) - set(backends))
+    if skipped:
+        print(f"설치되지 않아 건너뛴 백엔드: {', '.join(skipped)}")
+
+    failures = 0
+    for name, fixture, factory in CASES:
+        with open(os.path.join(FIXTURE_DIR, fixture), encoding="utf-8") as f:
+            html = f.read()
+        with open(os.path.join(EXPECTED_DIR, f"{name}.json"), encoding="utf-8") as f:
+            expected = f.read()
+
+        for backend in backends:
+            actual = dump(factory(backend)(html))
+            if actual == expected:
+                print(f"[OK]   {name:<20} {backend}")
+                continue
+
+            failures += 1
+            print(f"[FAIL] {name:<20} {backend}")
+            sys.stdout.writelines(difflib.unified_diff(
+                expected.splitlines(keepends=True),
+                actual.splitlines(keepends=True),
+                fromfile=f"expected/{name}.json",
+                tofile=f"{backend}/{name}.json"
+            ))
+
+    print(f"\n{len(CASES) * len(backends) - failures}/{len(CASES) * len(backends)} 통과")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+로컬 e-Class 대역(stand-in) 서버
+
+실제 eclass.seoultech.ac.kr 대신 EclassSession, 파서, 콘텐츠 서비스가 호출하는 경로를
+벤치마크 코퍼스(scripts/benchmarks/make_parser_corpus.py)와 같은 형태의 페이지로 응답합니다.
+강의 수, 목록 행 수, 지연 시간, 오류 비율을 지정할 수 있고 같은 시드면 항상 같은 페이지를 만들므로
+처리량 측정과 통합 테스트를 오프라인에서 재현 가능하게 실행할 수 있습니다.
+
+사용법:
+    python scripts/eclass_standin.py --port 8900 --courses 6 --latency-ms 80 --jitter-ms 40 --error-rate 0.01
+    ECLASS_BASE_URL=http://127.0.0.1:8900 uvicorn main:app   # 서버가 대역 서버를 바라보도록 설정
+
+다른 스크립트에서는 create_app(StandinConfig(...))로 만든 앱을 httpx.ASGITransport에 바로 연결할 수 있습니다.
+요청 통계는 GET /_standin/stats 로 확인합니다.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import uuid
+from collections import Counter
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+import make_parser_corpus as corpus
+
+SESSION_COOKIE = "JSESSIONID"
+
+
+@dataclass
+class StandinConfig:
+    """대역 서버 설정"""
+    courses: int = 6  # 강의 목록에 나오는 강의 수
+    notices: int = 50  # 강의별 공지사항 목록 행 수
+    materials: int = 50  # 강의별 강의자료 목록 행 수
+    assignments: int = 30  # 강의별 과제 목록 행 수
+    latency_ms: float = 0.0  # 모든 응답에 더할 지연 시간
+    jitter_ms: float = 0.0  # 지연 시간에 더할 무작위 편차 (0 ~ jitter_ms)
+    error_rate: float = 0.0  # 503으로 응답할 확률 (로그인/정적 통계 경로 제외)
+    file_kb: int = 64  # efile_download.acl 응답 크기
+    password: Optional[str] = None  # 지정하면 이 비밀번호만 로그인 허용
+    seed: int = 20250301
+
+
+LOGIN_FORM = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>로그인 | e-Class</title></head>
+<body><form action="/ilos/lo/login.acl" method="post">
+<input name="usr_id"><input name="usr_pwd" type="password"></form>
+<a href="/ilos/main/login_form.acl">로그인</a></body></html>
+"""
+
+
+def create_app(config: Optional[StandinConfig] = None) -> FastAPI:
+    """대역 서버 ASGI 앱 생성"""
+    config = config or StandinConfig()
+    app = FastAPI(title="e-Class stand-in", docs_url=None, redoc_url=None, openapi_url=None)
+    sessions: dict = {}  # 세션 쿠키 -> 사용자 ID
+    stats: Counter = Counter()
+    rng = random.Random(config.seed)
+
+    def page_rng(*parts) -> random.Random:
+        return random.Random(":".join(str(p) for p in (config.seed, *parts)))
+
+    @lru_cache(maxsize=None)
+    def render(kind: str, course_id: str = "", article: str = "") -> str:
+        """페이지 생성 (같은 인자면 같은 페이지이므로 캐시)"""
+        r = page_rng(kind, course_id, article)
+        if kind == "main":
+            return corpus.course_list(r, count=config.courses)
+        if kind == "course_menu":
+            return corpus.course_menu(r)
+        if kind == "notice_list":
+            return corpus.notice_list(r, count=config.notices)
+        if kind == "material_list":
+            return corpus.material_list(r, count=config.materials)
+        if kind == "assignment_list":
+            return corpus.assignment_list(r, count=config.assignments)
+        if kind == "syllabus":
+            return corpus.syllabus(r)
+        # 상세 페이지: 게시글마다 CONTENT_SEQ가 달라지도록 코퍼스 페이지의 값을 바꿔 사용
+        content_seq = f"CS_{course_id or 'X'}_{article}"
+        if kind == "notice_detail":
+            return corpus.notice_detail(r).replace("CS_202503171187", content_seq).replace('"1187"', f'"{article}"')
+        if kind == "material_detail":
+            return corpus.material_detail(r).replace("CS_202503040905", content_seq)
+        if kind == "assignment_detail":
+            return corpus.assignment_detail(r).replace("CS_202504013301", content_seq)
+        if kind == "efile_list":
+            return corpus.efile_list(r).replace("CS_202504013301", article)
+        raise KeyError(kind)
+
+    def logged_in(request: Request) -> bool:
+        return request.cookies.get(SESSION_COOKIE) in sessions
+
+    def html(kind: str, request: Request, course_id: str = "", article: str = "") -> Response:
+        if not logged_in(request):
+            return HTMLResponse(LOGIN_FORM)
+        return HTMLResponse(render(kind, course_id, article))
+
+    @app.middleware("http")
+    async def simulate_network(request: Request, call_next):
+        path = request.url.path
+        if path.startswith("/_standin"):
+            return await call_next(request)
+        stats[path] += 1
+
+        delay = config.latency_ms + (rng.uniform(0, config.jitter_ms) if config.jitter_ms else 0.0)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if config.error_rate and path != "/ilos/lo/login.acl" and rng.random() < config.error_rate:
+            stats["errors"] += 1
+            return HTMLResponse("Service Unavailable", status_code=503)
+        return await call_next(request)
+
+    @app.post("/ilos/lo/login.acl")
+    async def login(request: Request):
+        form = await request.form()
+        if not form.get("usr_id") or (config.password is not None and form.get("usr_pwd") != config.password):
+            return HTMLResponse(
+                "<script>alert('로그인 정보가 일치하지 않습니다.');"
+                "document.location.href='/ilos/main/login_form.acl';</script>"
+            )
+        token = uuid.uuid4().hex
+        sessions[token] = form["usr_id"]
+        response = HTMLResponse("<script>document.location.href='/ilos/main/main_form.acl';</script>")
+        response.set_cookie(SESSION_COOKIE, token)
+        return response
+
+    @app.get("/ilos/main/main_form.acl")
+    async def main_form(request: Request):
+        return html("main", request)
+
+    @app.post("/ilos/st/course/eclass_room_submain.acl")
+    async def eclass_room_submain(request: Request):
+        if not logged_in(request):
+            return HTMLResponse(LOGIN_FORM)
+        return JSONResponse({"isError": False, "returnURL": "/ilos/st/course/submain_form.acl"})
+
+    @app.get("/ilos/st/course/submain_form.acl")
+    async def submain_form(request: Request, KJKEY: str = ""):
+        return html("course_menu", request, KJKEY)
+
+    @app.api_route("/notice/notice_list.jsp", methods=["GET", "POST"])
+    async def notice_list(request: Request, ky: str = ""):
+        return html("notice_list", request, ky)
+
+    @app.api_route("/lecture_material/lecture_material_list.jsp", methods=["GET", "POST"])
+    async def material_list(request: Request, ky: str = ""):
+        return html("material_list", request, ky)
+
+    @app.api_route("/report/report_list.jsp", methods=["GET", "POST"])
+    async def assignment_list(request: Request, ky: str = ""):
+        return html("assignment_list", request, ky)
+
+    @app.get("/lecture/course_info.jsp")
+    async def course_info(request: Request, ky: str = ""):
+        return html("syllabus", request, ky)
+
+    @app.get("/ilos/st/course/notice_view_form.acl")
+    async def notice_view(request: Request, ARTL_NUM: str = ""):
+        return html("notice_detail", request, article=ARTL_NUM)
+
+    @app.get("/ilos/st/course/lecture_material_view_form.acl")
+    async def material_view(request: Request, ARTL_NUM: str = ""):
+        return html("material_detail", request, article=ARTL_NUM)
+
+    @app.get("/ilos/st/course/report_view_form.acl")
+    async def assignment_view(request: Request, ARTL_NUM: str = ""):
+        return html("assignment_detail", request, article=ARTL_NUM)
+
+    @app.post("/ilos/co/efile_list.acl")
+    async def efile_list(request: Request):
+        form = await request.form()
+        return html("efile_list", request, article=form.get("CONTENT_SEQ", ""))
+
+    @app.get("/ilos/co/efile_download.acl")
+    async def efile_download(request: Request, FILE_SEQ: str = "0"):
+        if not logged_in(request):
+            return HTMLResponse(LOGIN_FORM)
+        body = (f"{FILE_SEQ}:".encode() * (config.file_kb * 1024 // (len(FILE_SEQ) + 1) + 1))[:config.file_kb * 1024]
+        return Response(
+            body,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="file_{FILE_SEQ}.bin"'}
+        )
+
+    @app.get("/_standin/stats")
+    async def standin_stats():
+        return {"config": asdict(config), "sessions": len(sessions), "requests": dict(stats)}
+
+    @app.post("/_standin/reset")
+    async def standin_reset():
+        stats.clear()
+        return {"reset": True}
+
+    return app
+
+
+def main() -> None:
+    defaults = StandinConfig()
+    parser = argparse.ArgumentParser(description="로컬 e-Class 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--courses", type=int, default=defaults.courses)
+    parser.add_argument("--notices", type=int, default=defaults.notices)
+    parser.add_argument("--materials", type=int, default=defaults.materials)
+    parser.add_argument("--assignments", type=int, default=defaults.assignments)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--file-kb", type=int, default=defaults.file_kb)
+    parser.add_argument("--password", default=None, help="지정하면 이 비밀번호만 로그인 허용")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = StandinConfig(
+        courses=args.courses, notices=args.notices, materials=args.materials,
+        assignments=args.assignments, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, file_kb=args.file_kb, password=args.password, seed=args.seed
+    )
+    print(f"e-Class 대역 서버: http://{args.host}:{args.port}  (ECLASS_BASE_URL로 지정하세요)")
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()